@@ -0,0 +1,202 @@
+###
+# Lastdaten: synthetische Bestellhistorien für Messungen
+#
+# Beschreibung:
+# Die ausgelieferten 'Bestelldaten_*.csv' enthalten nur Kopfzeilen. Dieses Skript erzeugt eine realistische Historie
+# im bestehenden CSV-Schema (Bestell_ID, Datum, Tischnummer, Speise_ID, Speise, Menge, Status), einstellbar über
+# - Anzahl der Tische und Gäste (Gedecke) pro Tag,
+# - Größe der Karte (Essen und Getränke; über die ausgelieferte Karte hinaus werden Speisen ergänzt),
+# - Stornoquote und Anzahl der Jahre.
+# Jedes Gedeck bestellt ein bis zwei Speisen und ein bis drei Getränke zu einer Uhrzeit innerhalb der Öffnungszeiten.
+# Zusätzlich werden offene bzw. gelieferte Bestellungen des aktuellen Tages erzeugt. Alle Zufallswerte kommen aus
+# einem festen Startwert, sodass dieselben Parameter dieselben Daten erzeugen.
+#
+# Aufruf aus dem Projektverzeichnis (schreibt die Dateien in das Zielverzeichnis, nicht nach './data'):
+#     python benchmarks/lastdaten.py ZIELVERZEICHNIS [--jahre 3] [--gedecke 150] [--tische 20] [--stornoquote 0.03]
+###
+
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+PROJEKT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJEKT)
+
+from bestelljournal import BESTELL_SPALTEN
+
+
+# Ausgelieferte Karten als Grundlage der synthetischen Karte
+SPEISEKARTE_PFAD: str = os.path.join(PROJEKT, 'data', 'Speisekarte.csv')
+GETRAENKEKARTE_PFAD: str = os.path.join(PROJEKT, 'data', 'Getränkekarte.csv')
+
+
+# Parameter einer synthetischen Historie mit ihren Standardwerten
+STANDARDPROFIL: dict[str, float | int] = {
+    'jahre': 1.0,           # Länge der Historie in Jahren
+    'gedecke': 50,          # Gäste pro Tag (Mittelwert)
+    'tische': 20,           # Anzahl der Tische
+    'speisen': 10,          # Speisen auf der Karte (1-99)
+    'getraenke': 10,        # Getränke auf der Karte
+    'stornoquote': 0.03,    # Anteil stornierter Positionen
+    'offene_tische': 5,     # Tische mit offenen Bestellungen am aktuellen Tag
+    'startwert': 1          # Startwert des Zufallsgenerators
+}
+
+
+def lastprofil(**parameter) -> dict[str, float | int]:
+    """Ergänzt die angegebenen Parameter um die Standardwerte (unbekannte Parameter ergeben einen KeyError)."""
+    unbekannt = set(parameter) - set(STANDARDPROFIL)
+    if unbekannt:
+        raise KeyError(f'Unbekannte Parameter: {sorted(unbekannt)}')
+    return {**STANDARDPROFIL, **parameter}
+
+
+def karten_erzeugen(profil: dict) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Erstellt Speise- und Getränkekarte mit der gewünschten Anzahl Einträge.
+
+    Die ausgelieferten Karten werden übernommen und bei Bedarf um Speisen mit fortlaufenden Speise_IDs
+    (Essen 1-99, Getränke ab 101) und zufälligen Preisen ergänzt bzw. gekürzt.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: Speise- und Getränkekarte mit 'Speise_ID' als Index.
+    """
+    if not 1 <= profil['speisen'] <= 99:
+        raise ValueError('Die Karte kann 1 bis 99 Speisen enthalten (Speise_ID 1-99)')
+    if profil['getraenke'] < 1:
+        raise ValueError('Die Karte muss mindestens ein Getränk enthalten')
+
+    rng = np.random.default_rng(profil['startwert'])
+    karten = []
+    for pfad, anzahl, erste_id, name, preise in ((SPEISEKARTE_PFAD, profil['speisen'], 1, 'Speise', (6.0, 28.0)),
+                                                 (GETRAENKEKARTE_PFAD, profil['getraenke'], 101, 'Getränk', (2.5, 9.0))):
+        karte = pd.read_csv(pfad, index_col='Speise_ID', dtype={'Speise_ID': int}).head(anzahl)
+        fehlend = anzahl - len(karte)
+        if fehlend > 0:
+            ids = np.arange(erste_id + len(karte), erste_id + anzahl)
+            ergaenzt = pd.DataFrame({
+                'Speise': [f'{name} {i}' for i in ids],
+                'Beschreibung': '',
+                'Preis': np.round(np.round(rng.uniform(*preise, fehlend), 1) - 0.05, 2)
+            }, index=pd.Index(ids, name='Speise_ID'))
+            karte = pd.concat([karte, ergaenzt])
+        karten.append(karte)
+    return karten[0], karten[1]
+
+
+def bestellungen_erzeugen(profil: dict, speisekarte: pd.DataFrame, getraenkekarte: pd.DataFrame,
+                          heute: pd.Timestamp | None = None) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Erzeugt die geschlossene Historie und die offenen Bestellungen des aktuellen Tages.
+
+    Die Funktion:
+    - Zieht je Tag die Anzahl der Gedecke (Poisson-verteilt um 'gedecke', am Wochenende 30 % mehr).
+    - Erzeugt je Gedeck Speisen und Getränke mit Tisch, Uhrzeit (11-23 Uhr) und Menge vektorisiert.
+    - Setzt den Status nach der Stornoquote auf 'storniert', sonst 'geschlossen'.
+    - Vergibt die Bestell_IDs aufsteigend nach Datum; die offenen Bestellungen schließen daran an.
+
+    Args:
+        profil (dict): Die Parameter (siehe STANDARDPROFIL).
+        speisekarte (pd.DataFrame): Speisekarte aus 'karten_erzeugen'.
+        getraenkekarte (pd.DataFrame): Getränkekarte aus 'karten_erzeugen'.
+        heute (pd.Timestamp | None): Letzter Tag der Historie (Standard: heute).
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: Geschlossene und offene Bestellungen mit den Spalten aus BESTELL_SPALTEN.
+    """
+    rng = np.random.default_rng(profil['startwert'])
+    heute = (heute or pd.Timestamp.now()).normalize()
+    tage = pd.date_range(end=heute - pd.Timedelta(days=1), periods=max(1, int(round(profil['jahre'] * 365))), freq='D')
+
+    # Gedecke je Tag und Tag/Tisch/Uhrzeit je Gedeck
+    faktor = np.where(tage.dayofweek >= 5, 1.3, 1.0)
+    gedecke_je_tag = rng.poisson(profil['gedecke'] * faktor)
+    gedeck_tag = np.repeat(tage.to_numpy(), gedecke_je_tag)
+    anzahl_gedecke = len(gedeck_tag)
+    gedeck_tisch = rng.integers(1, profil['tische'] + 1, anzahl_gedecke)
+    gedeck_zeit = gedeck_tag + pd.to_timedelta(rng.integers(11 * 3600, 23 * 3600, anzahl_gedecke), unit='s').to_numpy()
+
+    def positionen(karte: pd.DataFrame, minimum: int, maximum: int) -> pd.DataFrame:
+        je_gedeck = rng.integers(minimum, maximum + 1, anzahl_gedecke)
+        gedeck = np.repeat(np.arange(anzahl_gedecke), je_gedeck)
+        # Beliebte Speisen werden häufiger bestellt (Zipf-ähnliche Gewichtung)
+        gewichte = 1 / np.arange(1, len(karte) + 1)
+        auswahl = rng.choice(len(karte), size=len(gedeck), p=gewichte / gewichte.sum())
+        return pd.DataFrame({
+            'Datum': gedeck_zeit[gedeck] + pd.to_timedelta(rng.integers(0, 1800, len(gedeck)), unit='s').to_numpy(),
+            'Tischnummer': gedeck_tisch[gedeck],
+            'Speise_ID': karte.index.to_numpy()[auswahl],
+            'Speise': karte['Speise'].to_numpy()[auswahl],
+            'Menge': rng.choice([1, 1, 1, 2, 2, 3], size=len(gedeck))
+        })
+
+    geschlossen = pd.concat([positionen(speisekarte, 1, 2), positionen(getraenkekarte, 1, 3)], ignore_index=True)
+    geschlossen = geschlossen.sort_values('Datum', kind='stable', ignore_index=True)
+    geschlossen['Status'] = np.where(rng.random(len(geschlossen)) < profil['stornoquote'], 'storniert', 'geschlossen')
+    geschlossen.insert(0, 'Bestell_ID', np.arange(1, len(geschlossen) + 1))
+
+    # Offene Bestellungen des aktuellen Tages: je Tisch einige Positionen, ein Teil bereits geliefert
+    karte = pd.concat([speisekarte, getraenkekarte])
+    tische = rng.choice(np.arange(1, profil['tische'] + 1), size=min(profil['offene_tische'], profil['tische']), replace=False)
+    tisch_je_position = np.repeat(tische, rng.integers(2, 7, len(tische)))
+    auswahl = rng.integers(0, len(karte), len(tisch_je_position))
+    offen = pd.DataFrame({
+        'Bestell_ID': np.arange(len(geschlossen) + 1, len(geschlossen) + len(tisch_je_position) + 1),
+        'Datum': heute + pd.Timedelta(hours=12) + pd.to_timedelta(rng.integers(0, 3600, len(tisch_je_position)), unit='s'),
+        'Tischnummer': tisch_je_position,
+        'Speise_ID': karte.index.to_numpy()[auswahl],
+        'Speise': karte['Speise'].to_numpy()[auswahl],
+        'Menge': rng.integers(1, 4, len(tisch_je_position)),
+        'Status': np.where(rng.random(len(tisch_je_position)) < 0.5, 'geliefert', 'offen')
+    })
+    return geschlossen[BESTELL_SPALTEN], offen[BESTELL_SPALTEN]
+
+
+def lastdaten_schreiben(verzeichnis: str, profil: dict) -> dict:
+    """
+    Schreibt Karten und Bestelldaten eines Lastprofils (siehe STANDARDPROFIL) als CSV-Dateien in ein Datenverzeichnis.
+
+    Args:
+        verzeichnis (str): Zielverzeichnis (wird bei Bedarf angelegt), aufgebaut wie './data'.
+        profil (dict): Die Parameter (siehe STANDARDPROFIL).
+
+    Returns:
+        dict: Die Parameter und die Anzahl der erzeugten Zeilen.
+    """
+    os.makedirs(verzeichnis, exist_ok=True)
+    speisekarte, getraenkekarte = karten_erzeugen(profil)
+    geschlossen, offen = bestellungen_erzeugen(profil, speisekarte, getraenkekarte)
+
+    speisekarte.to_csv(os.path.join(verzeichnis, 'Speisekarte.csv'))
+    getraenkekarte.to_csv(os.path.join(verzeichnis, 'Getränkekarte.csv'))
+    for df, name in ((geschlossen, 'Bestelldaten_geschlossen.csv'), (offen, 'Bestelldaten_offen.csv')):
+        df.to_csv(os.path.join(verzeichnis, name), index=False, date_format='%Y-%m-%d %H:%M:%S')
+    return {**profil, 'geschlossen': len(geschlossen), 'offen': len(offen)}
+
+
+def main() -> None:
+    standard = STANDARDPROFIL
+    parser = argparse.ArgumentParser(description='Erzeugt eine synthetische Bestellhistorie im CSV-Schema der Restaurant-App')
+    parser.add_argument('verzeichnis', help='Zielverzeichnis der CSV-Dateien (aufgebaut wie ./data)')
+    parser.add_argument('--jahre', type=float, default=standard['jahre'], help='Länge der Historie in Jahren')
+    parser.add_argument('--gedecke', type=int, default=standard['gedecke'], help='Gäste pro Tag (Mittelwert)')
+    parser.add_argument('--tische', type=int, default=standard['tische'], help='Anzahl der Tische')
+    parser.add_argument('--speisen', type=int, default=standard['speisen'], help='Anzahl der Speisen auf der Karte (1-99)')
+    parser.add_argument('--getraenke', type=int, default=standard['getraenke'], help='Anzahl der Getränke auf der Karte')
+    parser.add_argument('--stornoquote', type=float, default=standard['stornoquote'], help='Anteil stornierter Positionen')
+    parser.add_argument('--offene-tische', type=int, default=standard['offene_tische'], help='Tische mit offenen Bestellungen')
+    parser.add_argument('--startwert', type=int, default=standard['startwert'], help='Startwert des Zufallsgenerators')
+    args = vars(parser.parse_args())
+
+    verzeichnis = args.pop('verzeichnis')
+    if os.path.abspath(verzeichnis) == os.path.join(PROJEKT, 'data'):
+        sys.exit('Die Lastdaten dürfen die Daten der Anwendung nicht überschreiben')
+    ergebnis = lastdaten_schreiben(verzeichnis, lastprofil(**args))
+    print(f'{ergebnis["geschlossen"]} geschlossene und {ergebnis["offen"]} offene Bestellungen nach {verzeichnis} geschrieben')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,227 @@
+###
+# Messreihe: Laufzeiten der Bestellabwicklung und des Finanzberichts je Datenmenge
+#
+# Beschreibung:
+# Erzeugt für jeden Maßstab (klein, mittel, groß) eine synthetische Historie mit 'lastdaten.py' in einem temporären
+# Verzeichnis und misst ohne Oberfläche:
+# - Öffnen der Bestellabwicklung und Laden der Historie,
+# - Aufgeben, Liefern, Stornieren und Abrechnen von Bestellungen (einzeln, je Tisch und positionsweise),
+# - Aufbau (aus dem DataFrame und blockweise aus dem Bestellspeicher) und Abfrage der Umsatzstatistik sowie das Erstellen
+#   des Finanzberichts.
+# Je Messung werden Median, 95. Perzentil, Minimum und Anzahl in Millisekunden ausgegeben und optional als JSON
+# gespeichert. Mit '--vergleich' wird gegen eine frühere JSON-Datei geprüft: Ist ein Median um mehr als die Toleranz
+# langsamer, endet das Skript mit Exit-Code 1 (z.B. als Prüfung vor einem Release).
+#
+# Aufruf aus dem Projektverzeichnis:
+#     python benchmarks/messreihe.py [--massstab klein mittel] [--anzahl 50] [--ausgabe messung.json]
+#     python benchmarks/messreihe.py --ausgabe neu.json --vergleich alt.json [--toleranz 0.2]
+###
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable
+
+# Diagramme ohne Anzeige rendern
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from lastdaten import PROJEKT, lastdaten_schreiben, lastprofil
+from bestellabwicklung import Bestellabwicklung
+from finanzbericht import finanzbericht_erstellen
+from umsatzstatistik import Umsatzstatistik, zeitraum_berechnen
+
+
+# Maßstäbe der Historie: Jahre und Gäste pro Tag
+MASSSTAEBE: dict[str, dict] = {
+    'klein': {'jahre': 1.0, 'gedecke': 50},
+    'mittel': {'jahre': 3.0, 'gedecke': 150},
+    'gross': {'jahre': 10.0, 'gedecke': 400}
+}
+
+# Tischnummern der Messungen liegen hinter den Tischen der Lastdaten
+ERSTER_TISCH: int = 1000
+
+
+def kennzahlen(dauer: list[float]) -> dict:
+    """
+    Fasst die Einzelmessungen einer Operation zusammen.
+
+    Args:
+        dauer (list[float]): Laufzeiten in Millisekunden.
+
+    Returns:
+        dict: Median, 95. Perzentil und Minimum in ms sowie die Anzahl der Messungen.
+    """
+    return {
+        'median_ms': round(float(np.median(dauer)), 3),
+        'p95_ms': round(float(np.percentile(dauer, 95)), 3),
+        'min_ms': round(min(dauer), 3),
+        'anzahl': len(dauer)
+    }
+
+
+def stoppen(funktion: Callable, *args):
+    """Führt 'funktion' aus und gibt die Laufzeit in ms und das Ergebnis zurück."""
+    start = time.perf_counter()
+    ergebnis = funktion(*args)
+    return (time.perf_counter() - start) * 1000, ergebnis
+
+
+def massstab_messen(verzeichnis: str, engine: str, anzahl: int, bericht_anzahl: int) -> dict[str, dict]:
+    """
+    Misst alle Operationen auf den Lastdaten in 'verzeichnis'.
+
+    Die Funktion:
+    - Öffnet die Abwicklung mehrfach und wartet jeweils auf die vollständig geladene Historie.
+    - Baut die Umsatzstatistik aus der Historie auf und meldet sie am Speicher an, sodass die Abrechnungen wie in
+      der Anwendung auch die Statistik fortschreiben. Zusätzlich wird der blockweise Aufbau aus dem Speicher gemessen.
+    - Misst je Wiederholung auf einem eigenen Tisch: Aufgeben, Liefern, Stornieren, alle Liefern, Tisch abrechnen
+      und positionsweise Abrechnung. Nicht gemessene Vorbereitungen (z.B. eine Bestellung zum Stornieren) laufen außerhalb der Zeitmessung.
+    - Misst die Summen der Statistik und den Finanzbericht für den aktuellen Monat und den gesamten Zeitraum.
+
+    Args:
+        verzeichnis (str): Datenverzeichnis mit den Lastdaten.
+        engine (str): Speicher-Engine ('csv' oder 'sqlite').
+        anzahl (int): Wiederholungen je Bestelloperation.
+        bericht_anzahl (int): Wiederholungen für Öffnen, Statistikaufbau und Finanzbericht.
+
+    Returns:
+        dict[str, dict]: Kennzahlen je Messung.
+    """
+    dauer: dict[str, list[float]] = {}
+
+    def erfassen(name: str, funktion: Callable, *args):
+        ms, ergebnis = stoppen(funktion, *args)
+        dauer.setdefault(name, []).append(ms)
+        return ergebnis
+
+    # Start: Öffnen und Laden der Historie
+    for _ in range(bericht_anzahl):
+        abwicklung = erfassen('oeffnen', Bestellabwicklung.oeffnen, engine, verzeichnis)
+        geschlossen = erfassen('historie_laden', abwicklung.speicher.geschlossene_bestellungen)
+
+    # Umsatzstatistik aufbauen (jeweils neue Datenbank), die letzte bleibt am Speicher angemeldet
+    for i in range(bericht_anzahl):
+        statistik = Umsatzstatistik(abwicklung.katalog, os.path.join(verzeichnis, f'Umsatzstatistik_{i}.db'))
+        erfassen('statistik_aufbauen', statistik.aufbauen, geschlossen)
+        if i < bericht_anzahl - 1:
+            statistik.schliessen()
+    abwicklung.speicher.beobachten(statistik)
+    for i in range(bericht_anzahl):
+        block_statistik = Umsatzstatistik(abwicklung.katalog, os.path.join(verzeichnis, f'Umsatzstatistik_bloecke_{i}.db'))
+        erfassen('statistik_streamen', block_statistik.aus_speicher_aufbauen, abwicklung.speicher)
+        block_statistik.schliessen()
+
+    # Bestelloperationen
+    essen_id = int(abwicklung.katalog.karte('essen').index[0])
+    getraenk_id = int(abwicklung.katalog.karte('getraenke').index[0])
+    for i in range(anzahl):
+        tisch = ERSTER_TISCH + i
+        bestellung = erfassen('bestellung_aufgeben', abwicklung.bestellung_aufgeben, tisch, {essen_id: 2, getraenk_id: 1})
+        erfassen('liefern', abwicklung.liefern, int(bestellung.index[0]))
+        storno = abwicklung.bestellung_aufgeben(tisch, {essen_id: 1})
+        erfassen('stornieren', abwicklung.stornieren, int(storno.index[0]))
+        erfassen('alle_liefern', abwicklung.alle_liefern, tisch)
+        erfassen('tisch_abrechnen', abwicklung.tisch_abrechnen, tisch)
+        teil = abwicklung.bestellung_aufgeben(tisch, {essen_id: 3})
+        erfassen('positionen_abrechnen', abwicklung.positionen_abrechnen, tisch, [(int(teil.index[0]), 2)])
+
+    # Statistik und Finanzbericht
+    for art in ('monat', 'gesamt'):
+        von, bis = zeitraum_berechnen(art)
+        for _ in range(anzahl):
+            summen_df = erfassen(f'summen_{art}', statistik.summen, None, von, bis)
+        if summen_df.empty:
+            continue
+        for _ in range(bericht_anzahl):
+            erfassen(f'finanzbericht_{art}', finanzbericht_erstellen, summen_df, von, bis, os.path.join(verzeichnis, 'Statistik'))
+    statistik.schliessen()
+
+    return {name: kennzahlen(werte) for name, werte in dauer.items()}
+
+
+def vergleichen(ergebnisse: dict, frueher: dict, toleranz: float) -> list[str]:
+    """
+    Vergleicht die Mediane mit einer früheren Messreihe.
+
+    Args:
+        ergebnisse (dict): Die aktuellen Ergebnisse je Maßstab.
+        frueher (dict): Die Ergebnisse einer früheren Messreihe (gleiches Format).
+        toleranz (float): Erlaubte Verlangsamung als Anteil (0.2 = 20 %).
+
+    Returns:
+        list[str]: Beschreibung jeder Messung, deren Median die Toleranz überschreitet.
+    """
+    verschlechtert: list[str] = []
+    for massstab, messungen in ergebnisse.items():
+        alt_messungen = frueher.get(massstab, {}).get('messungen', {})
+        for name, werte in messungen['messungen'].items():
+            alt = alt_messungen.get(name)
+            if alt is None or alt['median_ms'] <= 0:
+                continue
+            faktor = werte['median_ms'] / alt['median_ms']
+            if faktor > 1 + toleranz:
+                verschlechtert.append(f'{massstab}/{name}: {alt["median_ms"]:.2f} ms -> {werte["median_ms"]:.2f} ms ({faktor:.2f}x)')
+    return verschlechtert
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Messreihe der Bestellabwicklung und des Finanzberichts auf synthetischen Daten')
+    parser.add_argument('--massstab', nargs='+', choices=list(MASSSTAEBE), default=['klein', 'mittel'], help='Zu messende Maßstäbe')
+    parser.add_argument('--engine', choices=['csv', 'sqlite'], default='csv', help='Speicher-Engine')
+    parser.add_argument('--anzahl', type=int, default=50, help='Wiederholungen je Bestelloperation')
+    parser.add_argument('--bericht-anzahl', type=int, default=3, help='Wiederholungen für Öffnen, Statistikaufbau und Finanzbericht')
+    parser.add_argument('--ausgabe', help='JSON-Datei für die Ergebnisse')
+    parser.add_argument('--vergleich', help='JSON-Datei einer früheren Messreihe')
+    parser.add_argument('--toleranz', type=float, default=0.2, help='Erlaubte Verlangsamung des Medians beim Vergleich (0.2 = 20 %%)')
+    args = parser.parse_args()
+
+    ergebnisse: dict[str, dict] = {}
+    for massstab in args.massstab:
+        with tempfile.TemporaryDirectory(prefix=f'messreihe_{massstab}_') as verzeichnis:
+            daten = lastdaten_schreiben(verzeichnis, lastprofil(**MASSSTAEBE[massstab]))
+            messungen = massstab_messen(verzeichnis, args.engine, args.anzahl, args.bericht_anzahl)
+        ergebnisse[massstab] = {'lastdaten': daten, 'messungen': messungen}
+
+        print(f'\n{massstab}: {daten["geschlossen"]} geschlossene, {daten["offen"]} offene Bestellungen')
+        print(f'{"Messung":<24}{"Median ms":>12}{"p95 ms":>12}{"Min ms":>12}{"Anzahl":>8}')
+        for name, werte in messungen.items():
+            print(f'{name:<24}{werte["median_ms"]:12.2f}{werte["p95_ms"]:12.2f}{werte["min_ms"]:12.2f}{werte["anzahl"]:8d}')
+
+    if args.ausgabe:
+        with open(args.ausgabe, 'w', encoding='utf-8') as datei:
+            json.dump({
+                'metadaten': {
+                    'zeitpunkt': datetime.now().isoformat(timespec='seconds'),
+                    'python': platform.python_version(),
+                    'plattform': platform.platform(),
+                    'engine': args.engine,
+                    'projekt': PROJEKT
+                },
+                'ergebnisse': ergebnisse
+            }, datei, indent=2, ensure_ascii=False)
+        print(f'\nErgebnisse gespeichert: {args.ausgabe}')
+
+    if args.vergleich:
+        with open(args.vergleich, encoding='utf-8') as datei:
+            frueher = json.load(datei)['ergebnisse']
+        verschlechtert = vergleichen(ergebnisse, frueher, args.toleranz)
+        if verschlechtert:
+            print(f'\nLangsamer als {args.vergleich} (Toleranz {args.toleranz:.0%}):')
+            for zeile in verschlechtert:
+                print(f'  {zeile}')
+            sys.exit(1)
+        print(f'\nKeine Verschlechterung gegenüber {args.vergleich} (Toleranz {args.toleranz:.0%})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+###
+# Benchmark: PDF-Rechnung mit und ohne Rechnungsvorlage
+#
+# Beschreibung:
+# Vergleicht Renderzeit und Dateigröße einer Rechnung, wenn das Original-Logo (PNG mit Alphakanal) bei jeder Rechnung
+# von FPDF dekodiert und eingebettet wird, mit der zwischengespeicherten Rechnungsvorlage (Logo einmalig auf
+# Druckgröße verkleinert und als JPEG komprimiert).
+#
+# Aufruf aus dem Projektverzeichnis:
+#     python benchmarks/rechnung_pdf.py [--anzahl 10]
+###
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rechnungsdruck import Rechnungsvorlage, rechnung_pdf_erstellen
+
+
+# Beispielrechnung mit einigen Positionen
+RECHNUNG: dict = {
+    'Tischnummer': 7,
+    'Bestell_IDs': [101, 102, 103, 104],
+    'Speisen': {
+        'Vesperplatte': [2, 25.0],
+        'Spaghetti Carbonara': [1, 11.9],
+        'Cola': [3, 8.7],
+        'Apfelschorle': [2, 6.4]
+    }
+}
+
+
+def messen(vorlage: Rechnungsvorlage, anzahl: int, verzeichnis: str) -> tuple[float, float, int]:
+    """
+    Erstellt 'anzahl' Rechnungen mit der Vorlage.
+
+    Returns:
+        tuple[float, float, int]: Median und Minimum der Renderzeit in ms sowie die Dateigröße in Bytes.
+    """
+    dauer: list[float] = []
+    pfad = os.path.join(verzeichnis, 'rechnung.pdf')
+    for _ in range(anzahl):
+        start = time.perf_counter()
+        rechnung_pdf_erstellen(RECHNUNG, pfad, vorlage=vorlage)
+        dauer.append((time.perf_counter() - start) * 1000)
+    return statistics.median(dauer), min(dauer), os.path.getsize(pfad)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark der PDF-Rechnung mit und ohne Rechnungsvorlage')
+    parser.add_argument('--anzahl', type=int, default=10, help='Anzahl der Rechnungen je Variante')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    vorlage = Rechnungsvorlage()
+    vorbereitung = (time.perf_counter() - start) * 1000
+
+    with tempfile.TemporaryDirectory() as verzeichnis:
+        ohne = messen(Rechnungsvorlage(dpi=None), args.anzahl, verzeichnis)
+        mit = messen(vorlage, args.anzahl, verzeichnis)
+
+    print(f'Rechnungen je Variante: {args.anzahl}')
+    print(f'Vorbereitung der Vorlage (einmalig): {vorbereitung:8.1f} ms')
+    print(f'{"Variante":<16}{"Median ms":>12}{"Min ms":>12}{"Größe KB":>12}')
+    for name, (median, minimum, groesse) in (('Original-Logo', ohne), ('Vorlage', mit)):
+        print(f'{name:<16}{median:12.1f}{minimum:12.1f}{groesse / 1024:12.1f}')
+    print(f'Faktor Renderzeit: {ohne[0] / mit[0]:.1f}x, Faktor Dateigröße: {ohne[2] / mit[2]:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+###
+# Berichtsauftrag der Restaurant-App
+#
+# Beschreibung:
+# Erstellt den Finanzbericht als Hintergrundauftrag, sodass die Oberfläche während Auswertung, Diagrammen und PDF
+# bedienbar bleibt (z.B. für Bestellungen, während der Monatsbericht entsteht). Der Auftrag läuft in einem eigenen
+# Thread und liest dort auch die Summen aus der Umsatzstatistik (bzw. wartet auf deren Aufbau); die Stufen des Berichts werden dort nur vermerkt. Über 'after' fragt der Tk-Hauptthread regelmäßig den
+# Stand ab (siehe 'hintergrundauftrag'), zeigt den Fortschritt an und öffnet den fertigen Bericht im Webbrowser.
+# Ein laufender Bericht kann abgebrochen werden; es läuft immer höchstens ein Bericht gleichzeitig.
+###
+
+import threading
+import tkinter as tk
+import webbrowser
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from datetime import date
+from tkinter import messagebox
+from typing import Callable
+
+import pandas as pd
+
+from finanzbericht import STUFEN, BerichtAbgebrochen, finanzbericht_erstellen
+from hintergrundauftrag import Hintergrundauftrag
+
+
+class KeineDaten(Exception):
+    """Im Zeitraum des Berichts liegen keine Summen vor."""
+
+
+def bericht_erstellen(abfrage: Callable[[], pd.DataFrame], von: date | None, bis: date | None, verzeichnis: str,
+                      fortschritt: Callable[[str], object], abbruch: threading.Event) -> str:
+    """
+    Liest die Summen je Speise und erstellt daraus den Finanzbericht (läuft im Worker-Thread).
+
+    Args:
+        abfrage (Callable[[], pd.DataFrame]): Liefert die Summen je Speise (z.B. 'Umsatzstatistik.summen' für den Zeitraum).
+        von (date | None): Erster Tag des Zeitraums (einschließlich), None für unbegrenzt.
+        bis (date | None): Letzter Tag des Zeitraums (einschließlich), None für unbegrenzt.
+        verzeichnis (str): Verzeichnis für Diagramme und Bericht.
+        fortschritt (Callable[[str], object]): Wird mit jeder Stufe des Berichts aufgerufen.
+        abbruch (threading.Event): Bricht den Bericht vor der nächsten Stufe ab.
+
+    Returns:
+        str: Pfad des fertigen Berichts.
+
+    Raises:
+        KeineDaten: Wenn die Abfrage keine Summen liefert.
+        BerichtAbgebrochen: Wenn der Bericht abgebrochen wurde.
+    """
+    summen_df = abfrage()
+    if summen_df.empty:
+        raise KeineDaten()
+    return finanzbericht_erstellen(summen_df, von, bis, verzeichnis, fortschritt=fortschritt, abbruch=abbruch)
+
+
+class Berichtsauftrag(Hintergrundauftrag):
+    """
+    Finanzbericht im Hintergrund mit Fortschrittsanzeige und Abbruch, ausgeliefert über 'after' im Tk-Hauptthread.
+    """
+
+    def __init__(self, widget: tk.Misc, anzeigen: Callable[[str], object] | None = None, executor: Executor | None = None,
+                 intervall_ms: int = 100, oeffnen: Callable[[str], object] = webbrowser.open_new) -> None:
+        """
+        Args:
+            widget (tk.Misc): Beliebiges Tk-Widget, über dessen 'after' der Stand abgefragt wird.
+            anzeigen (Callable[[str], object] | None): Wird im Hauptthread mit jeder neuen Statusmeldung aufgerufen.
+            executor (Executor | None): Worker für den Bericht (Standard: ThreadPoolExecutor mit einem Thread).
+            intervall_ms (int): Abstand der Abfragen in Millisekunden, solange ein Bericht läuft.
+            oeffnen (Callable[[str], object]): Wird im Hauptthread mit dem Pfad des fertigen Berichts aufgerufen.
+        """
+        super().__init__(widget, executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix='finanzbericht'),
+                         intervall_ms, oeffnen)
+        self.anzeigen = anzeigen
+        self._abbruch = threading.Event()
+        # Zuletzt gemeldete Stufe (vom Worker geschrieben, im Hauptthread gelesen) und zuletzt angezeigte Meldung
+        self._stufe: str | None = None
+        self._angezeigt: str | None = None
+
+    @property
+    def auftrag(self) -> Future | None:
+        """Der laufende Bericht, None, wenn kein Bericht erstellt wird."""
+        return self.auftraege[0][1] if self.auftraege else None
+
+    def starten(self, abfrage: Callable[[], pd.DataFrame], von: date | None, bis: date | None,
+                verzeichnis: str = './Statistik') -> bool:
+        """
+        Übergibt einen Bericht an den Worker und kehrt sofort zurück.
+
+        Args:
+            abfrage (Callable[[], pd.DataFrame]): Liefert im Worker die Summen je Speise (siehe 'Umsatzstatistik.summen').
+            von (date | None): Erster Tag des Zeitraums (einschließlich), None für unbegrenzt.
+            bis (date | None): Letzter Tag des Zeitraums (einschließlich), None für unbegrenzt.
+            verzeichnis (str): Verzeichnis für Diagramme und Bericht.
+
+        Returns:
+            bool: False, wenn bereits ein Bericht läuft (es wird kein weiterer gestartet).
+        """
+        if self.laeuft:
+            return False
+        self._abbruch = threading.Event()
+        self._stufe = None
+        self._melden('Daten werden geladen...')
+        self._einreichen(None, bericht_erstellen, abfrage, von, bis, verzeichnis,
+                         fortschritt=self._fortschritt, abbruch=self._abbruch)
+        return True
+
+    def abbrechen(self) -> None:
+        """Bricht den laufenden Bericht bei der nächsten Gelegenheit ab (vor der nächsten Stufe bzw. beim Warten auf Diagramme)."""
+        if self.laeuft:
+            self._abbruch.set()
+            self._melden('Wird abgebrochen...')
+
+    def beenden(self) -> None:
+        """Bricht einen laufenden Bericht ab und beendet den Worker, sobald der Bericht den Abbruch bemerkt (beim Programmende)."""
+        self.abbrechen()
+        super().beenden(abbrechen=True)
+
+    def _fortschritt(self, stufe: str) -> None:
+        """Vermerkt die aktuelle Stufe (läuft im Worker-Thread, daher keine Tk-Aufrufe)."""
+        self._stufe = stufe
+
+    def _melden(self, text: str) -> None:
+        """Zeigt eine Statusmeldung an, sofern sie sich geändert hat."""
+        if text != self._angezeigt:
+            self._angezeigt = text
+            if self.anzeigen is not None:
+                self.anzeigen(text)
+
+    def _laufend(self) -> None:
+        """Zeigt die aktuelle Stufe des laufenden Berichts an."""
+        if self._stufe is not None and not self._abbruch.is_set():
+            nummer = STUFEN.index(self._stufe) + 1
+            self._melden(f'{self._stufe} ({nummer}/{len(STUFEN)})...')
+
+    def _ausliefern(self, kontext: None, auftrag: Future) -> None:
+        """Öffnet den fertigen Bericht im Hauptthread bzw. meldet Abbruch oder Fehler."""
+        try:
+            pfad = auftrag.result()
+        except BerichtAbgebrochen:
+            self._melden('Bericht abgebrochen')
+        except KeineDaten:
+            self._melden('Keine Daten zur Auswertung vorhanden')
+            messagebox.showinfo('Achtung', 'Keine Daten zur Auswertung vorhanden')
+        except Exception as fehler:
+            self._melden('Fehler beim Erstellen des Berichts')
+            messagebox.showerror('Fehler', f'Der Finanzbericht konnte nicht erstellt werden:\n{fehler}')
+        else:
+            self._melden('Bericht fertig')
+            self.oeffnen(pfad)
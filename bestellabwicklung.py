@@ -0,0 +1,273 @@
+###
+# Bestellabwicklung der Restaurant-App
+#
+# Beschreibung:
+# GUI-freie Abwicklung aller Bestellvorgänge: Bestellung aufgeben, Menge ändern, liefern, alles liefern, stornieren
+# sowie Tisch- und Positionsrechnungen. Die Abwicklung prüft die Eingaben, arbeitet ausschließlich über den
+# Bestellspeicher, den Speisekatalog und die Rechnungsvorbereitung und meldet ungültige Aktionen als Bestellfehler
+# mit dem Text für die Oberfläche. Die Tk-Bildschirme lesen nur noch ihre Eingabefelder, rufen die Abwicklung auf und
+# zeigen Ergebnis bzw. Fehler an. Damit lassen sich die Vorgänge ohne Anzeige ausführen, messen (benchmarks/) und
+# von weiteren Oberflächen (z.B. mehreren Kassenterminals) nutzen.
+###
+
+import os
+
+import pandas as pd
+
+from bestellspeicher import Bestellspeicher, speicher_oeffnen
+from rechnungsvorbereitung import Rechnungsvorbereitung
+from speisekatalog import Speisekatalog
+
+
+# Bezeichnung der Kategorien in Meldungen
+KATEGORIE_BEZEICHNUNGEN: dict[str, str] = {
+    'essen': 'Essens',
+    'getraenke': 'Getränke'
+}
+
+
+class Bestellfehler(ValueError):
+    """Ungültige Eingabe oder nicht ausführbare Aktion; der Text wird in der Oberfläche als Meldung angezeigt."""
+
+
+def zahl_lesen(eingabe: str | int, bezeichnung: str) -> int:
+    """
+    Wandelt eine Eingabe (z.B. aus einem Eingabefeld) in eine ganze Zahl um.
+
+    Args:
+        eingabe (str | int): Die Eingabe.
+        bezeichnung (str): Bezeichnung des Feldes für die Fehlermeldung (z.B. 'Bestell_ID').
+
+    Raises:
+        Bestellfehler: Wenn die Eingabe keine ganze Zahl ist.
+
+    Returns:
+        int: Die Zahl.
+    """
+    try:
+        return int(str(eingabe).strip())
+    except ValueError:
+        raise Bestellfehler(f'Fehlerhafte Eingabe -> {bezeichnung}') from None
+
+
+def positionen_lesen(eingabe: str) -> list[tuple[int, int]]:
+    """
+    Liest Positionen im Format 'Bestell_ID, Menge, Bestell_ID, Menge, ...' (Eingabe der Positionsrechnung).
+
+    Raises:
+        Bestellfehler: Bei ungerader Anzahl von Werten oder nicht-numerischen Werten.
+
+    Returns:
+        list[tuple[int, int]]: Liste aus (Bestell_ID, Menge).
+    """
+    werte = eingabe.split(',')
+    if len(werte) % 2 != 0:
+        raise Bestellfehler('Bestell_ID, Menge -> Eingabe nicht korrekt')
+    bestell_ids = [zahl_lesen(wert, 'Bestell_ID') for wert in werte[0::2]]
+    mengen = [zahl_lesen(wert, 'Menge') for wert in werte[1::2]]
+    return list(zip(bestell_ids, mengen))
+
+
+class Bestellabwicklung():
+    """
+    Bestellvorgänge und Abrechnung ohne Oberfläche.
+
+    Die Rechnungen werden als Dictionary im Format von 'rechnung_pdf_erstellen' zurückgegeben
+    ({'Bestell_IDs': [...], 'Tischnummer': int, 'Speisen': {Speise: [Menge, Preis]}}); das Drucken übernimmt der Aufrufer.
+    """
+
+    def __init__(self, speicher: Bestellspeicher, katalog: Speisekatalog, rechnungsvorbereitung: Rechnungsvorbereitung | None = None) -> None:
+        """
+        Args:
+            speicher (Bestellspeicher): Der Bestellspeicher.
+            katalog (Speisekatalog): Katalog für Bezeichnungen, Kategorien und Preise.
+            rechnungsvorbereitung (Rechnungsvorbereitung | None): Bereits am Speicher angemeldete Rechnungsvorbereitung,
+                None legt eine neue an.
+        """
+        self.speicher = speicher
+        self.katalog = katalog
+        self.rechnungsvorbereitung = rechnungsvorbereitung or Rechnungsvorbereitung(speicher, katalog)
+        # Karte je Kategorie für das Aufgeben von Bestellungen
+        self._karten: dict[str, pd.DataFrame] = {}
+
+    @classmethod
+    def oeffnen(cls, engine: str = 'csv', verzeichnis: str = './data') -> 'Bestellabwicklung':
+        """
+        Öffnet Bestellspeicher und Speisekatalog auf den Dateien im angegebenen Verzeichnis.
+
+        Args:
+            engine (str): Speicher-Engine ('csv' oder 'sqlite').
+            verzeichnis (str): Datenverzeichnis mit den Bestelldaten und Karten.
+
+        Returns:
+            Bestellabwicklung: Die Abwicklung mit neuer Rechnungsvorbereitung.
+        """
+        katalog = Speisekatalog.laden(os.path.join(verzeichnis, 'Speisekarte.csv'), os.path.join(verzeichnis, 'Getränkekarte.csv'))
+        return cls(speicher_oeffnen(engine, verzeichnis), katalog)
+
+    # Bestellungen
+    def bestellung_aufgeben(self, tischnummer: int, mengen: dict[int, str | int], kategorie: str | None = None) -> pd.DataFrame:
+        """
+        Legt alle Positionen einer Tischbestellung an.
+
+        Args:
+            tischnummer (int): Die Tischnummer.
+            mengen (dict[int, str | int]): Speise_ID -> Menge (leere Eingaben zählen als 0).
+            kategorie (str | None): 'essen' oder 'getraenke', um nur Speise_IDs dieser Kategorie zuzulassen.
+
+        Raises:
+            Bestellfehler: Bei ungültiger Tischnummer, nicht-numerischen Mengen oder unbekannten Speise_IDs.
+
+        Returns:
+            pd.DataFrame: Die angelegten Bestellungen (leer, wenn keine Menge > 0 angegeben wurde).
+        """
+        tischnummer = self._tischnummer(tischnummer)
+        karte = self._karten.get(kategorie)
+        if karte is None:
+            karte = self._karten[kategorie] = self.katalog.karte(kategorie)
+        try:
+            return self.speicher.bestellung_aufgeben(tischnummer, mengen, karte)
+        except ValueError as fehler:
+            raise Bestellfehler(str(fehler)) from None
+
+    def menge_aendern(self, bestell_id: int, menge: int) -> None:
+        """
+        Ändert die Menge einer offenen Bestellung.
+
+        Raises:
+            Bestellfehler: Bei unbekannter Bestell_ID oder einer Menge kleiner 1.
+        """
+        self._offene_bestellung(bestell_id)
+        if menge <= 0:
+            raise Bestellfehler('Menge darf nicht 0 sein...\nZum Stornieren Storno wählen!')
+        self.speicher.menge_aendern(bestell_id, menge)
+
+    def liefern(self, bestell_id: int) -> None:
+        """
+        Setzt eine Bestellung auf 'geliefert'.
+
+        Raises:
+            Bestellfehler: Bei unbekannter Bestell_ID.
+        """
+        self._offene_bestellung(bestell_id)
+        self.speicher.liefern([bestell_id])
+
+    def alle_liefern(self, tischnummer: int, kategorie: str | None = None) -> pd.DataFrame:
+        """
+        Setzt alle offenen Bestellungen eines Tisches (optional nur einer Kategorie) auf 'geliefert'.
+
+        Raises:
+            Bestellfehler: Wenn der Tisch keine offenen Bestellungen hat.
+
+        Returns:
+            pd.DataFrame: Die gelieferten Bestellungen (Stand vor der Lieferung).
+        """
+        tischnummer = self._tischnummer(tischnummer)
+        offen = self.speicher.bestellungen(status='offen', tischnummer=tischnummer, kategorie=kategorie)
+        if offen.empty:
+            art = f'{KATEGORIE_BEZEICHNUNGEN[kategorie]}-' if kategorie else ''
+            raise Bestellfehler(f'Keine offenen {art}Bestellungen für Tischnummer: {tischnummer}')
+        self.speicher.liefern(list(offen.index))
+        return offen
+
+    def stornieren(self, bestell_id: int) -> None:
+        """
+        Storniert eine offene Bestellung und übernimmt sie in die geschlossenen Bestellungen.
+
+        Raises:
+            Bestellfehler: Bei unbekannter Bestell_ID.
+        """
+        self._offene_bestellung(bestell_id)
+        self.speicher.stornieren(bestell_id)
+
+    # Abrechnung
+    def tisch_abrechnen(self, tischnummer: int) -> dict:
+        """
+        Rechnet alle gelieferten Positionen eines Tisches ab und schließt die Bestellungen.
+
+        Raises:
+            Bestellfehler: Wenn für den Tisch keine Rechnungsposten vorhanden sind.
+
+        Returns:
+            dict: Die Rechnung mit allen Bestell_IDs und den nach Speise zusammengefassten Mengen und Preisen.
+        """
+        tischnummer = self._tischnummer(tischnummer)
+        posten = self.rechnungsvorbereitung.posten(tischnummer)
+        if posten.empty:
+            raise Bestellfehler(f'Für Tischnummer: {tischnummer} sind keine offenen Rechnungsposten vorhanden...')
+
+        summen = posten.groupby('Speise')[['Menge', 'Preis']].sum()
+        rechnung = {
+            'Bestell_IDs': posten.index.tolist(),
+            'Tischnummer': tischnummer,
+            'Speisen': {speise: [int(menge), float(preis)] for speise, menge, preis in zip(summen.index, summen['Menge'], summen['Preis'])}
+        }
+        self.speicher.schliessen(list(zip(posten.index, posten['Menge'])))
+        return rechnung
+
+    def positionen_abrechnen(self, tischnummer: int, positionen: list[tuple[int, int]]) -> dict:
+        """
+        Rechnet einzelne Positionen ab (Teilmengen möglich) und reduziert bzw. schließt die Bestellungen.
+
+        Die Funktion:
+        - Prüft alle Positionen vorab: Bestell_ID vorhanden, Menge mindestens 1 und höchstens die offene Menge
+          (mehrfach genannte Bestell_IDs werden zusammengezählt).
+        - Bestimmt Bezeichnungen und Preise mit einem Zugriff auf den Speisekatalog und fasst gleiche Speisen zusammen.
+        - Schließt die abgerechneten Mengen in einem Schritt.
+
+        Args:
+            tischnummer (int): Die Tischnummer für die Rechnung.
+            positionen (list[tuple[int, int]]): Liste aus (Bestell_ID, abgerechnete Menge).
+
+        Raises:
+            Bestellfehler: Bei leeren Positionen, unbekannten Bestell_IDs oder ungültigen Mengen.
+
+        Returns:
+            dict: Die Rechnung der abgerechneten Positionen.
+        """
+        tischnummer = self._tischnummer(tischnummer)
+        if not positionen:
+            raise Bestellfehler('Bestell_ID, Menge -> Eingabe nicht korrekt')
+
+        abrechnung = pd.DataFrame(positionen, columns=['Bestell_ID', 'Menge']).astype(int)
+        if (abrechnung['Menge'] <= 0).any():
+            raise Bestellfehler('Fehlerhafte Mengenangabe...\nMengen müssen größer als 0 sein!')
+        offene_mengen = {}
+        for bestell_id in abrechnung['Bestell_ID'].unique():
+            offene_mengen[bestell_id] = int(self._offene_bestellung(int(bestell_id))['Menge'])
+        gesamt = abrechnung.groupby('Bestell_ID')['Menge'].sum()
+        if (gesamt > pd.Series(offene_mengen)[gesamt.index]).any():
+            raise Bestellfehler('Fehlerhafte Mengenangabe...\nMengen dürfen 0 nicht unterschreiten!')
+
+        # Bezeichnungen und Preise der im Katalog bekannten Speisen
+        speise_ids = [int(self.speicher.bestellung(int(bestell_id))['Speise_ID']) for bestell_id in abrechnung['Bestell_ID']]
+        bekannt = self.katalog.enthalten(speise_ids)
+        ids = pd.Series(speise_ids)[bekannt].to_numpy()
+        mengen = abrechnung['Menge'].to_numpy()[bekannt]
+        speisen = pd.DataFrame({
+            'Speise': self.katalog.namen_fuer(ids),
+            'Menge': mengen,
+            'Preis': self.katalog.preise_fuer(ids) * mengen
+        }).groupby('Speise', sort=False)[['Menge', 'Preis']].sum()
+
+        rechnung = {
+            'Bestell_IDs': abrechnung['Bestell_ID'].tolist(),
+            'Tischnummer': tischnummer,
+            'Speisen': {speise: [int(menge), float(preis)] for speise, menge, preis in zip(speisen.index, speisen['Menge'], speisen['Preis'])}
+        }
+        self.speicher.schliessen(list(zip(abrechnung['Bestell_ID'].tolist(), abrechnung['Menge'].tolist())))
+        return rechnung
+
+    # Prüfungen
+    def _offene_bestellung(self, bestell_id: int) -> pd.Series:
+        """Gibt die offene Bestellung zurück bzw. wirft einen Bestellfehler, wenn die Bestell_ID nicht vorhanden ist."""
+        if not self.speicher.enthaelt(bestell_id):
+            raise Bestellfehler(f'Bestell_ID: {bestell_id} nicht gefunden...')
+        return self.speicher.bestellung(bestell_id)
+
+    @staticmethod
+    def _tischnummer(tischnummer: int) -> int:
+        """Prüft die Tischnummer (ganze Zahl größer 0)."""
+        if int(tischnummer) < 1:
+            raise Bestellfehler(f'Ungültige Tischnummer: {tischnummer}')
+        return int(tischnummer)
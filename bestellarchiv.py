@@ -0,0 +1,303 @@
+###
+# Archiv der geschlossenen Bestellungen
+#
+# Beschreibung:
+# Die geschlossenen Bestellungen werden monatsweise in kompakten, spaltenorientierten Binärdateien
+# './data/Archiv/Bestellungen_JJJJ-MM.npz' abgelegt, statt in einer stetig wachsenden 'Bestelldaten_geschlossen.csv'.
+# Jede Spalte ist ein typisiertes NumPy-Array (int32 für IDs und Mengen, int16 für Tischnummern, int64 Nanosekunden
+# für das Datum, Speise und Status als kategorische Codes mit Kategorienliste). Beim Sichern werden nur die Monate
+# neu geschrieben, die sich geändert haben; beim Laden werden nur die Monate des angefragten Zeitraums gelesen.
+# Die bisherige CSV-Datei bleibt als Importformat erhalten und wird beim ersten Start blockweise übernommen.
+# Jede Partition vermerkt die letzte Journal-Seq, deren Abschlüsse sie enthält. Bricht das Sichern nach dem Schreiben
+# der Partitionen, aber vor dem Snapshot der offenen Bestellungen ab, übernimmt das erneute Abspielen des Journals
+# diese Abschlüsse nicht ein zweites Mal. Der erste Import wird in einem temporären Verzeichnis geschrieben und erst
+# vollständig umbenannt, sodass ein abgebrochener Import kein unvollständiges Archiv hinterlässt.
+# Je Bestell_ID und Status gibt es eine Zeile: Weitere Teilabrechnungen einer Bestellung werden beim Zusammenführen
+# neuer Zeilen auf die vorhandene abgerechnete Zeile aufaddiert, eine Stornierung des Rests erhält eine eigene Zeile.
+###
+
+import os
+import re
+import shutil
+from datetime import date
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from bestelljournal import BESTELL_SPALTEN, leere_bestellungen
+
+
+# Dateiname einer Monatspartition
+PARTITION_MUSTER = re.compile(r'Bestellungen_(\d{4}-\d{2})\.npz')
+
+
+def monat_von(datum: pd.Series) -> pd.Series:
+    """
+    Ermittelt den Partitionsschlüssel (JJJJ-MM) je Datum.
+
+    Args:
+        datum (pd.Series): Datumsspalte als datetime64.
+
+    Returns:
+        pd.Series: Die Monate als Strings 'JJJJ-MM'.
+    """
+    return datum.dt.strftime('%Y-%m')
+
+
+def monatsgrenzen(monat: str) -> tuple[pd.Timestamp, pd.Timestamp]:
+    """
+    Gibt Beginn (einschließlich) und Ende (ausschließlich) eines Monats 'JJJJ-MM' zurück.
+    """
+    beginn = pd.Timestamp(f'{monat}-01')
+    return beginn, beginn + pd.offsets.MonthBegin(1)
+
+
+def zeitraum_filtern(bestellungen: pd.DataFrame, von: date | None = None, bis: date | None = None) -> pd.DataFrame:
+    """
+    Begrenzt Bestellungen auf einen Zeitraum des Bestelldatums.
+
+    Args:
+        bestellungen (pd.DataFrame): Bestellungen mit der Spalte 'Datum' (datetime64).
+        von (date | None): Erster Tag (einschließlich), None für unbegrenzt.
+        bis (date | None): Letzter Tag (einschließlich), None für unbegrenzt.
+
+    Returns:
+        pd.DataFrame: Die Bestellungen im Zeitraum.
+    """
+    if von is not None:
+        bestellungen = bestellungen[bestellungen['Datum'] >= pd.Timestamp(von)]
+    if bis is not None:
+        bestellungen = bestellungen[bestellungen['Datum'] < pd.Timestamp(bis) + pd.Timedelta(days=1)]
+    return bestellungen
+
+
+def monate_auswaehlen(bestellungen: pd.DataFrame, monate: Iterable[str]) -> pd.DataFrame:
+    """
+    Wählt die Bestellungen der angegebenen Monate aus (über Zeitstempelgrenzen statt Formatierung aller Zeilen).
+
+    Args:
+        bestellungen (pd.DataFrame): Bestellungen mit der Spalte 'Datum' (datetime64).
+        monate (Iterable[str]): Monate 'JJJJ-MM'.
+
+    Returns:
+        pd.DataFrame: Die Bestellungen dieser Monate.
+    """
+    datum = bestellungen['Datum'].to_numpy()
+    auswahl = np.zeros(len(bestellungen), dtype=bool)
+    for monat in set(monate):
+        beginn, ende = monatsgrenzen(monat)
+        auswahl |= (datum >= beginn.to_datetime64()) & (datum < ende.to_datetime64())
+    return bestellungen[auswahl]
+
+
+def geschlossen_zusammenfuehren(basis: pd.DataFrame, neu: pd.DataFrame) -> pd.DataFrame:
+    """
+    Führt neue geschlossene Zeilen mit bestehenden zusammen, sodass es je Bestell_ID und Status eine Zeile gibt.
+
+    Die Funktion:
+    - Fasst mehrfach vorkommende Schlüssel in 'neu' zusammen (Mengen aufaddiert, sonst die erste Zeile).
+    - Addiert die Mengen von Schlüsseln, die in 'basis' bereits vorhanden sind, auf die vorhandene Zeile auf
+      (z.B. eine weitere Teilabrechnung einer schon archivierten Bestellung).
+    - Hängt alle übrigen Zeilen an.
+
+    Args:
+        basis (pd.DataFrame): Bisherige geschlossene Bestellungen ('Bestell_ID' als Index).
+        neu (pd.DataFrame): Hinzugekommene geschlossene Bestellungen in zeitlicher Reihenfolge.
+
+    Returns:
+        pd.DataFrame: Die zusammengeführten Bestellungen (bei Überschneidungen eine neue Kopie).
+    """
+    if neu.empty:
+        return basis
+    schluessel_neu = pd.MultiIndex.from_arrays([neu.index, neu['Status'].to_numpy()])
+    if schluessel_neu.has_duplicates:
+        erste = ~schluessel_neu.duplicated()
+        mengen = neu['Menge'].groupby([neu.index, neu['Status'].to_numpy()], sort=False).sum()
+        neu = neu[erste].copy()
+        neu['Menge'] = mengen.to_numpy()
+        schluessel_neu = schluessel_neu[erste]
+    if basis.empty:
+        return neu
+
+    # Nur Zeilen der Basis mit einer der neuen Bestell_IDs kommen als Treffer in Frage
+    kandidaten = np.flatnonzero(basis.index.isin(neu.index))
+    if len(kandidaten) > 0:
+        schluessel_basis = pd.MultiIndex.from_arrays([basis.index[kandidaten], basis['Status'].to_numpy()[kandidaten]])
+        position = schluessel_neu.get_indexer(schluessel_basis)
+        treffer = position >= 0
+        if treffer.any():
+            uebrig = np.ones(len(neu), dtype=bool)
+            uebrig[position[treffer]] = False
+            ergebnis = pd.concat([basis, neu[uebrig]]) if uebrig.any() else basis.copy()
+            zeilen, spalte = kandidaten[treffer], ergebnis.columns.get_loc('Menge')
+            ergebnis.iloc[zeilen, spalte] = ergebnis.iloc[zeilen, spalte].to_numpy() + neu['Menge'].to_numpy()[position[treffer]]
+            return ergebnis
+    return pd.concat([basis, neu])
+
+
+class Bestellarchiv():
+    """
+    Monatsweise partitioniertes, spaltenorientiertes Archiv der geschlossenen Bestellungen.
+    """
+
+    def __init__(self, verzeichnis: str) -> None:
+        """
+        Args:
+            verzeichnis (str): Verzeichnis der Monatspartitionen (wird bei Bedarf angelegt).
+        """
+        self.verzeichnis = verzeichnis
+
+    def vorhanden(self) -> bool:
+        """Gibt zurück, ob das Archiv bereits angelegt wurde (auch wenn es noch keine Partition enthält)."""
+        return os.path.isdir(self.verzeichnis)
+
+    def monate(self) -> list[str]:
+        """Gibt die vorhandenen Monatspartitionen ('JJJJ-MM') aufsteigend sortiert zurück."""
+        if not self.vorhanden():
+            return []
+        return sorted(treffer.group(1) for treffer in map(PARTITION_MUSTER.fullmatch, os.listdir(self.verzeichnis)) if treffer)
+
+    def _pfad(self, monat: str) -> str:
+        return os.path.join(self.verzeichnis, f'Bestellungen_{monat}.npz')
+
+    def seq(self, monat: str) -> int:
+        """
+        Gibt die Journal-Seq zurück, bis zu der die Abschlüsse eines Monats in der Partition enthalten sind.
+
+        Returns:
+            int: Die Seq (0 ohne Partition bzw. bei Partitionen ohne vermerkte Seq, z.B. aus dem Import).
+        """
+        try:
+            with np.load(self._pfad(monat), allow_pickle=False) as daten:
+                return int(daten['Seq']) if 'Seq' in daten.files else 0
+        except OSError:
+            return 0
+
+    def hoechste_bestell_id(self) -> int:
+        """Ermittelt die höchste archivierte Bestell_ID; gelesen wird je Partition nur die Spalte 'Bestell_ID'."""
+        hoechste = 0
+        for monat in self.monate():
+            with np.load(self._pfad(monat), allow_pickle=False) as daten:
+                bestell_ids = daten['Bestell_ID']
+                if bestell_ids.size:
+                    hoechste = max(hoechste, int(bestell_ids.max()))
+        return hoechste
+
+    # Lesen
+    def laden(self, von: date | None = None, bis: date | None = None) -> pd.DataFrame:
+        """
+        Lädt die geschlossenen Bestellungen eines Zeitraums.
+
+        Die Funktion:
+        - Wählt anhand der Dateinamen nur die Monatspartitionen aus, die den Zeitraum überschneiden.
+        - Liest je Partition die typisierten Spalten und wandelt die Kategorien zurück in Strings.
+        - Filtert in den Randmonaten auf die Tage des Zeitraums.
+
+        Args:
+            von (date | None): Erster Tag (einschließlich), None für unbegrenzt.
+            bis (date | None): Letzter Tag (einschließlich), None für unbegrenzt.
+
+        Returns:
+            pd.DataFrame: Bestellungen mit 'Bestell_ID' als Index (Spalten wie 'Bestelldaten_geschlossen.csv').
+        """
+        monate = [
+            monat for monat in self.monate()
+            if (von is None or monat >= von.strftime('%Y-%m')) and (bis is None or monat <= bis.strftime('%Y-%m'))
+        ]
+        return zeitraum_filtern(self.monate_laden(monate), von, bis)
+
+    def monate_laden(self, monate: Iterable[str]) -> pd.DataFrame:
+        """
+        Lädt die geschlossenen Bestellungen einzelner Monate (z.B. der seit dem letzten Sichern geänderten).
+
+        Args:
+            monate (Iterable[str]): Monate 'JJJJ-MM'; Monate ohne Partition werden übersprungen.
+
+        Returns:
+            pd.DataFrame: Bestellungen mit 'Bestell_ID' als Index.
+        """
+        teile = [self._partition_lesen(monat) for monat in sorted(set(monate)) if os.path.isfile(self._pfad(monat))]
+        if not teile:
+            return leere_bestellungen()
+        return pd.concat(teile) if len(teile) > 1 else teile[0]
+
+    def _partition_lesen(self, monat: str) -> pd.DataFrame:
+        """Liest eine Monatspartition in ein Bestell-DataFrame."""
+        with np.load(self._pfad(monat), allow_pickle=False) as daten:
+            df = pd.DataFrame({
+                'Bestell_ID': daten['Bestell_ID'].astype(np.int64),
+                'Datum': daten['Datum'].view('datetime64[ns]'),
+                'Tischnummer': daten['Tischnummer'].astype(np.int64),
+                'Speise_ID': daten['Speise_ID'].astype(np.int64),
+                'Speise': daten['Speise_Kategorien'][daten['Speise']].astype(object),
+                'Menge': daten['Menge'].astype(np.int64),
+                'Status': daten['Status_Kategorien'][daten['Status']].astype(object)
+            })
+        return df.set_index('Bestell_ID')
+
+    # Schreiben
+    def schreiben(self, bestellungen: pd.DataFrame, monate: Iterable[str] | None = None, seq: int = 0) -> None:
+        """
+        Schreibt Monatspartitionen aus den geschlossenen Bestellungen.
+
+        Args:
+            bestellungen (pd.DataFrame): Die geschlossenen Bestellungen ('Bestell_ID' als Index), mindestens alle Zeilen der Monate.
+            monate (Iterable[str] | None): Nur diese Monate schreiben (z.B. die seit dem letzten Sichern geänderten), None für alle.
+            seq (int): Letzte Journal-Seq, deren Abschlüsse in den Zeilen enthalten sind.
+        """
+        os.makedirs(self.verzeichnis, exist_ok=True)
+        if bestellungen.empty:
+            return
+        if monate is None:
+            monate = monat_von(bestellungen['Datum']).unique()
+        for monat in sorted(set(monate)):
+            teil = monate_auswaehlen(bestellungen, [monat])
+            if not teil.empty:
+                self._partition_schreiben(monat, teil, seq)
+
+    def _partition_schreiben(self, monat: str, df: pd.DataFrame, seq: int) -> None:
+        """Schreibt eine Monatspartition atomar über eine temporäre Datei."""
+        speise = pd.Categorical(df['Speise'].astype(str))
+        status = pd.Categorical(df['Status'].astype(str))
+        spalten = {
+            'Bestell_ID': df.index.to_numpy(dtype=np.int32),
+            'Datum': df['Datum'].to_numpy(dtype='datetime64[ns]').view(np.int64),
+            'Tischnummer': df['Tischnummer'].to_numpy(dtype=np.int16),
+            'Speise_ID': df['Speise_ID'].to_numpy(dtype=np.int32),
+            'Speise': speise.codes.astype(np.int16),
+            'Speise_Kategorien': np.asarray(speise.categories, dtype=str),
+            'Menge': df['Menge'].to_numpy(dtype=np.int32),
+            'Status': status.codes.astype(np.int8),
+            'Status_Kategorien': np.asarray(status.categories, dtype=str),
+            'Seq': np.int64(seq)
+        }
+        pfad = self._pfad(monat)
+        temp_pfad = f'{pfad}.tmp'
+        with open(temp_pfad, 'wb') as datei:
+            np.savez_compressed(datei, **spalten)
+        os.replace(temp_pfad, pfad)
+
+    def importieren(self, bloecke: Iterable[pd.DataFrame]) -> None:
+        """
+        Legt das Archiv aus vorhandenen geschlossenen Bestellungen an (z.B. aus 'Bestelldaten_geschlossen.csv').
+
+        Die Funktion:
+        - Übernimmt die Bestellungen blockweise (siehe 'bestellungen_bloecke'), sodass nie die komplette Datei im Speicher liegt.
+        - Ergänzt je Block die Partitionen der betroffenen Monate; bei einer zeitlich sortierten Datei sind das meist
+          nur ein oder zwei Monate.
+        - Schreibt die Partitionen in ein temporäres Verzeichnis, das erst nach dem letzten Block umbenannt wird.
+
+        Args:
+            bloecke (Iterable[pd.DataFrame]): Die geschlossenen Bestellungen in Blöcken mit den Spalten aus BESTELL_SPALTEN.
+        """
+        temp_verzeichnis = f'{self.verzeichnis}.import'
+        shutil.rmtree(temp_verzeichnis, ignore_errors=True)
+        temp_archiv = Bestellarchiv(temp_verzeichnis)
+        os.makedirs(temp_verzeichnis)
+        for block in bloecke:
+            block = block[BESTELL_SPALTEN[1:]]
+            monate = monat_von(block['Datum']).unique()
+            vorhanden = temp_archiv.monate_laden(monate)
+            temp_archiv.schreiben(block if vorhanden.empty else pd.concat([vorhanden, block]), monate)
+        os.rename(temp_verzeichnis, self.verzeichnis)
@@ -0,0 +1,135 @@
+###
+# Sekundärindizes der offenen Bestellungen
+#
+# Beschreibung:
+# Hält für die offenen Bestellungen die Zuordnungen Tischnummer -> Bestell_IDs, Status -> Bestell_IDs und
+# Kategorie -> Bestell_IDs im Speicher. Die Indizes werden bei jeder Änderung (anlegen, liefern, stornieren,
+# abrechnen) nachgeführt, sodass eine Tischansicht nur die Bestellungen dieses Tisches anfasst
+# statt alle offenen Bestellungen mit Boolean-Masken zu durchsuchen.
+###
+
+from typing import Iterable
+
+import pandas as pd
+
+
+# Kategorien der Speise_IDs: Essen < 100, Getränke > 99
+KATEGORIEN: dict[str, tuple[int, int]] = {
+    'essen': (0, 99),
+    'getraenke': (100, 10**9)
+}
+
+
+def kategorie_von(speise_id: int) -> str:
+    """
+    Ermittelt die Kategorie einer Speise_ID.
+
+    Args:
+        speise_id (int): Die Speise_ID.
+
+    Returns:
+        str: 'essen' oder 'getraenke'.
+    """
+    for kategorie, (von, bis) in KATEGORIEN.items():
+        if von <= speise_id <= bis:
+            return kategorie
+    raise ValueError(f'Speise_ID ohne Kategorie: {speise_id}')
+
+
+class Bestellindex():
+    """
+    Inkrementell gepflegte Sekundärindizes (Tisch, Status, Kategorie) über die Bestell_IDs der offenen Bestellungen.
+    """
+
+    def __init__(self) -> None:
+        self.tische: dict[int, set[int]] = {}
+        self.status: dict[str, set[int]] = {}
+        self.kategorien: dict[str, set[int]] = {kategorie: set() for kategorie in KATEGORIEN}
+        # Je Bestell_ID die indizierten Werte, damit Einträge ohne Zugriff auf das DataFrame entfernt werden können
+        self._eintraege: dict[int, tuple[int, str, str]] = {}
+
+    def aufbauen(self, bestellungen: pd.DataFrame) -> None:
+        """
+        Baut alle Indizes aus einem Bestell-DataFrame ('Bestell_ID' als Index) neu auf.
+
+        Args:
+            bestellungen (pd.DataFrame): Die offenen Bestellungen.
+        """
+        self.__init__()
+        self.hinzufuegen(bestellungen)
+
+    def hinzufuegen(self, bestellungen: pd.DataFrame) -> None:
+        """
+        Nimmt neue Bestellungen in die Indizes auf.
+
+        Args:
+            bestellungen (pd.DataFrame): Neue Bestellungen mit 'Bestell_ID' als Index.
+        """
+        for bestell_id, tischnummer, status, speise_id in zip(
+                bestellungen.index, bestellungen['Tischnummer'], bestellungen['Status'], bestellungen['Speise_ID']):
+            bestell_id, tischnummer, kategorie = int(bestell_id), int(tischnummer), kategorie_von(int(speise_id))
+            self._eintraege[bestell_id] = (tischnummer, status, kategorie)
+            self.tische.setdefault(tischnummer, set()).add(bestell_id)
+            self.status.setdefault(status, set()).add(bestell_id)
+            self.kategorien[kategorie].add(bestell_id)
+
+    def status_setzen(self, bestell_ids: Iterable[int], status: str) -> None:
+        """
+        Verschiebt Bestellungen in den Index eines anderen Status.
+
+        Args:
+            bestell_ids (Iterable[int]): Die betroffenen Bestell_IDs.
+            status (str): Der neue Status.
+        """
+        for bestell_id in bestell_ids:
+            bestell_id = int(bestell_id)
+            tischnummer, alter_status, kategorie = self._eintraege[bestell_id]
+            self.status[alter_status].discard(bestell_id)
+            self.status.setdefault(status, set()).add(bestell_id)
+            self._eintraege[bestell_id] = (tischnummer, status, kategorie)
+
+    def entfernen(self, bestell_id: int) -> None:
+        """
+        Entfernt eine Bestellung aus allen Indizes (z.B. nach Stornierung oder vollständiger Abrechnung).
+
+        Args:
+            bestell_id (int): Die zu entfernende Bestell_ID.
+        """
+        bestell_id = int(bestell_id)
+        tischnummer, status, kategorie = self._eintraege.pop(bestell_id)
+        self.tische[tischnummer].discard(bestell_id)
+        if not self.tische[tischnummer]:
+            del self.tische[tischnummer]
+        self.status[status].discard(bestell_id)
+        self.kategorien[kategorie].discard(bestell_id)
+
+    def bestell_ids(self, status: str | None = None, tischnummer: int | None = None, kategorie: str | None = None) -> list[int]:
+        """
+        Ermittelt die Bestell_IDs, die allen angegebenen Kriterien entsprechen.
+
+        Die Funktion:
+        - Sammelt die Mengen der angegebenen Kriterien.
+        - Beginnt mit der kleinsten Menge und prüft die übrigen Kriterien nur für deren Einträge,
+          sodass eine Tischabfrage in O(Bestellungen des Tisches) läuft.
+
+        Args:
+            status (str | None): Nur Bestellungen mit diesem Status.
+            tischnummer (int | None): Nur Bestellungen dieses Tisches.
+            kategorie (str | None): 'essen' oder 'getraenke'.
+
+        Returns:
+            list[int]: Die passenden Bestell_IDs in aufsteigender Reihenfolge.
+        """
+        mengen: list[set[int]] = []
+        if status is not None:
+            mengen.append(self.status.get(status, set()))
+        if tischnummer is not None:
+            mengen.append(self.tische.get(int(tischnummer), set()))
+        if kategorie is not None:
+            mengen.append(self.kategorien[kategorie])
+        if not mengen:
+            return sorted(self._eintraege)
+
+        mengen.sort(key=len)
+        kleinste, *weitere = mengen
+        return sorted(i for i in kleinste if all(i in menge for menge in weitere))
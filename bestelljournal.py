@@ -0,0 +1,297 @@
+###
+# Bestelljournal der Restaurant-App
+#
+# Beschreibung:
+# Jede Änderung an den Bestellungen (angelegt, Menge geändert, geliefert, storniert, geschlossen) wird als
+# einzelne Zeile an das Journal './data/Bestelljournal.csv' angehängt, statt nach jedem Klick die kompletten
+# Dateien 'Bestelldaten_offen.csv' und 'Bestelldaten_geschlossen.csv' neu zu schreiben.
+# Beim Start werden die CSV-Snapshots geladen und das Journal darauf abgespielt (siehe CsvSpeicher in bestellspeicher.py).
+# In regelmäßigen Abständen (und beim Beenden) wird das Journal in die Snapshots kompaktiert und danach geleert.
+# Der neue Snapshot der offenen Bestellungen wird zuerst als 'Bestelldaten_offen.csv.<Seq>.tmp' geschrieben, dann der
+# Stand (letzte übernommene Seq) und erst danach wird der Snapshot an seinen Platz umbenannt. Der Snapshot bleibt so
+# eine normale CSV-Datei und gehört immer zum Stand: Findet der nächste Start noch eine temporäre Datei, wird sie
+# übernommen, wenn der Stand bereits ihre Seq trägt, und sonst verworfen.
+###
+
+import csv
+import glob
+import os
+from typing import Iterator
+
+import pandas as pd
+
+
+# Spalten der Bestelldaten und des Journals
+BESTELL_SPALTEN: list[str] = ['Bestell_ID', 'Datum', 'Tischnummer', 'Speise_ID', 'Speise', 'Menge', 'Status']
+JOURNAL_SPALTEN: list[str] = ['Seq', 'Ereignis', 'Bestell_ID', 'Datum', 'Tischnummer', 'Speise_ID', 'Speise', 'Menge']
+
+# Feste Datentypen beim Lesen der Bestell-CSV-Dateien (das Datum wird anschließend in einem Schritt geparst)
+CSV_TYPEN: dict[str, type] = {'Bestell_ID': int, 'Datum': str, 'Tischnummer': int, 'Speise_ID': int, 'Speise': str, 'Menge': int,
+                              'Status': str}
+
+
+def leere_bestellungen() -> pd.DataFrame:
+    """
+    Erstellt ein leeres Bestell-DataFrame mit den erforderlichen Spalten und 'Bestell_ID' als Index.
+
+    Returns:
+        pd.DataFrame: Leeres DataFrame (Bestell-ID, Datum, Tischnummer, Speise-ID, Speise, Menge, Status).
+    """
+    df = pd.DataFrame({spalte: [] for spalte in BESTELL_SPALTEN}).set_index('Bestell_ID')
+    df['Datum'] = df['Datum'].astype('datetime64[ns]')
+    return df
+
+
+def bestellungen_laden(pfad: str) -> pd.DataFrame:
+    """
+    Lädt Bestelldaten aus einer CSV-Datei. Falls die Datei nicht vorhanden oder fehlerhaft ist,
+    wird ein leeres DataFrame mit den erforderlichen Spalten zurückgegeben.
+
+    Args:
+        pfad (str): Pfad zur CSV-Datei.
+
+    Returns:
+        pd.DataFrame: Bestelldaten mit 'Bestell_ID' als Index.
+    """
+    try:
+        df = pd.read_csv(pfad, dtype=CSV_TYPEN)
+    except Exception:
+        return leere_bestellungen()
+    df['Datum'] = datum_parsen(df['Datum'])
+    return df.set_index('Bestell_ID')
+
+
+def bestellungen_bloecke(pfad: str, zeilen: int) -> Iterator[pd.DataFrame]:
+    """
+    Liest Bestelldaten einer CSV-Datei in Blöcken von höchstens 'zeilen' Zeilen, ohne die ganze Datei zu laden
+    (z.B. die geschlossenen Bestellungen beim Import ins Archiv). Eine fehlende Datei liefert keine Blöcke.
+
+    Args:
+        pfad (str): Pfad zur CSV-Datei.
+        zeilen (int): Maximale Anzahl Zeilen je Block.
+
+    Yields:
+        pd.DataFrame: Bestelldaten eines Blocks mit 'Bestell_ID' als Index.
+    """
+    if not os.path.isfile(pfad):
+        return
+    with pd.read_csv(pfad, dtype=CSV_TYPEN, chunksize=zeilen) as leser:
+        for block in leser:
+            block['Datum'] = datum_parsen(block['Datum'])
+            yield block.set_index('Bestell_ID')
+
+
+def datum_parsen(datum: pd.Series) -> pd.Series:
+    """
+    Wandelt eine Datumsspalte einmalig in datetime64 um, damit Anzeigen und Auswertungen nicht jede Zeile erneut parsen.
+
+    Args:
+        datum (pd.Series): Datumswerte als ISO-Strings oder Zeitstempel.
+
+    Returns:
+        pd.Series: Die Datumsspalte als datetime64.
+    """
+    return pd.to_datetime(datum, format='ISO8601')
+
+
+def csv_atomar_schreiben(df: pd.DataFrame, pfad: str) -> None:
+    """
+    Schreibt ein DataFrame über eine temporäre Datei, damit bei einem Absturz nie eine halbe CSV zurückbleibt.
+
+    Args:
+        df (pd.DataFrame): Das zu schreibende DataFrame.
+        pfad (str): Zielpfad der CSV-Datei.
+    """
+    temp_pfad = f'{pfad}.tmp'
+    df.to_csv(temp_pfad)
+    os.replace(temp_pfad, pfad)
+
+
+class Bestelljournal():
+    """
+    Append-only Journal der Bestell-Ereignisse mit periodischer Kompaktierung in die CSV-Snapshots.
+
+    Ereignisse:
+    - 'angelegt':    Neue Bestellung (komplette Zeile).
+    - 'menge':       Menge einer offenen Bestellung wurde geändert.
+    - 'geliefert':   Bestellung wurde geliefert.
+    - 'storniert':   Bestellung wurde storniert und in die geschlossenen Bestellungen verschoben.
+    - 'geschlossen': 'Menge' Einheiten einer Bestellung wurden abgerechnet und in die geschlossenen Bestellungen übernommen.
+    """
+
+    def __init__(self, offen_pfad: str, geschlossen_pfad: str, journal_pfad: str, kompaktierung_ab: int = 500) -> None:
+        """
+        Args:
+            offen_pfad (str): Snapshot der offenen Bestellungen.
+            geschlossen_pfad (str): Snapshot der geschlossenen Bestellungen.
+            journal_pfad (str): Pfad des Journals.
+            kompaktierung_ab (int): Anzahl Journal-Einträge, ab der kompaktiert wird.
+        """
+        self.offen_pfad = offen_pfad
+        self.geschlossen_pfad = geschlossen_pfad
+        self.journal_pfad = journal_pfad
+        # Im Stand wird die letzte bereits in die Snapshots übernommene Seq festgehalten
+        self.stand_pfad = f'{os.path.splitext(journal_pfad)[0]}_stand.txt'
+        self.kompaktierung_ab = kompaktierung_ab
+        self.seq = 0
+        self.eintraege = 0
+        self._datei = None
+
+    # Lesen des Snapshots und der noch nicht kompaktierten Journal-Einträge
+    def offen_laden(self) -> pd.DataFrame:
+        """
+        Lädt den Snapshot der offenen Bestellungen, nachdem eine abgebrochene Kompaktierung abgeschlossen bzw. verworfen wurde.
+
+        Returns:
+            pd.DataFrame: Die offenen Bestellungen mit 'Bestell_ID' als Index.
+        """
+        stand = self._stand_lesen()
+        for temp_pfad in glob.glob(f'{glob.escape(self.offen_pfad)}.*.tmp'):
+            seq = temp_pfad[len(self.offen_pfad) + 1:-len('.tmp')]
+            if seq.isdigit() and int(seq) == stand:
+                # Der Stand wurde schon geschrieben, nur das Umbenennen fehlt noch
+                os.replace(temp_pfad, self.offen_pfad)
+            else:
+                os.remove(temp_pfad)
+        return bestellungen_laden(self.offen_pfad)
+
+    def ereignisse(self) -> Iterator[dict]:
+        """
+        Liefert alle Journal-Einträge, die noch nicht in die CSV-Snapshots übernommen wurden.
+
+        Die Funktion:
+        - Liest den Stand der letzten Kompaktierung (die letzte im Snapshot enthaltene Seq).
+        - Überspringt alle Einträge mit einer Seq bis einschließlich dieses Stands.
+        - Setzt die laufende Seq und die Anzahl der Einträge für die folgenden Anhänge.
+
+        Yields:
+            dict: Journal-Zeile mit den Schlüsseln aus JOURNAL_SPALTEN (als Strings).
+        """
+        stand = self._stand_lesen()
+        self.seq = stand
+        self.eintraege = 0
+
+        if not os.path.isfile(self.journal_pfad):
+            return
+
+        with open(self.journal_pfad, newline='', encoding='utf-8') as datei:
+            for zeile in csv.DictReader(datei):
+                seq = int(zeile['Seq'])
+                self.seq = max(self.seq, seq)
+                if seq <= stand:
+                    continue
+                self.eintraege += 1
+                yield zeile
+
+    # Anhängen eines Ereignisses an das Journal
+    def _anhaengen(self, zeilen: list[list]) -> None:
+        """
+        Hängt eine oder mehrere Journal-Zeilen an und schreibt sie sofort auf die Platte.
+
+        Args:
+            zeilen (list[list]): Zeilen ohne Seq in der Reihenfolge von JOURNAL_SPALTEN[1:].
+        """
+        if self._datei is None:
+            neu = not os.path.isfile(self.journal_pfad) or os.path.getsize(self.journal_pfad) == 0
+            self._datei = open(self.journal_pfad, 'a', newline='', encoding='utf-8')
+            self._writer = csv.writer(self._datei)
+            if neu:
+                self._writer.writerow(JOURNAL_SPALTEN)
+
+        for zeile in zeilen:
+            self.seq += 1
+            self._writer.writerow([self.seq] + zeile)
+        self.eintraege += len(zeilen)
+
+        self._datei.flush()
+        os.fsync(self._datei.fileno())
+
+    def angelegt(self, bestellungen: pd.DataFrame) -> None:
+        """
+        Protokolliert neue Bestellungen.
+
+        Args:
+            bestellungen (pd.DataFrame): Neue Bestellungen mit 'Bestell_ID' als Index.
+        """
+        self._anhaengen([
+            ['angelegt', int(bestell_id), pd.Timestamp(datum).isoformat(), int(tischnummer), int(speise_id), speise, int(menge)]
+            for bestell_id, datum, tischnummer, speise_id, speise, menge in zip(
+                bestellungen.index, bestellungen['Datum'], bestellungen['Tischnummer'],
+                bestellungen['Speise_ID'], bestellungen['Speise'], bestellungen['Menge'])
+        ])
+
+    def menge_geaendert(self, bestell_id: int, menge: int) -> None:
+        """Protokolliert eine geänderte Menge."""
+        self._anhaengen([['menge', int(bestell_id), '', '', '', '', int(menge)]])
+
+    def geliefert(self, bestell_ids: list[int]) -> None:
+        """Protokolliert eine oder mehrere gelieferte Bestellungen."""
+        self._anhaengen([['geliefert', int(i), '', '', '', '', ''] for i in bestell_ids])
+
+    def storniert(self, bestell_id: int) -> None:
+        """Protokolliert eine Stornierung."""
+        self._anhaengen([['storniert', int(bestell_id), '', '', '', '', '']])
+
+    def geschlossen(self, positionen: list[tuple[int, int]]) -> None:
+        """
+        Protokolliert abgerechnete Positionen.
+
+        Args:
+            positionen (list[tuple[int, int]]): Liste aus (Bestell_ID, abgerechnete Menge).
+        """
+        self._anhaengen([['geschlossen', int(i), '', '', '', '', int(menge)] for i, menge in positionen])
+
+    # Kompaktierung des Journals in die CSV-Snapshots
+    def kompaktierung_faellig(self) -> bool:
+        """Gibt zurück, ob das Journal die Kompaktierungsgrenze erreicht hat."""
+        return self.eintraege >= self.kompaktierung_ab
+
+    def kompaktieren(self, offen_df: pd.DataFrame, geschlossen_df: pd.DataFrame | None = None) -> None:
+        """
+        Schreibt die aktuellen Bestelldaten als Snapshots und leert anschließend das Journal.
+
+        Die Funktion:
+        - Schreibt den Snapshot der geschlossenen Bestellungen atomar, sofern er übergeben wird (die CSV-Engine
+          sichert diese vorher in das monatsweise Bestellarchiv).
+        - Schreibt den Snapshot der offenen Bestellungen in eine temporäre Datei mit der Seq im Namen, danach den Stand
+          und benennt erst dann den Snapshot um (siehe 'offen_laden'), damit Snapshot und Stand immer zusammenpassen.
+        - Leert das Journal.
+
+        Args:
+            offen_df (pd.DataFrame): Aktuelle offene Bestellungen.
+            geschlossen_df (pd.DataFrame | None): Aktuelle geschlossene Bestellungen.
+        """
+        if geschlossen_df is not None:
+            csv_atomar_schreiben(geschlossen_df, self.geschlossen_pfad)
+        snapshot_pfad = f'{self.offen_pfad}.{self.seq}.tmp'
+        with open(snapshot_pfad, 'w', newline='', encoding='utf-8') as datei:
+            offen_df.to_csv(datei)
+            datei.flush()
+            os.fsync(datei.fileno())
+
+        temp_pfad = f'{self.stand_pfad}.tmp'
+        with open(temp_pfad, 'w', encoding='utf-8') as datei:
+            datei.write(str(self.seq))
+            datei.flush()
+            os.fsync(datei.fileno())
+        os.replace(temp_pfad, self.stand_pfad)
+        os.replace(snapshot_pfad, self.offen_pfad)
+
+        self.schliessen()
+        with open(self.journal_pfad, 'w', newline='', encoding='utf-8') as datei:
+            csv.writer(datei).writerow(JOURNAL_SPALTEN)
+        self.eintraege = 0
+
+    def schliessen(self) -> None:
+        """Schließt die geöffnete Journal-Datei."""
+        if self._datei is not None:
+            self._datei.close()
+            self._datei = None
+
+    def _stand_lesen(self) -> int:
+        """Liest die zuletzt kompaktierte Seq (0, falls noch nie kompaktiert wurde)."""
+        try:
+            with open(self.stand_pfad, encoding='utf-8') as datei:
+                return int(datei.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
@@ -0,0 +1,211 @@
+###
+# Bestellliste der Restaurant-App
+#
+# Beschreibung:
+# Wiederverwendbares Tabellen-Widget für Bestellungen und Rechnungsübersichten auf Basis eines ttk.Treeview.
+# Statt bei jeder Aktualisierung ein neues Treeview zu erzeugen und zeilenweise mit iterrows() zu befüllen,
+# hält die Bestellliste die Anzeigedaten als DataFrame und
+# - erzeugt nur die Zeilen, die im sichtbaren Bereich liegen (eigene Scrollbar verschiebt das Fenster),
+# - wendet Änderungen als Diff an (einfügen, aktualisieren, löschen je Schlüssel, z.B. Bestell_ID),
+# - berechnet die Spaltenbreiten aus den vektorisierten Stringlängen des DataFrames und der Überschriften.
+###
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Hashable, Iterable
+
+import pandas as pd
+
+
+# Standard-Formatierung der Spalten für die Anzeige
+def datum_formatieren(datum: pd.Series) -> pd.Series:
+    """Formatiert eine Datumsspalte (datetime64, beim Laden geparst) als 'TT.MM.JJJJ HH:MM'."""
+    if not pd.api.types.is_datetime64_any_dtype(datum):
+        datum = pd.to_datetime(datum, format='ISO8601')
+    return datum.dt.strftime('%d.%m.%Y %H:%M')
+
+
+FORMATIERUNG: dict[str, Callable[[pd.Series], pd.Series]] = {
+    'Datum': datum_formatieren
+}
+
+
+class Bestellliste():
+    """
+    Virtualisierte, inkrementell aktualisierte Tabellenansicht eines DataFrames.
+
+    Der Index des DataFrames (z.B. 'Bestell_ID' oder 'Tischnummer') ist der Schlüssel jeder Zeile und wird als erste Spalte angezeigt.
+    """
+
+    def __init__(self, master: tk.Misc, style: str | None = None, zeichenbreite: int = 10) -> None:
+        """
+        Args:
+            master (tk.Misc): Übergeordnetes Widget.
+            style (str | None): Optionaler ttk-Style des Treeviews (z.B. 'Custom.Treeview').
+            zeichenbreite (int): Pixel pro Zeichen bei der Berechnung der Spaltenbreiten.
+        """
+        self.style = style or 'Treeview'
+        self.zeichenbreite = zeichenbreite
+
+        self.rahmen = tk.Frame(master)
+        self.tree = ttk.Treeview(self.rahmen, show='headings', style=self.style)
+        self.scrollbar = ttk.Scrollbar(self.rahmen, orient='vertical', command=self._scrollen)
+        self.scrollbar.pack(side='right', fill='y')
+        self.tree.pack(side='left', fill='both', expand=True)
+
+        # Anzeigedaten (alle Zeilen als Strings) und der aktuell erzeugte Ausschnitt
+        self.daten = pd.DataFrame()
+        self._spalten: list[str] = []
+        self._start = 0
+        self._sichtbare_zeilen = 20
+        self._angezeigt: dict[str, tuple] = {}
+        # Bereits formatierte Werte je Spalte und Schlüssel (z.B. Datum je Bestell_ID), die sich nicht mehr ändern
+        self._formatiert: dict[str, pd.Series] = {}
+
+        self.tree.bind('<Configure>', self._groesse_geaendert)
+        self.tree.bind('<MouseWheel>', self._mausrad)
+        self.tree.bind('<Button-4>', lambda event: self._verschieben(-3))
+        self.tree.bind('<Button-5>', lambda event: self._verschieben(3))
+
+    # Platzierung im übergeordneten Widget
+    def place(self, **kwargs) -> None:
+        """Platziert die Bestellliste (Parameter wie tk.Widget.place)."""
+        self.rahmen.place(**kwargs)
+        self.rahmen.lift()
+
+    def place_forget(self) -> None:
+        """Blendet die Bestellliste aus, ohne sie zu zerstören (wird beim nächsten 'place' wieder angezeigt)."""
+        self.rahmen.place_forget()
+
+    def destroy(self) -> None:
+        """Zerstört die Bestellliste mit Treeview und Scrollbar."""
+        self.rahmen.destroy()
+
+    # Öffentliche Änderungen der Anzeige
+    def anzeigen(self, df: pd.DataFrame) -> None:
+        """
+        Zeigt ein DataFrame an. Es werden nur die Zeilen im Treeview geändert, die sich gegenüber der bisherigen Anzeige unterscheiden.
+
+        Die Funktion:
+        - Wandelt alle Spalten vektorisiert in Anzeigestrings um.
+        - Setzt Spaltenüberschriften und -breiten neu, wenn sich die Spalten geändert haben, sonst nur die Breiten.
+        - Aktualisiert den sichtbaren Ausschnitt per Diff.
+
+        Args:
+            df (pd.DataFrame): Die anzuzeigenden Daten, der Index ist der Zeilenschlüssel.
+        """
+        self.daten = self._anzeigedaten(df)
+        # Zwischenspeicher auf die angezeigten Schlüssel begrenzen
+        self._formatiert = {spalte: werte[werte.index.isin(self.daten.index)] for spalte, werte in self._formatiert.items()}
+        self._spalten_setzen()
+        self._darstellen()
+
+    def entfernen(self, schluessel: Iterable[Hashable]) -> None:
+        """
+        Entfernt Zeilen anhand ihres Schlüssels (z.B. gelieferte oder stornierte Bestell_IDs).
+
+        Args:
+            schluessel (Iterable[Hashable]): Die zu entfernenden Schlüssel.
+        """
+        self.daten = self.daten.drop(index=list(schluessel), errors='ignore')
+        self._darstellen()
+
+    # Aufbereitung der Daten
+    def _anzeigedaten(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Wandelt Index und Spalten eines DataFrames vektorisiert in Anzeigestrings um.
+        Spalten mit eigener Formatierung (z.B. Datum) werden nur für Schlüssel formatiert, die noch nicht im Zwischenspeicher liegen.
+        """
+        daten = df.reset_index()
+        # Die Schlüssel bleiben im Originaltyp, damit z.B. 'entfernen' direkt mit Bestell_IDs aufgerufen werden kann
+        daten.index = df.index
+        for spalte in daten.columns:
+            formatierung = FORMATIERUNG.get(spalte)
+            if formatierung is None or daten.empty:
+                daten[spalte] = daten[spalte].astype(str)
+                continue
+
+            zwischenspeicher = self._formatiert.get(spalte, pd.Series(dtype=str))
+            fehlend = ~daten.index.isin(zwischenspeicher.index)
+            if fehlend.any():
+                neu = formatierung(daten.loc[fehlend, spalte])
+                zwischenspeicher = neu if zwischenspeicher.empty else pd.concat([zwischenspeicher, neu])
+                self._formatiert[spalte] = zwischenspeicher
+            daten[spalte] = zwischenspeicher.reindex(daten.index)
+        return daten
+
+    def _spalten_setzen(self) -> None:
+        """Setzt die Spalten des Treeviews und passt die Breiten an die längsten Einträge bzw. Überschriften an."""
+        spalten = list(self.daten.columns)
+        if spalten != self._spalten:
+            self.tree.delete(*self.tree.get_children())
+            self._angezeigt.clear()
+            self.tree.configure(columns=spalten)
+            for spalte in spalten:
+                self.tree.heading(spalte, text=spalte)
+                self.tree.column(spalte, width=150, anchor='center')
+            self._spalten = spalten
+
+        if not self.daten.empty:
+            # Längster Eintrag je Spalte in einem vektorisierten Durchlauf, mindestens so breit wie die Überschrift
+            laengen = self.daten.apply(lambda spalte: spalte.str.len().max())
+            for spalte, laenge in laengen.items():
+                self.tree.column(spalte, width=max(int(laenge), len(str(spalte))) * self.zeichenbreite)
+
+    # Virtualisierung: nur der sichtbare Ausschnitt wird im Treeview erzeugt
+    def _darstellen(self) -> None:
+        """Gleicht den sichtbaren Ausschnitt per Diff mit den Anzeigedaten ab und setzt die Scrollbar."""
+        gesamt = len(self.daten)
+        self._start = max(0, min(self._start, gesamt - self._sichtbare_zeilen))
+        ausschnitt = self.daten.iloc[self._start:self._start + self._sichtbare_zeilen]
+        soll: dict[str, tuple] = {str(schluessel): tuple(werte) for schluessel, werte in zip(ausschnitt.index, ausschnitt.to_numpy())}
+
+        # Zeilen löschen, die nicht mehr im Ausschnitt liegen
+        veraltet = [iid for iid in self._angezeigt if iid not in soll]
+        if veraltet:
+            self.tree.delete(*veraltet)
+            for iid in veraltet:
+                del self._angezeigt[iid]
+
+        # Zeilen einfügen bzw. nur bei geänderten Werten aktualisieren
+        for position, (iid, werte) in enumerate(soll.items()):
+            if iid not in self._angezeigt:
+                self.tree.insert('', position, iid=iid, values=werte)
+            else:
+                if self._angezeigt[iid] != werte:
+                    self.tree.item(iid, values=werte)
+                if self.tree.index(iid) != position:
+                    self.tree.move(iid, '', position)
+            self._angezeigt[iid] = werte
+
+        if gesamt > 0:
+            self.scrollbar.set(self._start / gesamt, min(1.0, (self._start + self._sichtbare_zeilen) / gesamt))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _verschieben(self, zeilen: int) -> None:
+        """Verschiebt den sichtbaren Ausschnitt um die angegebene Anzahl Zeilen."""
+        start = max(0, min(self._start + zeilen, len(self.daten) - self._sichtbare_zeilen))
+        if start != self._start:
+            self._start = start
+            self._darstellen()
+
+    def _scrollen(self, aktion: str, wert: str, einheit: str | None = None) -> None:
+        """Verarbeitet die Befehle der Scrollbar ('moveto' bzw. 'scroll' in Zeilen oder Seiten)."""
+        if aktion == 'moveto':
+            self._verschieben(int(float(wert) * len(self.daten)) - self._start)
+        elif aktion == 'scroll':
+            self._verschieben(int(wert) * (self._sichtbare_zeilen if einheit == 'pages' else 1))
+
+    def _mausrad(self, event: tk.Event) -> str:
+        """Scrollt den Ausschnitt mit dem Mausrad und verhindert das interne Scrollen des Treeviews."""
+        self._verschieben(-3 if event.delta > 0 else 3)
+        return 'break'
+
+    def _groesse_geaendert(self, event: tk.Event) -> None:
+        """Berechnet die Anzahl sichtbarer Zeilen aus der Höhe des Treeviews neu."""
+        zeilenhoehe = int(ttk.Style().lookup(self.style, 'rowheight') or 20)
+        sichtbare_zeilen = max(1, event.height // zeilenhoehe)
+        if sichtbare_zeilen != self._sichtbare_zeilen:
+            self._sichtbare_zeilen = sichtbare_zeilen
+            self._darstellen()
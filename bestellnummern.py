@@ -0,0 +1,82 @@
+###
+# Vergabe der Bestell_IDs
+#
+# Beschreibung:
+# Persistenter, monoton steigender Zähler für neue Bestell_IDs. Statt bei jeder Bestellung das Maximum aller offenen
+# Bestellungen zu suchen und gegen die geschlossenen Bestellungen zu prüfen, wird die Obergrenze des zuletzt reservierten
+# ID-Blocks in './data/Bestell_ID.txt' gespeichert. Innerhalb eines Blocks kostet jede neue ID nur eine Addition,
+# erst beim nächsten Block wird die Datei neu geschrieben. Nach einem Neustart wird mit dem nächsten Block fortgesetzt;
+# nicht verbrauchte IDs des alten Blocks bleiben als Lücke ungenutzt, eine ID wird nie zweimal vergeben.
+# Bei der ersten Vergabe nach dem Start wird der Zähler mit der höchsten vorhandenen ID abgeglichen: Fehlt die Datei
+# (erster Start) oder liegt sie hinter den Daten zurück (z.B. nach dem Kopieren einer bestehenden CSV-Datei in ein
+# Datenverzeichnis mit Zähler), wird hinter der höchsten vorhandenen ID fortgesetzt. Der Abgleich findet erst bei der
+# ersten Vergabe statt, damit der Start nicht auf die geschlossenen Bestellungen wartet.
+###
+
+import os
+from typing import Callable
+
+
+class BestellIdVergabe():
+    """
+    Vergibt neue Bestell_IDs blockweise aus einem persistenten Zähler.
+    """
+
+    def __init__(self, pfad: str, hoechste_vergebene_id: Callable[[], int], blockgroesse: int = 100) -> None:
+        """
+        Args:
+            pfad (str): Datei, in der die Obergrenze des reservierten Blocks gespeichert wird.
+            hoechste_vergebene_id (Callable[[], int]): Liefert die höchste bereits vergebene Bestell_ID (offen und geschlossen).
+                Wird einmal bei der ersten Vergabe aufgerufen, um den gespeicherten Zähler zu prüfen.
+            blockgroesse (int): Anzahl IDs, die pro Schreibvorgang reserviert werden.
+        """
+        self.pfad = pfad
+        self.blockgroesse = blockgroesse
+        self.hoechste_vergebene_id = hoechste_vergebene_id
+
+        try:
+            with open(pfad, encoding='utf-8') as datei:
+                self.gespeichert: int = int(datei.read().strip())
+        except (OSError, ValueError):
+            self.gespeichert = 0
+        # Die Obergrenze wird bei der ersten Vergabe mit den vorhandenen IDs abgeglichen
+        self.naechste: int | None = None
+        self.obergrenze: int | None = None
+
+    def _fortsetzen(self) -> None:
+        """Setzt die Vergabe hinter dem zuletzt reservierten Block bzw. hinter der höchsten vorhandenen ID fort."""
+        obergrenze = max(self.gespeichert, int(self.hoechste_vergebene_id()))
+        self.naechste = obergrenze + 1
+        self.obergrenze = obergrenze
+
+    def vergeben(self, anzahl: int = 1) -> list[int]:
+        """
+        Vergibt 'anzahl' fortlaufende, noch nie verwendete Bestell_IDs.
+
+        Args:
+            anzahl (int): Anzahl benötigter IDs.
+
+        Returns:
+            list[int]: Die neuen Bestell_IDs in aufsteigender Reihenfolge.
+        """
+        if self.naechste is None:
+            self._fortsetzen()
+
+        erste = self.naechste
+        self.naechste += anzahl
+
+        # Neuen Block reservieren, bevor eine ID außerhalb des gespeicherten Blocks herausgegeben wird
+        if self.naechste - 1 > self.obergrenze:
+            self._reservieren(self.naechste - 1 + self.blockgroesse)
+
+        return list(range(erste, self.naechste))
+
+    def _reservieren(self, obergrenze: int) -> None:
+        """Speichert die neue Obergrenze atomar."""
+        temp_pfad = f'{self.pfad}.tmp'
+        with open(temp_pfad, 'w', encoding='utf-8') as datei:
+            datei.write(str(obergrenze))
+            datei.flush()
+            os.fsync(datei.fileno())
+        os.replace(temp_pfad, self.pfad)
+        self.obergrenze = obergrenze
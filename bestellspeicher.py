@@ -0,0 +1,841 @@
+###
+# Bestellspeicher der Restaurant-App
+#
+# Beschreibung:
+# Austauschbare Speicher-Engines für die offenen und geschlossenen Bestellungen. Die GUI arbeitet ausschließlich
+# über die Schnittstelle 'Bestellspeicher' und weiß nicht, wo die Daten liegen.
+#
+# - CsvSpeicher:    Hält die Bestellungen als DataFrames im Speicher, protokolliert jede Änderung im Bestelljournal
+#                   und kompaktiert periodisch in die CSV-Datei der offenen Bestellungen und das monatsweise
+#                   Bestellarchiv der geschlossenen Bestellungen. Abfragen laufen über die Sekundärindizes aus bestellindex.py.
+#                   Stornierte und abgerechnete Zeilen werden bis zum nächsten Sichern in einem kleinen Puffer gesammelt;
+#                   Abfragen eines Zeitraums lesen nur die betroffenen Monate des Archivs und ergänzen den Puffer.
+#                   Das komplette Archiv wird beim Start im Hintergrund geladen und erst bei einer Abfrage ohne Zeitraum
+#                   abgewartet, sodass weder die erste Bestellung noch eine Abrechnung von der Größe des Archivs abhängt.
+#                   Fehlt der Zähler der Bestell_IDs, liest die erste Vergabe nur die Spalte 'Bestell_ID' der geschlossenen
+#                   Bestellungen. Blockierend bleiben das Sichern und Abfragen ohne Zeitraum, solange der einmalige Import
+#                   der CSV-Datei ins Archiv läuft; der Import liest die Datei in Blöcken mit festen Datentypen.
+#                   Das blockweise Lesen aller geschlossenen Bestellungen ('geschlossene_bloecke') liest immer von der
+#                   Platte (Partition für Partition bzw. vor dem Import die CSV-Datei in Blöcken), auch wenn das Archiv
+#                   bereits im Speicher liegt.
+# - SqliteSpeicher: Eingebettete SQLite-Datenbank im WAL-Modus mit Indizes auf (Status, Tischnummer) und Speise_ID sowie
+#                   auf dem Datum der geschlossenen Bestellungen für Abfragen eines Zeitraums.
+#                   Die CSV-Dateien bleiben Import- und Exportformat.
+#
+# Wird eine Bestellung teilweise abgerechnet und der Rest storniert, hat sie in den geschlossenen Bestellungen in beiden
+# Engines je Status eine Zeile (abgerechnete und stornierte Menge); weitere Teilabrechnungen werden aufaddiert.
+###
+
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
+from typing import Iterator
+
+import pandas as pd
+
+from bestellarchiv import Bestellarchiv, geschlossen_zusammenfuehren, monat_von, monate_auswaehlen, zeitraum_filtern
+from bestellindex import KATEGORIEN, Bestellindex
+from bestelljournal import BESTELL_SPALTEN, Bestelljournal, bestellungen_bloecke, csv_atomar_schreiben, datum_parsen, leere_bestellungen
+from bestellnummern import BestellIdVergabe
+
+
+class Bestellspeicher(ABC):
+    """
+    Schnittstelle aller Speicher-Engines mit den Operationen, die die GUI-Callbacks benötigen.
+    Eine Engine muss alle abstrakten Methoden implementieren, sonst schlägt bereits das Anlegen fehl.
+
+    Alle lesenden Funktionen geben DataFrames mit 'Bestell_ID' als Index und den Spalten
+    Datum (datetime64), Tischnummer, Speise_ID, Speise, Menge und Status zurück.
+    Neue Bestell_IDs kommen aus dem persistenten Zähler 'self.id_vergabe', den jede Engine beim Öffnen anlegt.
+
+    Über 'beobachten' können sich weitere Strukturen (z.B. die Rechnungsvorbereitung) über Änderungen informieren lassen.
+    Gemeldet werden nach jeder erfolgreichen Änderung die Ereignisse 'angelegt(bestellungen)', 'geliefert(bestellungen)',
+    'menge_geaendert(bestell_id, menge)', 'storniert(bestell_id)' und 'geschlossen(positionen)'. Zusätzlich meldet
+    'abgeschlossen(bestellungen)' bei Stornierung und Abrechnung die Zeilen, die in die geschlossenen Bestellungen
+    übernommen wurden (mit der übernommenen Menge und dem Status 'storniert' bzw. 'geschlossen').
+    Ein Beobachter implementiert nur die Ereignisse, die er benötigt.
+    """
+
+    id_vergabe: BestellIdVergabe
+    beobachter: list
+
+    def beobachten(self, beobachter: object) -> None:
+        """Meldet einen Beobachter für alle folgenden Änderungen an."""
+        self.beobachter.append(beobachter)
+
+    def _melden(self, ereignis: str, *args) -> None:
+        """Ruft das Ereignis bei allen Beobachtern auf, die es implementieren."""
+        for beobachter in self.beobachter:
+            methode = getattr(beobachter, ereignis, None)
+            if methode is not None:
+                methode(*args)
+
+    def _abgeschlossen_melden(self, vorher: pd.DataFrame, status: str, positionen: list[tuple[int, int]] | None = None) -> None:
+        """
+        Meldet die in die geschlossenen Bestellungen übernommenen Zeilen an die Beobachter.
+
+        Args:
+            vorher (pd.DataFrame): Die betroffenen offenen Bestellungen vor der Änderung.
+            status (str): 'storniert' oder 'geschlossen'.
+            positionen (list[tuple[int, int]] | None): Abgerechnete (Bestell_ID, Menge); None übernimmt die ganze Menge.
+        """
+        if vorher.empty:
+            return
+        zeilen = vorher.copy()
+        if positionen is not None:
+            mengen = pd.DataFrame(positionen, columns=['Bestell_ID', 'Menge']).astype(int).groupby('Bestell_ID')['Menge'].sum()
+            mengen = mengen[mengen.index.isin(zeilen.index)]
+            zeilen = zeilen.loc[mengen.index]
+            zeilen['Menge'] = mengen
+        zeilen['Status'] = status
+        self._melden('abgeschlossen', zeilen)
+
+    @abstractmethod
+    def bestellungen(self, status: str | None = None, tischnummer: int | None = None, kategorie: str | None = None) -> pd.DataFrame:
+        """
+        Gibt die offenen Bestellungen zurück, optional gefiltert.
+
+        Args:
+            status (str | None): Nur Bestellungen mit diesem Status ('offen', 'geliefert').
+            tischnummer (int | None): Nur Bestellungen dieses Tisches.
+            kategorie (str | None): 'essen' oder 'getraenke'.
+        """
+
+    @abstractmethod
+    def bestellung(self, bestell_id: int) -> pd.Series:
+        """Gibt eine offene Bestellung zurück. Wirft KeyError, falls die Bestell_ID nicht vorhanden ist."""
+
+    @abstractmethod
+    def enthaelt(self, bestell_id: int) -> bool:
+        """Gibt zurück, ob eine offene Bestellung mit dieser Bestell_ID existiert."""
+
+    def neue_bestell_id(self) -> int:
+        """Vergibt eine neue, noch nie verwendete Bestell_ID."""
+        return self.id_vergabe.vergeben(1)[0]
+
+    def neue_bestell_ids(self, anzahl: int) -> list[int]:
+        """Vergibt 'anzahl' neue, noch nie verwendete Bestell_IDs."""
+        return self.id_vergabe.vergeben(anzahl)
+
+    @abstractmethod
+    def hoechste_bestell_id(self) -> int:
+        """Ermittelt die höchste offen oder geschlossen vorhandene Bestell_ID (0, falls keine vorhanden ist)."""
+
+    @abstractmethod
+    def anlegen(self, bestellungen: pd.DataFrame) -> None:
+        """Legt neue Bestellungen ('Bestell_ID' als Index) an."""
+
+    def bestellung_aufgeben(self, tischnummer: int, mengen: dict[int, str | int], karte: pd.DataFrame) -> pd.DataFrame:
+        """
+        Legt alle Positionen einer Tischbestellung in einem Schritt an. Wird von den Bestellmasken für Essen und Getränke genutzt.
+
+        Die Funktion:
+        - Prüft alle eingegebenen Mengen auf einmal (nur Ziffern, leere Eingaben zählen als 0).
+        - Löst die Speisenbezeichnungen aller bestellten Speise_IDs mit einer einzigen Abfrage in der Karte auf.
+        - Vergibt die Bestell_IDs als Block und erstellt das DataFrame der Bestellung mit einer einzigen Allokation.
+        - Übergibt die komplette Bestellung mit einem Aufruf an 'anlegen'.
+
+        Args:
+            tischnummer (int): Die Tischnummer der Bestellung.
+            mengen (dict[int, str | int]): Speise_ID -> eingegebene Menge.
+            karte (pd.DataFrame): Speise- bzw. Getränkekarte mit 'Speise_ID' als Index.
+
+        Raises:
+            ValueError: Bei nicht-numerischen Mengen oder unbekannten Speise_IDs.
+
+        Returns:
+            pd.DataFrame: Die angelegten Bestellungen (leer, wenn keine Menge > 0 eingegeben wurde).
+        """
+        eingaben = pd.Series(list(mengen.values()), index=list(mengen.keys()), dtype=str).str.strip()
+
+        # Überprüfen, ob die Mengen nur Zahlen enthalten
+        if not eingaben.str.fullmatch(r'[0-9]*').all():
+            raise ValueError('Fehlerhafte Menge')
+
+        # Nur Positionen mit Menge > 0 verarbeiten
+        eingaben = pd.to_numeric(eingaben.replace('', '0')).astype(int)
+        eingaben = eingaben[eingaben > 0]
+        if eingaben.empty:
+            return leere_bestellungen()
+
+        # Speisenbezeichnungen mit einer Abfrage auflösen
+        speisen = karte['Speise'].reindex(eingaben.index)
+        if speisen.isna().any():
+            raise ValueError(f'Unbekannte Speise_ID: {list(speisen[speisen.isna()].index)}')
+
+        bestellung_df = pd.DataFrame({
+            'Bestell_ID': self.neue_bestell_ids(len(eingaben)),
+            'Datum': pd.Timestamp.now(),
+            'Tischnummer': int(tischnummer),
+            'Speise_ID': eingaben.index.astype(int),
+            'Speise': speisen.to_numpy(),
+            'Menge': eingaben.to_numpy(),
+            'Status': 'offen'
+        }).set_index('Bestell_ID')
+
+        self.anlegen(bestellung_df)
+        return bestellung_df
+
+    @abstractmethod
+    def menge_aendern(self, bestell_id: int, menge: int) -> None:
+        """Ändert die Menge einer offenen Bestellung."""
+
+    @abstractmethod
+    def liefern(self, bestell_ids: list[int]) -> None:
+        """Setzt den Status einer oder mehrerer Bestellungen auf 'geliefert'."""
+
+    @abstractmethod
+    def stornieren(self, bestell_id: int) -> None:
+        """Storniert eine Bestellung und verschiebt sie in die geschlossenen Bestellungen."""
+
+    @abstractmethod
+    def schliessen(self, positionen: list[tuple[int, int]]) -> None:
+        """
+        Rechnet Positionen ab: Die Menge wird von der offenen Bestellung abgezogen (bei 0 wird sie gelöscht)
+        und in den geschlossenen Bestellungen mit Status 'geschlossen' übernommen bzw. aufaddiert.
+
+        Args:
+            positionen (list[tuple[int, int]]): Liste aus (Bestell_ID, abgerechnete Menge).
+        """
+
+    @abstractmethod
+    def geschlossene_bestellungen(self, von: date | None = None, bis: date | None = None) -> pd.DataFrame:
+        """
+        Gibt die geschlossenen Bestellungen zurück, optional auf einen Zeitraum des Bestelldatums begrenzt.
+
+        Args:
+            von (date | None): Erster Tag (einschließlich).
+            bis (date | None): Letzter Tag (einschließlich).
+        """
+
+    @abstractmethod
+    def geschlossene_bloecke(self, zeilen: int = 100_000) -> Iterator[pd.DataFrame]:
+        """
+        Gibt alle geschlossenen Bestellungen in Blöcken von höchstens 'zeilen' Zeilen zurück, ohne die komplette Historie
+        auf einmal zu laden (z.B. für den ersten Aufbau der Umsatzstatistik). Je Bestell_ID und Status kommt genau eine Zeile vor.
+        Der Stand wird beim Aufruf festgehalten; die Blöcke dürfen danach in einem anderen Thread gelesen werden, während
+        im aufrufenden Thread weiter Bestellungen abgeschlossen werden (diese sind in den Blöcken nicht enthalten).
+
+        Args:
+            zeilen (int): Maximale Anzahl Zeilen je Block.
+        """
+
+    @abstractmethod
+    def sichern(self) -> None:
+        """Schreibt den aktuellen Stand in die CSV-Dateien."""
+
+
+class CsvSpeicher(Bestellspeicher):
+    """
+    Speicher-Engine auf Basis von DataFrames, CSV-Snapshots und dem Bestelljournal.
+
+    Die Sekundärindizes in 'self.index' werden von den privaten Änderungsfunktionen nachgeführt,
+    sodass gefilterte Abfragen nur die passenden Zeilen per Bestell_ID auslesen.
+    """
+
+    def __init__(self, offen_pfad: str, geschlossen_pfad: str, journal_pfad: str, id_pfad: str, kompaktierung_ab: int = 500,
+                 archiv_verzeichnis: str | None = None, im_hintergrund: bool = True, block_zeilen: int = 100_000) -> None:
+        """
+        Lädt den Snapshot der offenen Bestellungen und spielt das Bestelljournal darauf ab.
+
+        Die geschlossenen Bestellungen werden nicht sofort geladen: Neue Bestell_IDs kommen aus dem persistenten Zähler,
+        Abrechnungen und Stornierungen landen zunächst im Puffer der neuen geschlossenen Bestellungen, und Abfragen eines
+        Zeitraums lesen nur dessen Monate. Das komplette Archiv wird im Hintergrund gelesen (bzw. mit 'im_hintergrund=False'
+        erst beim ersten Zugriff ohne Zeitraum). Existiert das Archiv noch nicht, wird es dabei einmalig blockweise aus der
+        CSV-Datei der geschlossenen Bestellungen angelegt; bis dahin warten alle Zugriffe auf die geschlossenen Bestellungen
+        darauf (außer 'geschlossene_bloecke', das die CSV-Datei selbst blockweise liest).
+
+        Args:
+            offen_pfad (str): Snapshot der offenen Bestellungen.
+            geschlossen_pfad (str): CSV der geschlossenen Bestellungen (Import).
+            journal_pfad (str): Pfad des Bestelljournals.
+            id_pfad (str): Zählerdatei der Bestell_ID-Vergabe.
+            kompaktierung_ab (int): Anzahl Journal-Einträge, ab der kompaktiert wird.
+            archiv_verzeichnis (str | None): Verzeichnis des Bestellarchivs (Standard: 'Archiv' neben der CSV-Datei).
+            im_hintergrund (bool): Das komplette Archiv sofort in einem Hintergrund-Thread laden.
+            block_zeilen (int): Zeilen je Block beim Import der CSV-Datei ins Archiv.
+        """
+        self.beobachter = []
+        self.geschlossen_pfad = geschlossen_pfad
+        self.journal = Bestelljournal(offen_pfad, geschlossen_pfad, journal_pfad, kompaktierung_ab)
+        self.bestellungen_df = self.journal.offen_laden()
+        self.archiv = Bestellarchiv(archiv_verzeichnis or os.path.join(os.path.dirname(geschlossen_pfad), 'Archiv'))
+        # Geschlossene Bestellungen seit dem letzten Sichern (noch nicht im Archiv), je Bestell_ID und Status eine Zeile
+        self._neu_geschlossen_df = leere_bestellungen()
+        # Kompletter Inhalt des Archivs, sobald er geladen ist
+        self._archiv_df: pd.DataFrame | None = None
+        self._ladevorgang: Future | None = None
+        # Beim ersten Start muss das Archiv erst aus der CSV-Datei angelegt werden, bevor einzelne Monate lesbar sind
+        self._import_ausstehend = not self.archiv.vorhanden()
+        self.im_hintergrund = im_hintergrund
+        self.block_zeilen = block_zeilen
+        # Laufende Leser von 'geschlossene_bloecke' (z.B. der Aufbau der Umsatzstatistik im Hintergrund); solange gelesen
+        # wird, schreibt 'sichern' keine Partitionen, damit die Blöcke zum festgehaltenen Puffer passen
+        self._leser = 0
+        self._leser_fertig = threading.Condition()
+        if im_hintergrund:
+            self._laden_starten()
+        self.index = Bestellindex()
+        self.index.aufbauen(self.bestellungen_df)
+        self._abspielen()
+        self.id_vergabe = BestellIdVergabe(id_pfad, self.hoechste_bestell_id)
+
+    # Archiv der geschlossenen Bestellungen (verzögert geladen)
+    def _laden_starten(self) -> None:
+        """Startet das Laden des kompletten Archivs in einem Hintergrund-Thread."""
+        lader = ThreadPoolExecutor(max_workers=1, thread_name_prefix='Bestellarchiv')
+        self._ladevorgang = lader.submit(self._archiv_laden)
+        lader.shutdown(wait=False)
+
+    def _archiv_laden(self) -> pd.DataFrame:
+        """Liest das Bestellarchiv, das beim ersten Start zuvor blockweise aus der CSV-Datei angelegt wird."""
+        if not self.archiv.vorhanden():
+            self.archiv.importieren(bestellungen_bloecke(self.geschlossen_pfad, self.block_zeilen))
+        return self.archiv.laden()
+
+    def _import_abschliessen(self) -> None:
+        """Stellt sicher, dass das Archiv angelegt ist: wartet auf einen laufenden Ladevorgang bzw. importiert ohne komplett zu laden."""
+        if not self._import_ausstehend:
+            return
+        if self._ladevorgang is not None:
+            self._archiv_komplett()
+        else:
+            self.archiv.importieren(bestellungen_bloecke(self.geschlossen_pfad, self.block_zeilen))
+            self._import_ausstehend = False
+
+    def _archiv_komplett(self) -> pd.DataFrame:
+        """Der komplette Inhalt des Archivs; beim ersten Zugriff wird auf das Laden gewartet bzw. geladen."""
+        if self._archiv_df is None:
+            self._archiv_df = self._ladevorgang.result() if self._ladevorgang is not None else self._archiv_laden()
+            self._ladevorgang = None
+            self._import_ausstehend = False
+        return self._archiv_df
+
+    def geschlossen_geladen(self) -> bool:
+        """Gibt zurück, ob das komplette Archiv bereits im Speicher liegt (ohne darauf zu warten)."""
+        return self._archiv_df is not None or (self._ladevorgang is not None and self._ladevorgang.done())
+
+    def _archiv_zeitraum(self, von: date | None, bis: date | None) -> pd.DataFrame:
+        """Die archivierten Bestellungen eines Zeitraums: aus dem geladenen Archiv, sonst nur aus den Monaten des Zeitraums."""
+        self._import_abschliessen()
+        if self.geschlossen_geladen() or (von is None and bis is None):
+            return zeitraum_filtern(self._archiv_komplett(), von, bis)
+        return self.archiv.laden(von, bis)
+
+    # Abspielen des Journals auf die geladenen Snapshots
+    def _abspielen(self) -> None:
+        """
+        Spielt alle noch nicht kompaktierten Journal-Einträge ab. Dabei werden dieselben Funktionen verwendet
+        wie im laufenden Betrieb, nur ohne erneut in das Journal zu schreiben.
+        Stornierungen und Abrechnungen, die bereits in der Monatspartition ihrer Bestellung enthalten sind (Abbruch
+        beim Sichern nach dem Schreiben des Archivs), ändern nur noch die offenen Bestellungen.
+        """
+        # Neue Bestellungen werden gesammelt und mit einem einzigen concat übernommen
+        neue_zeilen: list[dict] = []
+        # Vermerkte Seq je Monatspartition (nur für die Monate der abgespielten Abschlüsse gelesen)
+        archiv_seqs: dict[str, int] = {}
+
+        for zeile in self.journal.ereignisse():
+            ereignis = zeile['Ereignis']
+            bestell_id = int(zeile['Bestell_ID'])
+
+            if ereignis == 'angelegt':
+                neue_zeilen.append({
+                    'Bestell_ID': bestell_id,
+                    'Datum': zeile['Datum'],
+                    'Tischnummer': int(zeile['Tischnummer']),
+                    'Speise_ID': int(zeile['Speise_ID']),
+                    'Speise': zeile['Speise'],
+                    'Menge': int(zeile['Menge']),
+                    'Status': 'offen'
+                })
+                continue
+
+            if neue_zeilen:
+                self._neue_zeilen_anlegen(neue_zeilen)
+                neue_zeilen.clear()
+            if bestell_id not in self.bestellungen_df.index:
+                continue
+
+            if ereignis == 'menge':
+                self._menge_aendern(bestell_id, int(zeile['Menge']))
+            elif ereignis == 'geliefert':
+                self._liefern([bestell_id])
+            elif ereignis in ('storniert', 'geschlossen'):
+                monat = self.bestellungen_df.loc[bestell_id, 'Datum'].strftime('%Y-%m')
+                if monat not in archiv_seqs:
+                    archiv_seqs[monat] = self.archiv.seq(monat)
+                archivieren = int(zeile['Seq']) > archiv_seqs[monat]
+                if ereignis == 'storniert':
+                    self._stornieren(bestell_id, archivieren)
+                else:
+                    self._schliessen([(bestell_id, int(zeile['Menge']))], archivieren)
+
+        if neue_zeilen:
+            self._neue_zeilen_anlegen(neue_zeilen)
+
+    def _neue_zeilen_anlegen(self, neue_zeilen: list[dict]) -> None:
+        """Übernimmt gesammelte 'angelegt'-Ereignisse, das Datum wird dabei für alle Zeilen in einem Schritt geparst."""
+        bestellungen = pd.DataFrame(neue_zeilen).set_index('Bestell_ID')
+        bestellungen['Datum'] = datum_parsen(bestellungen['Datum'])
+        self._anlegen(bestellungen)
+
+    # Lesende Funktionen
+    def bestellungen(self, status: str | None = None, tischnummer: int | None = None, kategorie: str | None = None) -> pd.DataFrame:
+        if status is None and tischnummer is None and kategorie is None:
+            return self.bestellungen_df
+        return self.bestellungen_df.loc[self.index.bestell_ids(status, tischnummer, kategorie)]
+
+    def bestellung(self, bestell_id: int) -> pd.Series:
+        return self.bestellungen_df.loc[bestell_id]
+
+    def enthaelt(self, bestell_id: int) -> bool:
+        return bestell_id in self.bestellungen_df.index
+
+    def hoechste_bestell_id(self) -> int:
+        # Ohne geladenes Archiv nur die Bestell_IDs lesen (aus den Partitionen bzw. vor dem Import aus der CSV-Datei)
+        if self.geschlossen_geladen():
+            archiviert = self._archiv_komplett().index
+        elif self._import_ausstehend and os.path.isfile(self.geschlossen_pfad):
+            archiviert = pd.Index(pd.read_csv(self.geschlossen_pfad, usecols=['Bestell_ID'])['Bestell_ID'])
+        else:
+            archiviert = pd.Index([self.archiv.hoechste_bestell_id()])
+        return int(max((ids.max() for ids in (archiviert, self.bestellungen_df.index, self._neu_geschlossen_df.index) if len(ids)),
+                       default=0))
+
+    def geschlossene_bestellungen(self, von: date | None = None, bis: date | None = None) -> pd.DataFrame:
+        return geschlossen_zusammenfuehren(self._archiv_zeitraum(von, bis), zeitraum_filtern(self._neu_geschlossen_df, von, bis))
+
+    def geschlossene_bloecke(self, zeilen: int = 100_000) -> Iterator[pd.DataFrame]:
+        bloecke = self._bloecke_lesen(zeilen)
+        # Bis zum ersten 'yield' ausführen: Stand festhalten und als Leser anmelden, noch im aufrufenden Thread
+        next(bloecke)
+        return bloecke
+
+    def _bloecke_lesen(self, zeilen: int) -> Iterator[pd.DataFrame | None]:
+        """
+        Liest die geschlossenen Bestellungen blockweise von der Platte, auch wenn das Archiv schon im Speicher liegt: vor dem
+        Import die CSV-Datei, sonst je Monat eine Partition. Der Puffer wird mit den Zeilen derselben Bestellungen zusammengeführt.
+        Liefert zuerst None, sobald der Stand festgehalten ist; bis zum letzten Block schreibt 'sichern' keine Partitionen.
+        """
+        puffer = self._neu_geschlossen_df
+        if self._import_ausstehend:
+            teile = self._csv_bloecke(puffer, zeilen)
+        else:
+            monate = sorted(set(self.archiv.monate()) | set(monat_von(puffer['Datum'])))
+            teile = (geschlossen_zusammenfuehren(self.archiv.monate_laden([monat]), monate_auswaehlen(puffer, [monat]))
+                     for monat in monate)
+        with self._leser_fertig:
+            self._leser += 1
+        try:
+            yield None
+            # Kleine Monate werden zu Blöcken von 'zeilen' Zeilen zusammengefasst, große aufgeteilt
+            gesammelt: list[pd.DataFrame] = []
+            anzahl = 0
+            for teil in teile:
+                gesammelt.append(teil)
+                anzahl += len(teil)
+                while anzahl >= zeilen:
+                    block = pd.concat(gesammelt) if len(gesammelt) > 1 else gesammelt[0]
+                    yield block.iloc[:zeilen]
+                    gesammelt = [block.iloc[zeilen:]]
+                    anzahl = len(gesammelt[0])
+            if anzahl:
+                yield pd.concat(gesammelt) if len(gesammelt) > 1 else gesammelt[0]
+        finally:
+            with self._leser_fertig:
+                self._leser -= 1
+                self._leser_fertig.notify_all()
+
+    def _csv_bloecke(self, puffer: pd.DataFrame, zeilen: int) -> Iterator[pd.DataFrame]:
+        """Liest die CSV-Datei der geschlossenen Bestellungen blockweise und führt den Puffer mit den Zeilen derselben Schlüssel zusammen."""
+        rest = puffer
+        for block in bestellungen_bloecke(self.geschlossen_pfad, zeilen):
+            schluessel = pd.MultiIndex.from_arrays([block.index, block['Status'].to_numpy()])
+            treffer = pd.MultiIndex.from_arrays([rest.index, rest['Status'].to_numpy()]).isin(schluessel)
+            yield geschlossen_zusammenfuehren(block, rest[treffer])
+            rest = rest[~treffer]
+        # Abschlüsse ohne Zeile in der CSV-Datei kommen zuletzt
+        if not rest.empty:
+            yield rest
+
+    # Schreibende Funktionen: DataFrame aktualisieren und Ereignis an das Journal anhängen
+    def anlegen(self, bestellungen: pd.DataFrame) -> None:
+        self._anlegen(bestellungen)
+        self.journal.angelegt(bestellungen)
+        self._kompaktieren_falls_faellig()
+        self._melden('angelegt', bestellungen)
+
+    def menge_aendern(self, bestell_id: int, menge: int) -> None:
+        if self.enthaelt(bestell_id):
+            self._menge_aendern(bestell_id, menge)
+            self.journal.menge_geaendert(bestell_id, menge)
+            self._kompaktieren_falls_faellig()
+            self._melden('menge_geaendert', bestell_id, menge)
+
+    def liefern(self, bestell_ids: list[int]) -> None:
+        bestell_ids = [i for i in bestell_ids if self.enthaelt(i)]
+        self._liefern(bestell_ids)
+        self.journal.geliefert(bestell_ids)
+        self._kompaktieren_falls_faellig()
+        self._melden('geliefert', self.bestellungen_df.loc[bestell_ids])
+
+    def stornieren(self, bestell_id: int) -> None:
+        vorher = self.bestellungen_df.loc[[bestell_id]]
+        self._stornieren(bestell_id)
+        self.journal.storniert(bestell_id)
+        self._kompaktieren_falls_faellig()
+        self._melden('storniert', bestell_id)
+        self._abgeschlossen_melden(vorher, 'storniert')
+
+    def schliessen(self, positionen: list[tuple[int, int]]) -> None:
+        vorher = self.bestellungen_df.loc[[i for i, _ in positionen if self.enthaelt(i)]]
+        self._schliessen(positionen)
+        self.journal.geschlossen(positionen)
+        self._kompaktieren_falls_faellig()
+        self._melden('geschlossen', positionen)
+        self._abgeschlossen_melden(vorher, 'geschlossen', positionen)
+
+    def sichern(self) -> None:
+        # Nur die Monate der neuen geschlossenen Bestellungen neu schreiben, danach den Snapshot der offenen Bestellungen
+        # und das Journal. Dafür werden nur diese Monate aus dem Archiv gelesen, sofern es nicht ohnehin geladen ist.
+        # Zuvor wird gewartet, bis kein Leser von 'geschlossene_bloecke' mehr die Partitionen liest.
+        with self._leser_fertig:
+            self._leser_fertig.wait_for(lambda: self._leser == 0)
+        neu = self._neu_geschlossen_df
+        if not neu.empty:
+            monate = set(monat_von(neu['Datum']))
+            self._import_abschliessen()
+            if self.geschlossen_geladen():
+                basis = monate_auswaehlen(self._archiv_komplett(), monate)
+            else:
+                basis = self.archiv.monate_laden(monate)
+            self.archiv.schreiben(geschlossen_zusammenfuehren(basis, neu), monate, self.journal.seq)
+            if self._archiv_df is not None:
+                self._archiv_df = geschlossen_zusammenfuehren(self._archiv_df, neu)
+            elif self._ladevorgang is not None:
+                # Ein noch laufender Ladevorgang hat die Monate eventuell vor dem Schreiben gelesen und beginnt neu
+                self._laden_starten()
+            self._neu_geschlossen_df = leere_bestellungen()
+        self.journal.kompaktieren(self.bestellungen_df)
+
+    def _kompaktieren_falls_faellig(self) -> None:
+        """Kompaktiert das Bestelljournal in die CSV-Dateien, sobald genügend Einträge aufgelaufen sind (nicht während gelesen wird)."""
+        if self.journal.kompaktierung_faellig() and self._leser == 0:
+            self.sichern()
+
+    # Änderungen an den DataFrames (ohne Journal)
+    def _anlegen(self, bestellungen: pd.DataFrame) -> None:
+        if self.bestellungen_df.empty:
+            self.bestellungen_df = bestellungen.copy()
+        else:
+            self.bestellungen_df = pd.concat([self.bestellungen_df, bestellungen])
+        self.index.hinzufuegen(bestellungen)
+
+    def _menge_aendern(self, bestell_id: int, menge: int) -> None:
+        self.bestellungen_df.loc[bestell_id, 'Menge'] = menge
+
+    def _liefern(self, bestell_ids: list[int]) -> None:
+        self.bestellungen_df.loc[list(bestell_ids), 'Status'] = 'geliefert'
+        self.index.status_setzen(bestell_ids, 'geliefert')
+
+    def _stornieren(self, bestell_id: int, archivieren: bool = True) -> None:
+        self.bestellungen_df.loc[bestell_id, 'Status'] = 'storniert'
+        if archivieren:
+            self._geschlossen_anhaengen(self.bestellungen_df.loc[[bestell_id]])
+        self.bestellungen_df = self.bestellungen_df.drop(bestell_id)
+        self.index.entfernen(bestell_id)
+
+    def _schliessen(self, positionen: list[tuple[int, int]], archivieren: bool = True) -> None:
+        for bestell_id, menge in positionen:
+            # Teilabrechnungen derselben Bestellung werden beim Zusammenführen aufaddiert (auch mit bereits archivierten)
+            if archivieren:
+                abgerechnet = self.bestellungen_df.loc[[bestell_id]].copy()
+                abgerechnet['Menge'] = menge
+                abgerechnet['Status'] = 'geschlossen'
+                self._geschlossen_anhaengen(abgerechnet)
+
+            rest = self.bestellungen_df.loc[bestell_id, 'Menge'] - menge
+            if rest > 0:
+                self.bestellungen_df.loc[bestell_id, 'Menge'] = rest
+            else:
+                self.bestellungen_df = self.bestellungen_df.drop(bestell_id)
+                self.index.entfernen(bestell_id)
+
+    def _geschlossen_anhaengen(self, zeilen: pd.DataFrame) -> None:
+        self._neu_geschlossen_df = geschlossen_zusammenfuehren(self._neu_geschlossen_df, zeilen.copy())
+
+
+class SqliteSpeicher(Bestellspeicher):
+    """
+    Speicher-Engine auf Basis einer eingebetteten SQLite-Datenbank im WAL-Modus.
+
+    Tischabfragen und Statusänderungen sind indizierte Punktoperationen statt Scans über das ganze DataFrame.
+    Beim ersten Öffnen werden die vorhandenen CSV-Daten (inkl. Bestelljournal) importiert, beim Sichern
+    werden die CSV-Dateien als Export geschrieben.
+    """
+
+    TABELLEN: tuple[str, str] = ('bestellungen_offen', 'bestellungen_geschlossen')
+    # Primärschlüssel je Tabelle; geschlossene Bestellungen haben je Status eine Zeile
+    SCHLUESSEL: dict[str, str] = {
+        'bestellungen_offen': 'Bestell_ID',
+        'bestellungen_geschlossen': 'Bestell_ID, Status'
+    }
+
+    def __init__(self, datenbank_pfad: str, offen_pfad: str, geschlossen_pfad: str, journal_pfad: str, id_pfad: str) -> None:
+        """
+        Args:
+            datenbank_pfad (str): Pfad der SQLite-Datenbank.
+            offen_pfad (str): CSV der offenen Bestellungen (Import/Export).
+            geschlossen_pfad (str): CSV der geschlossenen Bestellungen (Import/Export).
+            journal_pfad (str): Bestelljournal, das beim Import berücksichtigt wird.
+            id_pfad (str): Zählerdatei der Bestell_ID-Vergabe.
+        """
+        self.beobachter = []
+        self.offen_pfad = offen_pfad
+        self.geschlossen_pfad = geschlossen_pfad
+        self.id_pfad = id_pfad
+        self.datenbank_pfad = datenbank_pfad
+        neu = not os.path.isfile(datenbank_pfad)
+
+        self.verbindung = sqlite3.connect(datenbank_pfad)
+        self.verbindung.execute('PRAGMA journal_mode=WAL')
+        self.verbindung.execute('PRAGMA synchronous=NORMAL')
+        for tabelle in self.TABELLEN:
+            self._tabelle_anlegen(tabelle)
+        self._schluessel_migrieren()
+        for tabelle in self.TABELLEN:
+            self.verbindung.execute(f'CREATE INDEX IF NOT EXISTS {tabelle}_status_tisch ON {tabelle} (Status, Tischnummer)')
+            self.verbindung.execute(f'CREATE INDEX IF NOT EXISTS {tabelle}_speise_id ON {tabelle} (Speise_ID)')
+        # Abfragen eines Zeitraums lesen per Bereichssuche nur die Zeilen dieses Zeitraums
+        self.verbindung.execute('CREATE INDEX IF NOT EXISTS bestellungen_geschlossen_datum ON bestellungen_geschlossen (Datum)')
+        self.verbindung.commit()
+
+        if neu:
+            self.importieren(journal_pfad)
+        self.id_vergabe = BestellIdVergabe(id_pfad, self.hoechste_bestell_id)
+
+    def _tabelle_anlegen(self, tabelle: str, name: str | None = None) -> None:
+        """Legt eine Bestelltabelle mit ihrem Primärschlüssel an, sofern sie noch nicht existiert (optional unter anderem Namen)."""
+        self.verbindung.execute(f'''
+            CREATE TABLE IF NOT EXISTS {name or tabelle} (
+                Bestell_ID INTEGER,
+                Datum TEXT,
+                Tischnummer INTEGER,
+                Speise_ID INTEGER,
+                Speise TEXT,
+                Menge INTEGER,
+                Status TEXT,
+                PRIMARY KEY ({self.SCHLUESSEL[tabelle]})
+            )''')
+
+    def _schluessel_migrieren(self) -> None:
+        """
+        Stellt Datenbanken, deren geschlossene Bestellungen nur nach Bestell_ID geschlüsselt sind, auf (Bestell_ID, Status) um.
+        Die vorhandenen Zeilen werden übernommen.
+        """
+        tabelle = 'bestellungen_geschlossen'
+        schluessel = [spalte for _, spalte, _, _, _, position in sorted(
+            self.verbindung.execute(f'PRAGMA table_info({tabelle})'), key=lambda zeile: zeile[5]) if position > 0]
+        if schluessel != ['Bestell_ID']:
+            return
+        with self.verbindung:
+            self._tabelle_anlegen(tabelle, f'{tabelle}_neu')
+            self.verbindung.execute(f'INSERT INTO {tabelle}_neu SELECT * FROM {tabelle}')
+            self.verbindung.execute(f'DROP TABLE {tabelle}')
+            self.verbindung.execute(f'ALTER TABLE {tabelle}_neu RENAME TO {tabelle}')
+
+    # Import und Export der CSV-Dateien
+    def importieren(self, journal_pfad: str) -> None:
+        """
+        Importiert den Stand aus CSV-Snapshots und Bestelljournal in die Datenbank.
+        Das Journal wird dabei in die Snapshots kompaktiert, damit es später nicht erneut abgespielt wird.
+
+        Args:
+            journal_pfad (str): Pfad des Bestelljournals.
+        """
+        csv_speicher = CsvSpeicher(self.offen_pfad, self.geschlossen_pfad, journal_pfad, self.id_pfad, im_hintergrund=False)
+        csv_speicher.sichern()
+        with self.verbindung:
+            self.verbindung.executemany('INSERT OR REPLACE INTO bestellungen_offen VALUES (?, ?, ?, ?, ?, ?, ?)',
+                                        self._zeilen(csv_speicher.bestellungen_df))
+            # Die geschlossenen Bestellungen werden blockweise übernommen. Mehrere Zeilen einer Bestellung mit demselben
+            # Status (Teilabrechnungen) werden zusammengefasst, abgerechnete und stornierte Mengen bleiben getrennt
+            for block in csv_speicher.geschlossene_bloecke(csv_speicher.block_zeilen):
+                self.verbindung.executemany(
+                    'INSERT INTO bestellungen_geschlossen VALUES (?, ?, ?, ?, ?, ?, ?) '
+                    'ON CONFLICT(Bestell_ID, Status) DO UPDATE SET Menge = Menge + excluded.Menge',
+                    self._zeilen(block)
+                )
+
+    def sichern(self) -> None:
+        self.verbindung.commit()
+        csv_atomar_schreiben(self.bestellungen(), self.offen_pfad)
+        csv_atomar_schreiben(self.geschlossene_bestellungen(), self.geschlossen_pfad)
+
+    # Lesende Funktionen
+    def _abfrage(self, sql: str, parameter: tuple = ()) -> pd.DataFrame:
+        df = pd.read_sql_query(sql, self.verbindung, params=parameter, index_col='Bestell_ID')
+        if df.empty:
+            return leere_bestellungen()
+        df['Datum'] = datum_parsen(df['Datum'])
+        return df
+
+    def bestellungen(self, status: str | None = None, tischnummer: int | None = None, kategorie: str | None = None) -> pd.DataFrame:
+        bedingungen: list[str] = []
+        parameter: list = []
+        if status is not None:
+            bedingungen.append('Status = ?')
+            parameter.append(status)
+        if tischnummer is not None:
+            bedingungen.append('Tischnummer = ?')
+            parameter.append(int(tischnummer))
+        if kategorie is not None:
+            bedingungen.append('Speise_ID BETWEEN ? AND ?')
+            parameter.extend(KATEGORIEN[kategorie])
+        where = f' WHERE {" AND ".join(bedingungen)}' if bedingungen else ''
+        return self._abfrage(f'SELECT * FROM bestellungen_offen{where} ORDER BY Bestell_ID', tuple(parameter))
+
+    def bestellung(self, bestell_id: int) -> pd.Series:
+        df = self._abfrage('SELECT * FROM bestellungen_offen WHERE Bestell_ID = ?', (int(bestell_id),))
+        if df.empty:
+            raise KeyError(bestell_id)
+        return df.iloc[0]
+
+    def enthaelt(self, bestell_id: int) -> bool:
+        return self.verbindung.execute('SELECT 1 FROM bestellungen_offen WHERE Bestell_ID = ?', (int(bestell_id),)).fetchone() is not None
+
+    def hoechste_bestell_id(self) -> int:
+        (maximum,) = self.verbindung.execute(
+            'SELECT MAX(m) FROM (SELECT MAX(Bestell_ID) AS m FROM bestellungen_offen '
+            'UNION ALL SELECT MAX(Bestell_ID) FROM bestellungen_geschlossen)'
+        ).fetchone()
+        return int(maximum or 0)
+
+    def geschlossene_bestellungen(self, von: date | None = None, bis: date | None = None) -> pd.DataFrame:
+        bedingungen: list[str] = []
+        parameter: list = []
+        if von is not None:
+            bedingungen.append('Datum >= ?')
+            parameter.append(von.isoformat())
+        if bis is not None:
+            bedingungen.append('Datum < ?')
+            parameter.append((pd.Timestamp(bis) + pd.Timedelta(days=1)).date().isoformat())
+        sql = 'SELECT * FROM bestellungen_geschlossen'
+        if bedingungen:
+            sql += ' WHERE ' + ' AND '.join(bedingungen)
+        return self._abfrage(sql + ' ORDER BY Bestell_ID, rowid', tuple(parameter))
+
+    def geschlossene_bloecke(self, zeilen: int = 100_000) -> Iterator[pd.DataFrame]:
+        # Eigene Verbindung, deren Lesetransaktion den Stand beim Aufruf festhält (WAL); sie darf in einem anderen Thread
+        # gelesen werden, während die Hauptverbindung weiter schreibt
+        verbindung = sqlite3.connect(self.datenbank_pfad, check_same_thread=False)
+        verbindung.execute('BEGIN')
+        verbindung.execute('SELECT 1 FROM bestellungen_geschlossen LIMIT 1').fetchall()
+        return self._bloecke_lesen(verbindung, zeilen)
+
+    @staticmethod
+    def _bloecke_lesen(verbindung: sqlite3.Connection, zeilen: int) -> Iterator[pd.DataFrame]:
+        """Liest die geschlossenen Bestellungen über den Cursor blockweise (immer nur ein Block im Speicher) und schließt die Verbindung."""
+        try:
+            for block in pd.read_sql_query('SELECT * FROM bestellungen_geschlossen ORDER BY Bestell_ID, rowid', verbindung,
+                                           index_col='Bestell_ID', chunksize=zeilen):
+                block['Datum'] = datum_parsen(block['Datum'])
+                yield block
+        finally:
+            verbindung.close()
+
+    # Schreibende Funktionen
+    def anlegen(self, bestellungen: pd.DataFrame) -> None:
+        with self.verbindung:
+            self.verbindung.executemany('INSERT INTO bestellungen_offen VALUES (?, ?, ?, ?, ?, ?, ?)', self._zeilen(bestellungen))
+        self._melden('angelegt', bestellungen)
+
+    def menge_aendern(self, bestell_id: int, menge: int) -> None:
+        with self.verbindung:
+            geaendert = self.verbindung.execute('UPDATE bestellungen_offen SET Menge = ? WHERE Bestell_ID = ?',
+                                                (int(menge), int(bestell_id))).rowcount
+        if geaendert:
+            self._melden('menge_geaendert', bestell_id, menge)
+
+    def liefern(self, bestell_ids: list[int]) -> None:
+        bestell_ids = [int(i) for i in bestell_ids]
+        with self.verbindung:
+            self.verbindung.executemany("UPDATE bestellungen_offen SET Status = 'geliefert' WHERE Bestell_ID = ?",
+                                        [(i,) for i in bestell_ids])
+        if self.beobachter:
+            self._melden('geliefert', self._bestellungen_mit_ids(bestell_ids))
+
+    def stornieren(self, bestell_id: int) -> None:
+        vorher = self._bestellungen_mit_ids([int(bestell_id)]) if self.beobachter else leere_bestellungen()
+        with self.verbindung:
+            # Eine bereits abgerechnete Teilmenge behält ihre eigene Zeile mit Status 'geschlossen'
+            self.verbindung.execute(
+                "INSERT INTO bestellungen_geschlossen "
+                "SELECT Bestell_ID, Datum, Tischnummer, Speise_ID, Speise, Menge, 'storniert' FROM bestellungen_offen WHERE Bestell_ID = ? "
+                "ON CONFLICT(Bestell_ID, Status) DO UPDATE SET Menge = Menge + excluded.Menge",
+                (int(bestell_id),))
+            self.verbindung.execute('DELETE FROM bestellungen_offen WHERE Bestell_ID = ?', (int(bestell_id),))
+        self._melden('storniert', bestell_id)
+        self._abgeschlossen_melden(vorher, 'storniert')
+
+    def schliessen(self, positionen: list[tuple[int, int]]) -> None:
+        vorher = self._bestellungen_mit_ids([int(i) for i, _ in positionen]) if self.beobachter else leere_bestellungen()
+        with self.verbindung:
+            for bestell_id, menge in positionen:
+                bestell_id, menge = int(bestell_id), int(menge)
+                self.verbindung.execute(
+                    "INSERT INTO bestellungen_geschlossen "
+                    "SELECT Bestell_ID, Datum, Tischnummer, Speise_ID, Speise, ?, 'geschlossen' FROM bestellungen_offen WHERE Bestell_ID = ? "
+                    "ON CONFLICT(Bestell_ID, Status) DO UPDATE SET Menge = Menge + excluded.Menge",
+                    (menge, bestell_id))
+                self.verbindung.execute('UPDATE bestellungen_offen SET Menge = Menge - ? WHERE Bestell_ID = ?', (menge, bestell_id))
+                self.verbindung.execute('DELETE FROM bestellungen_offen WHERE Bestell_ID = ? AND Menge <= 0', (bestell_id,))
+        self._melden('geschlossen', positionen)
+        self._abgeschlossen_melden(vorher, 'geschlossen', positionen)
+
+    def _bestellungen_mit_ids(self, bestell_ids: list[int]) -> pd.DataFrame:
+        """Liest die offenen Bestellungen mit den angegebenen Bestell_IDs (in Blöcken wegen der Parametergrenze von SQLite)."""
+        teile = [
+            self._abfrage(f'SELECT * FROM bestellungen_offen WHERE Bestell_ID IN ({", ".join("?" * len(block))})', tuple(block))
+            for block in (bestell_ids[i:i + 500] for i in range(0, len(bestell_ids), 500))
+        ]
+        teile = [teil for teil in teile if not teil.empty]
+        return pd.concat(teile) if teile else leere_bestellungen()
+
+    @staticmethod
+    def _zeilen(df: pd.DataFrame) -> list[tuple]:
+        """Wandelt ein Bestell-DataFrame in Parameter-Tupel für executemany um."""
+        return [
+            (int(bestell_id), str(row['Datum']), int(row['Tischnummer']), int(row['Speise_ID']),
+             str(row['Speise']), int(row['Menge']), str(row['Status']))
+            for bestell_id, row in df[BESTELL_SPALTEN[1:]].iterrows()
+        ]
+
+
+# Erstellung der konfigurierten Speicher-Engine
+def speicher_oeffnen(engine: str = 'csv', verzeichnis: str = './data') -> Bestellspeicher:
+    """
+    Öffnet die gewählte Speicher-Engine auf den Dateien im angegebenen Verzeichnis.
+
+    Args:
+        engine (str): 'csv' (DataFrames + Bestelljournal) oder 'sqlite'.
+        verzeichnis (str): Datenverzeichnis der Anwendung.
+
+    Returns:
+        Bestellspeicher: Die geöffnete Speicher-Engine.
+    """
+    offen_pfad = os.path.join(verzeichnis, 'Bestelldaten_offen.csv')
+    geschlossen_pfad = os.path.join(verzeichnis, 'Bestelldaten_geschlossen.csv')
+    journal_pfad = os.path.join(verzeichnis, 'Bestelljournal.csv')
+    id_pfad = os.path.join(verzeichnis, 'Bestell_ID.txt')
+    archiv_verzeichnis = os.path.join(verzeichnis, 'Archiv')
+
+    if engine == 'sqlite':
+        return SqliteSpeicher(os.path.join(verzeichnis, 'Bestellungen.db'), offen_pfad, geschlossen_pfad, journal_pfad, id_pfad)
+    if engine == 'csv':
+        return CsvSpeicher(offen_pfad, geschlossen_pfad, journal_pfad, id_pfad, archiv_verzeichnis=archiv_verzeichnis)
+    raise ValueError(f'Unbekannte Speicher-Engine: {engine}')
@@ -0,0 +1,98 @@
+###
+# Bildcache der Restaurant-App
+#
+# Beschreibung:
+# Dekodiert und skaliert jedes Bild der Oberfläche (Hintergründe) nur einmal pro Zielgröße und hält das fertige
+# Tk-Bild für alle weiteren Bildschirmwechsel im Speicher. Optional wird die skalierte Fassung zusätzlich als Datei
+# abgelegt (z.B. './tkinter_pics/skaliert/Background_2_1200x800.jpg'), sodass nach einem Neustart das Original
+# nicht erneut dekodiert und verkleinert werden muss. Eine abgelegte Fassung wird neu erzeugt, sobald das Original
+# jünger ist.
+###
+
+import os
+
+from PIL import Image, ImageTk
+
+
+class Bildcache():
+    """
+    Skalierte Bilder und Tk-Bilder je (Pfad, Größe), einmal erzeugt und danach wiederverwendet.
+    """
+
+    def __init__(self, verzeichnis: str | None = './tkinter_pics/skaliert', qualitaet: int = 95) -> None:
+        """
+        Args:
+            verzeichnis (str | None): Ablage der vorskalierten Dateien, None für einen reinen Speicher-Cache.
+            qualitaet (int): JPEG-Qualität der abgelegten Fassung von JPEG-Bildern.
+        """
+        self.verzeichnis = verzeichnis
+        self.qualitaet = qualitaet
+        self._bilder: dict[tuple[str, tuple[int, int]], Image.Image] = {}
+        self._tk_bilder: dict[tuple[str, tuple[int, int]], ImageTk.PhotoImage] = {}
+
+    def bild(self, pfad: str, groesse: tuple[int, int]) -> Image.Image:
+        """
+        Gibt das auf 'groesse' skalierte Bild zurück.
+
+        Die Funktion:
+        - Liefert das Bild aus dem Speicher, wenn es bereits geladen wurde.
+        - Liest sonst die abgelegte, vorskalierte Fassung, sofern sie mindestens so neu wie das Original ist.
+        - Dekodiert und skaliert andernfalls das Original und legt das Ergebnis ab.
+
+        Args:
+            pfad (str): Pfad des Originalbildes.
+            groesse (tuple[int, int]): Zielgröße (Breite, Höhe) in Pixeln.
+
+        Returns:
+            Image.Image: Das skalierte, vollständig geladene Bild.
+        """
+        schluessel = (pfad, groesse)
+        bild = self._bilder.get(schluessel)
+        if bild is None:
+            bild = self._laden(pfad, groesse)
+            self._bilder[schluessel] = bild
+        return bild
+
+    def tk_bild(self, pfad: str, groesse: tuple[int, int]) -> ImageTk.PhotoImage:
+        """
+        Gibt das skalierte Bild als Tk-Bild zurück (erfordert ein bestehendes Tk-Hauptfenster).
+        Dasselbe Objekt wird bei jedem Aufruf wiederverwendet, dadurch bleibt auch die Referenz für Tk erhalten.
+
+        Args:
+            pfad (str): Pfad des Originalbildes.
+            groesse (tuple[int, int]): Zielgröße (Breite, Höhe) in Pixeln.
+
+        Returns:
+            ImageTk.PhotoImage: Das Tk-Bild.
+        """
+        schluessel = (pfad, groesse)
+        tk_bild = self._tk_bilder.get(schluessel)
+        if tk_bild is None:
+            tk_bild = ImageTk.PhotoImage(self.bild(pfad, groesse))
+            self._tk_bilder[schluessel] = tk_bild
+        return tk_bild
+
+    def _ablage_pfad(self, pfad: str, groesse: tuple[int, int]) -> str:
+        name, endung = os.path.splitext(os.path.basename(pfad))
+        return os.path.join(self.verzeichnis, f'{name}_{groesse[0]}x{groesse[1]}{endung}')
+
+    def _laden(self, pfad: str, groesse: tuple[int, int]) -> Image.Image:
+        """Liest die vorskalierte Fassung bzw. skaliert das Original und legt es ab."""
+        ablage = self._ablage_pfad(pfad, groesse) if self.verzeichnis else None
+        if ablage and os.path.isfile(ablage) and os.path.getmtime(ablage) >= os.path.getmtime(pfad):
+            with Image.open(ablage) as bild:
+                bild.load()
+                return bild
+
+        with Image.open(pfad) as original:
+            bild = original.resize(groesse)
+            bildformat = original.format
+
+        if ablage:
+            os.makedirs(self.verzeichnis, exist_ok=True)
+            # Über eine temporäre Datei schreiben, damit nie eine halbe Fassung gelesen wird
+            temp_pfad = f'{ablage}.tmp'
+            optionen = {'quality': self.qualitaet} if bildformat == 'JPEG' else {}
+            bild.save(temp_pfad, format=bildformat, **optionen)
+            os.replace(temp_pfad, ablage)
+        return bild
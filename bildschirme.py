@@ -0,0 +1,120 @@
+###
+# Bildschirmverwaltung der Restaurant-App
+#
+# Beschreibung:
+# Jede Navigation (z.B. 'Neue Bestellung', 'Storno / Liefern', 'Aktive Rechnungen') hat bisher ein neues LabelFrame
+# mit Bestellliste über die alten gelegt, ohne diese zu zerstören. Die Bildschirmverwaltung ersetzt dieses Stapeln:
+# - Dauerhafte Bildschirme (Bereichsframes, reine Übersichten) werden je Name einmal erzeugt und danach
+#   wiederverwendet; ihre Anzeige wird an Ort und Stelle aktualisiert.
+# - Der Inhalt eines Bereichs (z.B. das Unterframe unter den Navigationsbuttons) wird beim Wechsel ersetzt:
+#   Vorläufige Inhalte (Eingabemasken) werden zerstört, dauerhafte nur ausgeblendet.
+# Bereiche sind hierarchisch benannt ('essen', 'essen.suche'); wird ein Bereich geleert, gilt das auch für seine Unterbereiche.
+# Ob die Anzahl der Tk-Widgets über viele Wechsel gleich bleibt, prüft 'tests/test_bildschirme.py' (benötigt eine Anzeige).
+###
+
+import tkinter as tk
+from typing import Callable, TypeVar
+
+
+T = TypeVar('T')
+
+
+def widgets_zaehlen(wurzel: tk.Misc) -> int:
+    """
+    Zählt ein Widget und alle darunterliegenden Widgets.
+
+    Args:
+        wurzel (tk.Misc): Das oberste Widget (z.B. das Hauptfenster).
+
+    Returns:
+        int: Anzahl der Widgets einschließlich der Wurzel.
+    """
+    anzahl = 0
+    offen = [wurzel]
+    while offen:
+        widget = offen.pop()
+        anzahl += 1
+        offen.extend(widget.winfo_children())
+    return anzahl
+
+
+class Bildschirmverwaltung():
+    """
+    Zwischenspeicher der dauerhaften Bildschirme und aktueller Inhalt je Bereich.
+    """
+
+    def __init__(self) -> None:
+        self._bildschirme: dict[str, object] = {}
+        # Aktueller Inhalt je Bereich: (Widgets, vorläufig)
+        self._inhalte: dict[str, tuple[tuple, bool]] = {}
+
+    def bildschirm(self, name: str, erstellen: Callable[[], T]) -> T:
+        """
+        Gibt den dauerhaften Bildschirm 'name' zurück und erzeugt ihn nur beim ersten Aufruf.
+
+        Args:
+            name (str): Eindeutiger Name des Bildschirms (z.B. 'rechnungen.aktiv').
+            erstellen (Callable[[], T]): Erzeugt den Bildschirm (z.B. ein Frame oder ein Tupel aus Frame und Bestellliste).
+
+        Returns:
+            T: Der zwischengespeicherte Bildschirm.
+        """
+        if name not in self._bildschirme:
+            self.registrieren(name, erstellen())
+        return self._bildschirme[name]
+
+    def registrieren(self, name: str, bildschirm: object) -> None:
+        """Merkt sich einen fertig aufgebauten dauerhaften Bildschirm (z.B. das Frame eines Bereichs) unter 'name'."""
+        self._bildschirme[name] = bildschirm
+
+    def zeigen(self, name: str) -> tk.Misc | None:
+        """
+        Zeigt einen bereits registrierten Bereich erneut an.
+
+        Die Funktion:
+        - Holt das Frame des Bereichs nach vorne.
+        - Entfernt den Inhalt des Bereichs und seiner Unterbereiche, sodass der Bereich wie frisch geöffnet erscheint.
+
+        Args:
+            name (str): Name des Bereichs (z.B. 'essen').
+
+        Returns:
+            tk.Misc | None: Das Frame des Bereichs oder None, wenn der Bereich noch nicht erstellt wurde.
+        """
+        bereich = self._bildschirme.get(name)
+        if bereich is None:
+            return None
+        bereich.lift()
+        self.leeren(name)
+        return bereich
+
+    def wechseln(self, bereich: str, *widgets, vorlaeufig: bool = True) -> None:
+        """
+        Ersetzt den Inhalt eines Bereichs.
+
+        Die Funktion:
+        - Entfernt den bisherigen Inhalt des Bereichs und aller Unterbereiche: vorläufige Widgets werden zerstört,
+          dauerhafte nur ausgeblendet (place_forget).
+        - Merkt sich die neuen Widgets als Inhalt des Bereichs (ohne Widgets bleibt der Bereich leer).
+
+        Args:
+            bereich (str): Name des Bereichs (z.B. 'essen', Unterbereiche mit Punkt: 'essen.suche').
+            *widgets: Die neuen Inhalte (tk-Widgets oder Objekte mit 'destroy'/'place_forget', z.B. Bestellliste).
+            vorlaeufig (bool): True für Eingabemasken, die beim nächsten Wechsel zerstört werden,
+                False für dauerhafte Bildschirme, die wiederverwendet werden.
+        """
+        for name in [name for name in self._inhalte if name == bereich or name.startswith(f'{bereich}.')]:
+            alte_widgets, alt_vorlaeufig = self._inhalte.pop(name)
+            for widget in alte_widgets:
+                if any(widget is neu for neu in widgets):
+                    continue
+                if alt_vorlaeufig:
+                    widget.destroy()
+                else:
+                    widget.place_forget()
+        if widgets:
+            self._inhalte[bereich] = (widgets, vorlaeufig)
+
+    def leeren(self, bereich: str) -> None:
+        """Entfernt den Inhalt eines Bereichs und seiner Unterbereiche (siehe 'wechseln')."""
+        self.wechseln(bereich)
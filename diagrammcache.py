@@ -0,0 +1,118 @@
+###
+# Diagrammcache des Finanzberichts
+#
+# Beschreibung:
+# Jedes Diagramm des Finanzberichts wird über einen Hash seiner Eingangsdaten (die bereits gruppierten Mengen bzw.
+# Umsätze, Titel und Art des Diagramms) identifiziert und als './Statistik/<name>_<hash>.png' abgelegt. Wird ein
+# Bericht für denselben Zeitraum erneut erstellt, ohne dass seither Bestellungen abgeschlossen wurden, stimmen die
+# Hashes überein und die Bilder werden ohne erneutes Plotten wiederverwendet.
+# Der Cache ist auf eine Anzahl Bilder begrenzt. Die Änderungszeit der Datei dient als Zeitpunkt der letzten
+# Verwendung (wird bei jedem Treffer aktualisiert), sodass beim Aufräumen die am längsten nicht verwendeten
+# Bilder entfernt werden (LRU) und die Reihenfolge auch nach einem Neustart erhalten bleibt.
+###
+
+import hashlib
+import os
+import re
+
+import pandas as pd
+
+
+# Version der Diagrammdarstellung; bei Änderungen an den Renderfunktionen erhöhen, damit alte Bilder nicht mehr passen
+DIAGRAMM_VERSION: int = 2
+
+# Name der abgelegten Bilder: <name>_<16 Hex-Zeichen>.png
+BILD_MUSTER = re.compile(r'^.+_[0-9a-f]{16}\.png$')
+
+
+def daten_hash(name: str, *daten) -> str:
+    """
+    Berechnet den Schlüssel eines Diagramms aus seinen Eingangsdaten.
+
+    Args:
+        name (str): Art des Diagramms (z.B. 'essen_zaehlung').
+        *daten: Eingangsdaten (pd.Series, pd.DataFrame oder Werte wie der Titel).
+
+    Returns:
+        str: Die ersten 16 Hex-Zeichen des SHA-256-Hashs.
+    """
+    hash_ = hashlib.sha256(f'{DIAGRAMM_VERSION}|{name}'.encode('utf-8'))
+    for wert in daten:
+        if isinstance(wert, (pd.Series, pd.DataFrame)):
+            # Werte, Index und Spaltennamen gehen in den Hash ein (gleiche Werte unter anderem Namen ergeben ein anderes Bild)
+            if isinstance(wert, pd.Series):
+                aufbau = ('Series', wert.name, wert.index.name, str(wert.dtype))
+            else:
+                aufbau = ('DataFrame', list(wert.columns), wert.index.name, [str(dtype) for dtype in wert.dtypes])
+            hash_.update(repr(aufbau).encode('utf-8'))
+            hash_.update(pd.util.hash_pandas_object(wert, index=True).to_numpy().tobytes())
+        else:
+            hash_.update(repr(wert).encode('utf-8'))
+        hash_.update(b'|')
+    return hash_.hexdigest()[:16]
+
+
+class Diagrammcache():
+    """
+    Abgelegte Diagramme je Daten-Hash mit begrenzter Anzahl und LRU-Verdrängung.
+    """
+
+    def __init__(self, verzeichnis: str = './Statistik', max_bilder: int = 100) -> None:
+        """
+        Args:
+            verzeichnis (str): Ablage der Bilder.
+            max_bilder (int): Höchstzahl abgelegter Bilder; darüber werden die am längsten nicht verwendeten entfernt.
+        """
+        self.verzeichnis = verzeichnis
+        self.max_bilder = max_bilder
+
+    def pfad(self, name: str, schluessel: str) -> str:
+        """Gibt den Pfad des Bildes 'name' mit dem Daten-Hash 'schluessel' zurück."""
+        return os.path.join(self.verzeichnis, f'{name}_{schluessel}.png')
+
+    def nachschlagen(self, pfad: str) -> bool:
+        """
+        Prüft, ob ein Bild bereits abgelegt ist, und markiert es bei einem Treffer als zuletzt verwendet.
+
+        Args:
+            pfad (str): Pfad aus 'pfad'.
+
+        Returns:
+            bool: True, wenn das Bild wiederverwendet werden kann.
+        """
+        try:
+            os.utime(pfad)
+        except OSError:
+            return False
+        return True
+
+    def aufraeumen(self) -> list[str]:
+        """
+        Entfernt die am längsten nicht verwendeten Bilder, bis höchstens 'max_bilder' abgelegt sind.
+
+        Returns:
+            list[str]: Die entfernten Pfade.
+        """
+        try:
+            namen = [name for name in os.listdir(self.verzeichnis) if BILD_MUSTER.match(name)]
+        except OSError:
+            return []
+        if len(namen) <= self.max_bilder:
+            return []
+
+        bilder = []
+        for name in namen:
+            pfad = os.path.join(self.verzeichnis, name)
+            try:
+                bilder.append((os.path.getmtime(pfad), pfad))
+            except OSError:
+                continue
+        bilder.sort()
+        entfernt: list[str] = []
+        for _, pfad in bilder[:max(0, len(bilder) - self.max_bilder)]:
+            try:
+                os.remove(pfad)
+                entfernt.append(pfad)
+            except OSError:
+                continue
+        return entfernt
@@ -0,0 +1,578 @@
+###
+# Finanzbericht der Restaurant-App
+#
+# Beschreibung:
+# Erstellt aus den Summen je Speise der Umsatzstatistik die Diagramme (Zählung Essen, Getränke, Stornos, Umsatz)
+# und den Finanzbericht als PDF. Der Bericht ist unabhängig von der Oberfläche, sodass er auch ohne Anzeige
+# (z.B. in den Benchmarks) erstellt und gemessen werden kann. matplotlib, seaborn und fpdf werden erst beim
+# ersten Bericht geladen und verlängern den Programmstart nicht.
+# Die Umsatztabelle wird als durchsuchbarer Text mit automatischen Spaltenbreiten in das PDF geschrieben und bei
+# langen Karten über mehrere Seiten mit wiederholter Kopfzeile fortgesetzt.
+# Die vier Diagramme werden aus kleinen, bereits gruppierten Daten in einem Prozess-Pool mit dem nicht-interaktiven
+# Backend 'Agg' gleichzeitig gerendert, statt nacheinander im Tk-Thread. Der Pool wird beim ersten Bericht gestartet
+# und danach wiederverwendet; die Laufzeit eines Berichts liegt damit nahe an der des langsamsten Diagramms.
+# Bereits gerenderte Diagramme mit identischen Eingangsdaten werden aus dem Diagrammcache wiederverwendet.
+# Die Diagramme werden als PNG ohne Alphakanal gespeichert, damit fpdf sie beim Einbetten nicht Pixel für Pixel
+# in Farbe und Transparenzmaske zerlegen muss.
+# Der Bericht meldet auf Wunsch jede Stufe (Auswerten, Diagramme, PDF) und kann zwischen den Stufen sowie während
+# des Wartens auf die Diagramme abgebrochen werden (z.B. als Hintergrundauftrag der Oberfläche, siehe 'berichtsauftrag').
+###
+
+import os
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime
+from typing import Callable, Iterable
+
+import numpy as np
+import pandas as pd
+
+from diagrammcache import Diagrammcache, daten_hash
+
+
+# Anzahl der Diagramme je Bericht (obere Grenze für die Worker-Prozesse)
+ANZAHL_DIAGRAMME: int = 4
+
+# Stufen eines Berichts in der Reihenfolge ihrer Meldung
+STUFEN: tuple[str, ...] = ('Auswerten', 'Diagramme', 'PDF')
+
+# Gemeinsamer Prozess-Pool für die Diagramme (beim ersten Bericht gestartet)
+_diagramm_pool: ProcessPoolExecutor | None = None
+
+
+class BerichtAbgebrochen(Exception):
+    """Der Bericht wurde über das Abbruch-Ereignis abgebrochen."""
+
+
+def abbruch_pruefen(abbruch: threading.Event | None) -> None:
+    """
+    Bricht den Bericht ab, wenn das Abbruch-Ereignis gesetzt ist.
+
+    Raises:
+        BerichtAbgebrochen: Wenn 'abbruch' gesetzt ist.
+    """
+    if abbruch is not None and abbruch.is_set():
+        raise BerichtAbgebrochen()
+
+
+def _agg_laden() -> None:
+    """Stellt matplotlib auf das nicht-interaktive Backend 'Agg' um (Worker-Prozesse und Rendern ohne Pool)."""
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def diagramm_pool() -> ProcessPoolExecutor | None:
+    """
+    Gibt den Prozess-Pool für die Diagramme zurück und startet ihn beim ersten Aufruf.
+
+    Returns:
+        ProcessPoolExecutor | None: Der Pool oder None auf Rechnern mit nur einem Kern (dort wird nacheinander gerendert).
+    """
+    global _diagramm_pool
+    kerne = os.cpu_count() or 1
+    if kerne < 2:
+        return None
+    if _diagramm_pool is None:
+        _diagramm_pool = ProcessPoolExecutor(max_workers=min(ANZAHL_DIAGRAMME, kerne), initializer=_agg_laden)
+    return _diagramm_pool
+
+
+def diagramm_pool_beenden() -> None:
+    """Beendet die Worker-Prozesse des Diagramm-Pools (z.B. beim Programmende)."""
+    global _diagramm_pool
+    if _diagramm_pool is not None:
+        _diagramm_pool.shutdown(wait=False, cancel_futures=True)
+        _diagramm_pool = None
+
+
+def diagramme_rendern(auftraege: list[tuple], parallel: bool = True, abbruch: threading.Event | None = None) -> list[str]:
+    """
+    Rendert mehrere Diagramme und wartet, bis alle Bilddateien geschrieben sind.
+
+    Die Funktion:
+    - Verteilt die Aufträge auf den Prozess-Pool und sammelt die Ergebnisse in der Reihenfolge der Aufträge.
+    - Rendert ohne Pool (ein Kern, 'parallel' False) oder nach einem Ausfall des Pools nacheinander im aufrufenden Prozess.
+    - Prüft beim Warten auf den Pool bzw. vor jedem Diagramm das Abbruch-Ereignis; noch nicht begonnene Diagramme
+      werden dann verworfen.
+
+    Args:
+        auftraege (list[tuple]): Je Diagramm (Renderfunktion, *Argumente); die Funktion gibt den Pfad der Bilddatei zurück.
+        parallel (bool): Den Prozess-Pool verwenden.
+        abbruch (threading.Event | None): Abbruch-Ereignis des Berichts.
+
+    Raises:
+        BerichtAbgebrochen: Wenn 'abbruch' gesetzt wurde.
+
+    Returns:
+        list[str]: Die Pfade der Bilddateien.
+    """
+    global _diagramm_pool
+    pool = diagramm_pool() if parallel else None
+    if pool is not None:
+        try:
+            futures = [pool.submit(funktion, *args) for funktion, *args in auftraege]
+            offen = set(futures)
+            while offen:
+                if abbruch is not None and abbruch.is_set():
+                    # Nicht begonnene Diagramme verwerfen, laufende noch beenden lassen (sie schreiben ihre Datei)
+                    for future in offen:
+                        future.cancel()
+                    wait(offen)
+                    raise BerichtAbgebrochen()
+                offen = wait(offen, timeout=0.1, return_when=FIRST_EXCEPTION).not_done
+            return [future.result() for future in futures]
+        except BrokenProcessPool:
+            # Abgestürzter Worker: Pool verwerfen (der nächste Bericht startet einen neuen) und hier nacheinander rendern
+            _diagramm_pool = None
+
+    _agg_laden()
+    pfade: list[str] = []
+    for funktion, *args in auftraege:
+        abbruch_pruefen(abbruch)
+        pfade.append(funktion(*args))
+    return pfade
+
+
+def diagramme_erstellen(auftraege: list[tuple], cache: Diagrammcache, parallel: bool = True,
+                        abbruch: threading.Event | None = None) -> dict[str, str]:
+    """
+    Gibt die Bilder der Diagramme zurück und rendert nur die, deren Eingangsdaten sich geändert haben.
+
+    Die Funktion:
+    - Bestimmt je Diagramm den Daten-Hash und verwendet ein vorhandenes Bild mit diesem Hash wieder.
+    - Rendert die übrigen Diagramme gemeinsam (siehe 'diagramme_rendern') zunächst in temporäre Dateien und
+      übernimmt sie erst danach, sodass nie ein halb geschriebenes Bild im Cache liegt.
+    - Entfernt anschließend die am längsten nicht verwendeten Bilder über der Obergrenze des Caches.
+
+    Args:
+        auftraege (list[tuple]): Je Diagramm (Renderfunktion, Name, *Daten); die Renderfunktion erhält die Daten
+            und als letztes Argument den Pfad der Bilddatei.
+        cache (Diagrammcache): Ablage der Bilder.
+        parallel (bool): Fehlende Diagramme im Prozess-Pool rendern.
+        abbruch (threading.Event | None): Abbruch-Ereignis des Berichts.
+
+    Raises:
+        BerichtAbgebrochen: Wenn 'abbruch' gesetzt wurde (es werden keine neuen Bilder übernommen).
+
+    Returns:
+        dict[str, str]: Pfad des Bildes je Name.
+    """
+    bilder: dict[str, str] = {}
+    fehlend: list[tuple] = []
+    ziele: list[str] = []
+    for funktion, name, *daten in auftraege:
+        pfad = cache.pfad(name, daten_hash(name, *daten))
+        bilder[name] = pfad
+        if not cache.nachschlagen(pfad):
+            fehlend.append((funktion, *daten, f'{os.path.splitext(pfad)[0]}.tmp.png'))
+            ziele.append(pfad)
+
+    if fehlend:
+        try:
+            temp_pfade = diagramme_rendern(fehlend, parallel=parallel, abbruch=abbruch)
+        except BerichtAbgebrochen:
+            # Bereits gerenderte temporäre Dateien entfernen
+            for *_, temp_pfad in fehlend:
+                if os.path.isfile(temp_pfad):
+                    os.remove(temp_pfad)
+            raise
+        for temp_pfad, pfad in zip(temp_pfade, ziele):
+            os.replace(temp_pfad, pfad)
+        cache.aufraeumen()
+    return bilder
+
+
+# Renderfunktionen (laufen in den Worker-Prozessen und erhalten nur die gruppierten Daten)
+def bild_speichern(fig, pfad: str) -> None:
+    """
+    Speichert eine Abbildung als PNG ohne Alphakanal.
+
+    fpdf entpackt bei PNGs mit Alphakanal jedes Pixel in Python, um die Transparenz als eigene Maske abzulegen;
+    ein RGB-Bild wird dagegen unverändert übernommen. Da die Diagramme ohnehin einen weißen Hintergrund haben,
+    wird das Bild vor dem Speichern nach RGB umgewandelt.
+
+    Args:
+        fig (matplotlib.figure.Figure): Die Abbildung.
+        pfad (str): Pfad der Bilddatei.
+    """
+    import io
+
+    from PIL import Image
+
+    puffer = io.BytesIO()
+    fig.savefig(puffer, format='png', transparent=False, facecolor='white', bbox_inches="tight")
+    puffer.seek(0)
+    with Image.open(puffer) as bild:
+        bild.convert('RGB').save(pfad, format='PNG')
+
+
+def balkendiagramm_speichern(menge: pd.Series, titel: str, pfad: str) -> str:
+    """
+    Speichert ein Balkendiagramm der Mengen je Speise.
+
+    Args:
+        menge (pd.Series): Menge je Speise (Index: Speise).
+        titel (str): Der Titel des Diagramms.
+        pfad (str): Pfad der Bilddatei.
+
+    Returns:
+        str: Pfad der Bilddatei.
+    """
+    import seaborn as sns
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(8, 4))
+    ax = fig.subplots()
+    data = menge.to_frame()
+    sns.barplot(data=data, x=data.index, y='Menge', ax=ax)
+    ax.set_title(titel)
+    ax.tick_params(axis='x', labelrotation=45)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment('right')
+    bild_speichern(fig, pfad)
+    return pfad
+
+
+def umsatzdiagramm_speichern(umsatzzählung: pd.DataFrame, pfad: str) -> str:
+    """
+    Speichert das Diagramm für Menge (Balken) und Umsatz (Linie, zweite Achse) je Speise.
+
+    Args:
+        umsatzzählung (pd.DataFrame): Menge und Umsatz je Speise.
+        pfad (str): Pfad der Bilddatei.
+
+    Returns:
+        str: Pfad der Bilddatei.
+    """
+    import seaborn as sns
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(12, 8))
+    ax1 = fig.subplots()
+    sns.barplot(x=umsatzzählung.index, y=umsatzzählung['Menge'], ax=ax1, color='blue', label='Menge')
+    ax1.set_xlabel('Speise')
+    ax1.set_ylabel('Anzahl Speise', color='blue')
+    ax1.tick_params(axis='y', labelcolor='blue')
+
+    # Setzen der Ticks und Labels sicherstellen
+    ax1.set_xticks(np.arange(len(umsatzzählung.index)))
+    ax1.set_xticklabels(umsatzzählung.index, rotation=45, ha='right')
+
+    ax2 = ax1.twinx()
+    ax2.plot(umsatzzählung.index, umsatzzählung['Umsatz_in_Euro'], color='red', marker='o', label='Umsatz')
+    ax2.set_ylabel('Umsatz (EUR)', color='red')
+    ax2.tick_params(axis='y', labelcolor='red')
+
+    ax2.set_title('Menge und Umsatz pro Speise')
+    ax1.legend(loc='upper left')
+    ax2.legend(loc='upper right')
+    fig.tight_layout()
+    bild_speichern(fig, pfad)
+    return pfad
+
+
+def finanzbericht_erstellen(summen_df: pd.DataFrame, von: date | None = None, bis: date | None = None,
+                            verzeichnis: str = './Statistik', parallel: bool = True, cache: Diagrammcache | None = None,
+                            fortschritt: Callable[[str], None] | None = None, abbruch: threading.Event | None = None) -> str:
+    """
+    Erstellt Diagramme und Finanzbericht eines Zeitraums.
+
+    Dieser Bericht umfasst:
+    - Aufteilen der Summen je Speise in Essen, Getränke und Stornos.
+    - Erstellen von Diagrammen für Essen, Getränke und Stornos sowie für Menge und Umsatz je Speise (parallel im Prozess-Pool).
+    - Erstellen eines PDFs mit einer Zusammenfassung, Tabellen und Diagrammen.
+
+    Args:
+        summen_df (pd.DataFrame): Summen je Speise aus 'Umsatzstatistik.summen' (nicht leer).
+        von (date | None): Erster Tag des Zeitraums (einschließlich), None für unbegrenzt.
+        bis (date | None): Letzter Tag des Zeitraums (einschließlich), None für unbegrenzt.
+        verzeichnis (str): Verzeichnis für Diagramme und Bericht (wird bei Bedarf angelegt).
+        parallel (bool): Diagramme im Prozess-Pool rendern (False: nacheinander im aufrufenden Prozess).
+        cache (Diagrammcache | None): Ablage der Diagramme, None für einen Cache in 'verzeichnis'.
+        fortschritt (Callable[[str], None] | None): Wird zu Beginn jeder Stufe (siehe STUFEN) mit ihrem Namen aufgerufen.
+        abbruch (threading.Event | None): Abbruch-Ereignis; wird vor jeder Stufe und beim Warten auf die Diagramme geprüft.
+
+    Raises:
+        BerichtAbgebrochen: Wenn 'abbruch' gesetzt wurde, bevor das PDF geschrieben ist.
+
+    Returns:
+        str: Absoluter Pfad der erstellten PDF-Datei.
+    """
+    def stufe(name: str) -> None:
+        """Prüft den Abbruch und meldet den Beginn einer Stufe."""
+        abbruch_pruefen(abbruch)
+        if fortschritt is not None:
+            fortschritt(name)
+
+    # PDF-Bibliothek erst beim ersten Bericht laden (verkürzt den Programmstart)
+    from fpdf import FPDF
+
+    os.makedirs(verzeichnis, exist_ok=True)
+
+    stufe('Auswerten')
+    # Essen und Getränke filtern
+    essen_df: pd.DataFrame = summen_df[summen_df['Kategorie'] == 'essen']  # Filtere Essen
+    getraenke_df: pd.DataFrame = summen_df[summen_df['Kategorie'] == 'getraenke']  # Filtere Getränke
+
+    # Bestellte Mengen (abgerechnet und storniert) und Stornos je Speise, einmal berechnet für Diagramme und Tabellen
+    essen_menge: pd.Series = (essen_df['Menge'] + essen_df['Storno_Menge']).groupby(essen_df['Speise']).sum().sort_values(ascending=False)
+    getraenke_menge: pd.Series = (getraenke_df['Menge'] + getraenke_df['Storno_Menge']).groupby(getraenke_df['Speise']).sum().sort_values(ascending=False)
+    stornos_menge: pd.Series = summen_df['Storno_Menge'].groupby(summen_df['Speise']).sum()
+    stornos_menge = stornos_menge[stornos_menge > 0].sort_values(ascending=False)
+    for menge in (essen_menge, getraenke_menge, stornos_menge):
+        menge.name = 'Menge'
+
+    # Umsatzdaten vorbereiten (nur abgerechnete Mengen, Umsatz zum Preis der Abrechnung)
+    umsatzzählung: pd.DataFrame = (summen_df[summen_df['Menge'] > 0]
+                                .rename(columns={'Umsatz': 'Umsatz_in_Euro'})
+                                .groupby('Speise')[['Menge', 'Umsatz_in_Euro']].sum().round(2)
+                                .sort_values('Umsatz_in_Euro', ascending=False))  # Berechne Umsatzdaten
+
+    # Diagramme aus den kleinen, bereits gruppierten Daten parallel rendern bzw. bei unveränderten Daten aus dem
+    # Cache übernehmen; das PDF wird erst danach zusammengesetzt
+    stufe('Diagramme')
+    bilder: dict[str, str] = diagramme_erstellen([
+        (balkendiagramm_speichern, 'essen_zaehlung', essen_menge, 'Zählung Essen'),
+        (balkendiagramm_speichern, 'getraenke_zaehlung', getraenke_menge, 'Zählung Getränke'),
+        (balkendiagramm_speichern, 'storno_zaehlung', stornos_menge, 'Zählung Stornos'),
+        (umsatzdiagramm_speichern, 'umsatz', umsatzzählung)
+    ], cache or Diagrammcache(verzeichnis), parallel=parallel, abbruch=abbruch)
+
+    stufe('PDF')
+
+    # Dynamisches Datum beziehen
+    current_date: str = datetime.now().strftime("%d. %B %Y")  # Erhalte das aktuelle Datum im Format Tag. Monat Jahr
+    # Beschreibung des Berichtszeitraums
+    if von is None and bis is None:
+        zeitraum: str = f'Bis zum {current_date}'
+    else:
+        zeitraum = (f'Im Zeitraum vom {von.strftime("%d.%m.%Y") if von else "Beginn"} '
+                    f'bis zum {bis.strftime("%d.%m.%Y") if bis else current_date}')
+
+    # Bericht erstellen
+    class PDF(FPDF):
+        def header(self) -> None:
+            """
+            Fügt den Header der PDF hinzu.
+
+            Returns:
+                None
+            """
+            self.set_font('Arial', 'B', 16)
+            self.cell(0, 10, f'Finanzbericht - {zeitraum}', 0, 1, 'C')
+            self.ln(10)
+
+        def chapter_title(self, title: str) -> None:
+            """
+            Fügt den Titel eines Kapitels hinzu.
+
+            Args:
+                title (str): Der Titel des Kapitels.
+
+            Returns:
+                None
+            """
+            self.set_font('Arial', 'B', 14)
+            self.cell(0, 10, title, 0, 1, 'L')
+            self.ln(5)
+
+        def chapter_body(self, body: str) -> None:
+            """
+            Fügt den Textkörper eines Kapitels hinzu.
+
+            Args:
+                body (str): Der Textkörper des Kapitels.
+
+            Returns:
+                None
+            """
+            self.set_font('Arial', '', 12)
+            self.multi_cell(0, 10, body)
+            self.ln()
+
+        def add_image(self, image_path: str, x: int = 10, y: int = 10, w: int = 200, h: int = 150) -> None:
+            """
+            Fügt ein Bild zur PDF hinzu.
+
+            Args:
+                image_path (str): Der Pfad zum Bild.
+                x (int): Die X-Position des Bildes.
+                y (int): Die Y-Position des Bildes.
+                w (int): Die Breite des Bildes.
+                h (int): Die Höhe des Bildes.
+
+            Returns:
+                None
+            """
+            self.image(image_path, x=x, y=y, w=w, h=h)
+
+        def add_table(self, data: Iterable, col_labels: list, title: str, col_widths: list[float] | None = None,
+                      aligns: list[str] | None = None, row_height: float = 8) -> None:
+            """
+            Fügt eine Tabelle zur PDF hinzu und schreibt die Zeilen fortlaufend als Text.
+
+            Die Funktion:
+            - Bestimmt ohne 'col_widths' die Spaltenbreiten aus den Texten (siehe 'table_col_widths').
+            - Schreibt die Zeilen einzeln aus 'data' (z.B. einem Generator), ohne die Tabelle vorher aufzubauen.
+            - Beginnt vor einer Zeile, die nicht mehr auf die Seite passt, eine neue Seite und wiederholt dort die Kopfzeile.
+
+            Args:
+                data (Iterable): Die Zeilen der Tabelle (je Zeile eine Folge von Werten).
+                col_labels (list): Die Spaltenbezeichnungen der Tabelle.
+                title (str): Der Titel der Tabelle.
+                col_widths (list[float] | None): Spaltenbreiten in mm, None für automatische Breiten.
+                aligns (list[str] | None): Ausrichtung je Spalte ('L', 'C', 'R'), None für zentriert.
+                row_height (float): Zeilenhöhe in mm.
+
+            Returns:
+                None
+            """
+            col_labels = [str(col_label) for col_label in col_labels]
+            if col_widths is None:
+                data = [[str(cell) for cell in row] for row in data]
+                col_widths = self.table_col_widths(col_labels, [list(spalte) for spalte in zip(*data)])
+            aligns = aligns or ['C'] * len(col_labels)
+
+            def header_row() -> None:
+                self.set_font('Arial', 'B', 10)
+                for col_label, width in zip(col_labels, col_widths):
+                    self.cell(width, row_height, col_label, 1, 0, 'C')
+                self.ln()
+                self.set_font('Arial', '', 10)
+
+            # Titel, Kopfzeile und erste Zeile nicht vom Rest der Tabelle trennen
+            if self.get_y() + 15 + 2 * row_height > self.page_break_trigger:
+                self.add_page()
+            self.set_font('Arial', 'B', 12)
+            self.cell(0, 10, title, 0, 1, 'L')
+            self.ln(5)
+            header_row()
+            for row in data:
+                if self.get_y() + row_height > self.page_break_trigger:
+                    self.add_page()
+                    header_row()
+                for cell, width, align in zip(row, col_widths, aligns):
+                    self.cell(width, row_height, str(cell), 1, 0, align)
+                self.ln()
+            self.ln()
+
+        def table_col_widths(self, col_labels: list[str], columns: list[list[str]], max_candidates: int = 5) -> list[float]:
+            """
+            Berechnet Spaltenbreiten aus der Kopfzeile und den längsten Texten jeder Spalte.
+
+            Gemessen werden je Spalte nur die Texte mit den meisten Zeichen, nicht jede Zelle. Ist die Tabelle breiter
+            als die Seite, werden alle Spalten im gleichen Verhältnis verkleinert.
+
+            Args:
+                col_labels (list[str]): Die Spaltenbezeichnungen (fett gemessen).
+                columns (list[list[str]]): Die Texte je Spalte.
+                max_candidates (int): Anzahl der längsten Texte, die je Spalte gemessen werden.
+
+            Returns:
+                list[float]: Breite je Spalte in mm.
+            """
+            padding = 4 * self.c_margin
+            self.set_font('Arial', 'B', 10)
+            widths = [self.get_string_width(col_label) + padding for col_label in col_labels]
+            self.set_font('Arial', '', 10)
+            for i, column in enumerate(columns):
+                candidates = sorted(column, key=len, reverse=True)[:max_candidates]
+                widths[i] = max([widths[i]] + [self.get_string_width(text) + padding for text in candidates])
+
+            page_width = self.w - self.l_margin - self.r_margin
+            if sum(widths) > page_width:
+                widths = [width * page_width / sum(widths) for width in widths]
+            return widths
+
+        def add_dataframe(self, df: pd.DataFrame, title: str, decimals: int = 2) -> None:
+            """
+            Fügt einen DataFrame (einschließlich Index) als Tabelle mit automatischen Spaltenbreiten hinzu.
+
+            Die Werte werden spaltenweise formatiert (Kommazahlen mit 'decimals' Nachkommastellen, Zahlen rechtsbündig)
+            und anschließend Zeile für Zeile an 'add_table' übergeben.
+
+            Args:
+                df (pd.DataFrame): Die Daten der Tabelle.
+                title (str): Der Titel der Tabelle.
+                decimals (int): Nachkommastellen für Kommazahlen.
+
+            Returns:
+                None
+            """
+            df = df.reset_index()
+            columns: list[list[str]] = []
+            aligns: list[str] = []
+            for name in df.columns:
+                spalte = df[name]
+                if pd.api.types.is_float_dtype(spalte):
+                    columns.append([f'{wert:.{decimals}f}' for wert in spalte])
+                else:
+                    columns.append(spalte.astype(str).tolist())
+                aligns.append('R' if pd.api.types.is_numeric_dtype(spalte) else 'L')
+            col_labels = [str(name) for name in df.columns]
+            self.add_table(zip(*columns), col_labels, title, self.table_col_widths(col_labels, columns), aligns)
+
+    pdf: PDF = PDF()  # Erstelle eine neue PDF-Instanz
+    pdf.add_page()  # Füge eine Seite zur PDF hinzu
+
+    # Titel und Bericht
+    pdf.chapter_title('Zusammenfassung der Bestellungen')
+
+    # Berechnungen für Bericht
+    top_essen: pd.DataFrame = essen_menge.head(3).to_frame().reset_index()
+    top_getraenke: pd.DataFrame = getraenke_menge.head(3).to_frame().reset_index()
+    top_stornos: pd.DataFrame = stornos_menge.head(3).to_frame().reset_index()
+
+    gesamt_umsatz: float = umsatzzählung['Umsatz_in_Euro'].sum()
+    gesamt_menge: int = umsatzzählung['Menge'].sum()
+    # Anzahl der Bestellpositionen (abgerechnet und storniert)
+    anzahl_essen: int = int(essen_df['Anzahl'].sum() + essen_df['Storno_Anzahl'].sum())
+    anzahl_getraenke: int = int(getraenke_df['Anzahl'].sum() + getraenke_df['Storno_Anzahl'].sum())
+    anzahl_stornos: int = int(summen_df['Storno_Anzahl'].sum())
+
+    bericht: str = (
+        f"{zeitraum} wurden insgesamt {anzahl_essen + anzahl_getraenke} Bestellungen im Restaurant verarbeitet. "
+        "Die Bestellungen umfassen sowohl Essens- als auch Getränkepositionen, die in den folgenden Kategorien zusammengefasst werden:\n\n"
+        f"- **Essen**: {anzahl_essen} Bestellungen\n"
+        f"- **Getränke**: {anzahl_getraenke} Bestellungen\n"
+        f"- **Stornos**: {anzahl_stornos} Bestellungen\n\n"
+        "Detailanalyse der Bestellungen:\n"
+        "1. **Essen**\n"
+        f"Top 3 Speisen nach Menge:\n"
+        "2. **Getränke**\n"
+        f"Top 3 Getränke nach Menge:\n"
+        "3. **Stornos**\n"
+        f"Top 3 stornierte Speisen nach Menge:\n\n"
+        f"**Gesamtumsatz**: {gesamt_umsatz:.2f} EUR\n"
+        f"**Gesamtmenge verkauft**: {gesamt_menge}\n"
+        "Umsatzanalyse zeigt die wichtigsten Verkaufspositionen des Zeitraums. Top-3 Essen und Getränke sowie Stornos sind detailliert dargestellt."
+    )
+    # Füge den Bericht zum PDF hinzu
+    pdf.chapter_body(bericht)  
+
+    # Tabellen hinzufügen
+    pdf.add_page()
+    pdf.add_table(top_essen.values, top_essen.columns, "Top 3 Essen nach Menge")
+    pdf.add_table(top_getraenke.values, top_getraenke.columns, "Top 3 Getränke nach Menge")
+    pdf.add_table(top_stornos.values, top_stornos.columns, "Top 3 Stornos nach Menge")
+
+    # Seite 3: Diagramme hinzufügen
+    pdf.add_page()
+    pdf.add_image(bilder['essen_zaehlung'], x=5, y=20, w=150, h=100)
+    pdf.ln(80)
+    pdf.add_image(bilder['getraenke_zaehlung'], x=5, y=130, w=150, h=100)
+
+    # Seite 4: Umsatztabelle als Text (beliebig viele Speisen, bei Bedarf über mehrere Seiten)
+    pdf.add_page()
+    pdf.add_dataframe(umsatzzählung, 'Menge und Umsatz je Speise')
+
+    # Letzte Seite: Diagramm Menge und Umsatz
+    pdf.add_page()
+    pdf.add_image(bilder['umsatz'], x=5, y=30, w=200, h=150)
+
+    # Speichern
+    file_name = os.path.join(verzeichnis, f'Finanzbericht_{datetime.now().strftime("%d_%B_%Y_%H-%M-%S")}.pdf')
+    abbruch_pruefen(abbruch)
+    pdf.output(file_name)  # Speichere die PDF-Datei
+    return os.path.abspath(file_name)
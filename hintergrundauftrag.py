@@ -0,0 +1,97 @@
+###
+# Hintergrundaufträge der Restaurant-App
+#
+# Beschreibung:
+# Gemeinsame Grundlage für Arbeiten, die in einem Worker-Pool laufen und deren Ergebnis im Tk-Hauptthread
+# ausgeliefert wird (PDF-Rechnungen, Finanzbericht). Tk darf nur aus dem Hauptthread bedient werden; deshalb
+# melden die Worker nichts selbst, sondern der Hauptthread fragt über 'after' regelmäßig ab, welche Aufträge
+# fertig sind, solange noch Aufträge offen sind.
+###
+
+import tkinter as tk
+import webbrowser
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, Future
+from typing import Callable
+
+
+class Hintergrundauftrag(ABC):
+    """
+    Aufträge in einem Worker-Pool, deren Ergebnisse über 'after' im Tk-Hauptthread ausgeliefert werden.
+    """
+
+    def __init__(self, widget: tk.Misc, executor: Executor, intervall_ms: int = 100,
+                 oeffnen: Callable[[str], object] = webbrowser.open_new) -> None:
+        """
+        Args:
+            widget (tk.Misc): Beliebiges Tk-Widget, über dessen 'after' die Aufträge abgefragt werden.
+            executor (Executor): Worker-Pool für die Aufträge.
+            intervall_ms (int): Abstand der Abfragen in Millisekunden, solange Aufträge offen sind.
+            oeffnen (Callable[[str], object]): Wird im Hauptthread mit dem Pfad jeder fertigen Datei aufgerufen.
+        """
+        self.widget = widget
+        self.executor = executor
+        self.intervall_ms = intervall_ms
+        self.oeffnen = oeffnen
+        # Offene Aufträge mit ihrem Kontext (z.B. Dateiname) in der Reihenfolge der Übergabe
+        self.auftraege: list[tuple[object, Future]] = []
+        self._abfrage_geplant = False
+
+    @property
+    def laeuft(self) -> bool:
+        """True, solange noch Aufträge offen sind."""
+        return bool(self.auftraege)
+
+    def _einreichen(self, kontext: object, funktion: Callable, *args, **kwargs) -> Future:
+        """
+        Übergibt einen Auftrag an den Worker-Pool und startet die Abfrage, falls sie nicht bereits läuft.
+
+        Args:
+            kontext (object): Wird beim Ausliefern mit dem Ergebnis übergeben (z.B. der Dateiname).
+            funktion (Callable): Die im Worker auszuführende Funktion.
+            *args, **kwargs: Argumente der Funktion.
+
+        Returns:
+            Future: Ergebnis des Auftrags.
+        """
+        auftrag = self.executor.submit(funktion, *args, **kwargs)
+        self.auftraege.append((kontext, auftrag))
+        self._abfrage_planen()
+        return auftrag
+
+    def _abfrage_planen(self) -> None:
+        """Plant die nächste Abfrage, sofern noch keine geplant ist."""
+        if not self._abfrage_geplant:
+            self._abfrage_geplant = True
+            self.widget.after(self.intervall_ms, self._abfragen)
+
+    def _abfragen(self) -> None:
+        """Liefert fertige Aufträge im Hauptthread aus und plant sich neu, solange Aufträge offen sind."""
+        self._abfrage_geplant = False
+        offen: list[tuple[object, Future]] = []
+        fertig: list[tuple[object, Future]] = []
+        for kontext, auftrag in self.auftraege:
+            (fertig if auftrag.done() else offen).append((kontext, auftrag))
+        # Offene Aufträge vor dem Ausliefern festhalten, da Meldungen im Hauptthread die Ereignisschleife weiterlaufen lassen
+        self.auftraege = offen
+        for kontext, auftrag in fertig:
+            self._ausliefern(kontext, auftrag)
+        if self.auftraege:
+            self._laufend()
+            self._abfrage_planen()
+
+    @abstractmethod
+    def _ausliefern(self, kontext: object, auftrag: Future) -> None:
+        """Verarbeitet einen fertigen Auftrag im Hauptthread (Ergebnis öffnen bzw. Fehler melden)."""
+
+    def _laufend(self) -> None:
+        """Wird bei jeder Abfrage aufgerufen, solange Aufträge offen sind (z.B. für eine Fortschrittsanzeige)."""
+
+    def beenden(self, abbrechen: bool = False) -> None:
+        """
+        Beendet den Worker-Pool beim Programmende.
+
+        Args:
+            abbrechen (bool): Noch nicht begonnene Aufträge verwerfen, statt auf sie zu warten.
+        """
+        self.executor.shutdown(wait=True, cancel_futures=abbrechen)
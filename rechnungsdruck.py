@@ -0,0 +1,273 @@
+###
+# Rechnungsdruck der Restaurant-App
+#
+# Beschreibung:
+# Erstellt die PDF-Rechnungen im Hintergrund. Die Rechnungsansichten übergeben nur noch eine Momentaufnahme der
+# Rechnungsdaten an die Druckwarteschlange und schließen die Bestellungen sofort ab. Das Erzeugen des FPDF-Dokuments
+# läuft in einem Worker-Pool; über 'after' fragt der Tk-Hauptthread regelmäßig ab, welche Rechnungen fertig sind,
+# und öffnet sie im Webbrowser (siehe 'hintergrundauftrag').
+# Logo und statischer Kopfbereich werden einmalig als Rechnungsvorlage vorbereitet (Logo auf Druckgröße verkleinert
+# und als JPEG komprimiert), pro Rechnung werden nur noch die variablen Felder geschrieben.
+# fpdf wird erst bei der ersten Rechnung im Worker-Pool importiert und verlängert den Programmstart nicht.
+###
+
+import copy
+import io
+import os
+import tkinter as tk
+import webbrowser
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import lru_cache
+from tkinter import messagebox
+from typing import TYPE_CHECKING, Callable
+
+import numpy as np
+from PIL import Image
+
+from hintergrundauftrag import Hintergrundauftrag
+
+if TYPE_CHECKING:
+    from fpdf import FPDF
+
+
+# Spaltenbreiten der Rechnungstabelle (Speise, Menge, Netto, MwSt, Brutto)
+SPALTENBREITEN: tuple[int, int, int, int, int] = (50, 20, 30, 40, 40)
+# Spaltenbreiten der Positionsrechnung
+SPALTENBREITEN_POSITIONEN: tuple[int, int, int, int, int] = (40, 20, 40, 40, 40)
+
+
+# Statischer Kopfbereich der Rechnung als vorberechnete Folge von FPDF-Aufrufen (Methode, Argumente, Schlüsselwortargumente)
+KOPF_LAYOUT: tuple[tuple[str, tuple, dict], ...] = (
+    ('set_font', ('Arial', 'B', 16), {}),
+    ('cell', (200, 10), {'txt': 'Restaurant Golden Panda', 'ln': True, 'align': 'C'}),
+    ('ln', (10,), {}),
+    ('set_font', ('Arial', '', 10), {}),
+    ('cell', (100, 10), {'txt': 'Adresse: Zum Goldenen Bambusstab 7 ', 'ln': True}),
+    ('cell', (100, 10), {'txt': 'Telefon: 01234-567890', 'ln': True}),
+)
+
+
+class Rechnungsvorlage():
+    """
+    Einmalig vorbereitete, statische Teile der Rechnung: das auf Druckgröße verkleinerte Logo und das Layout des Kopfbereichs.
+
+    Das Logo wird beim Erstellen der Vorlage auf die gedruckte Breite bei 'dpi' Punkten pro Zoll verkleinert, auf weißen
+    Hintergrund gelegt und als JPEG komprimiert. JPEG-Daten bettet FPDF unverändert ein, sodass pro Rechnung weder das
+    PNG dekodiert noch der Alphakanal getrennt werden muss.
+    """
+
+    LOGO_NAME = 'rechnungsvorlage_logo.jpg'
+
+    def __init__(self, logo_pfad: str = './tkinter_pics/Logo.png', logo_breite: float = 120, dpi: int | None = 150,
+                 qualitaet: int = 85) -> None:
+        """
+        Args:
+            logo_pfad (str): Pfad des Logos.
+            logo_breite (float): Gedruckte Breite des Logos in mm.
+            dpi (int | None): Auflösung des vorbereiteten Logos. None bettet das Originalbild bei jeder Rechnung unverändert ein.
+            qualitaet (int): JPEG-Qualität des vorbereiteten Logos.
+        """
+        self.logo_pfad = logo_pfad
+        self.logo_breite = logo_breite
+        self.logo: dict | None = None if dpi is None else self._logo_aufbereiten(dpi, qualitaet)
+
+    def _logo_aufbereiten(self, dpi: int, qualitaet: int) -> dict:
+        """
+        Verkleinert und komprimiert das Logo einmalig.
+
+        Returns:
+            dict: Bildinformationen im Format von FPDF (Breite, Höhe, Farbraum, Filter und JPEG-Daten).
+        """
+        with Image.open(self.logo_pfad) as bild:
+            breite = round(self.logo_breite / 25.4 * dpi)
+            hoehe = round(bild.height * breite / bild.width)
+            bild = bild.convert('RGBA').resize((breite, hoehe), Image.LANCZOS)
+            # Transparente Bereiche auf weißen Hintergrund legen (das Papier der Rechnung)
+            hintergrund = Image.new('RGB', bild.size, 'white')
+            hintergrund.paste(bild, mask=bild.getchannel('A'))
+
+        puffer = io.BytesIO()
+        hintergrund.save(puffer, format='JPEG', quality=qualitaet, optimize=True)
+        return {'w': breite, 'h': hoehe, 'cs': 'DeviceRGB', 'bpc': 8, 'f': 'DCTDecode', 'data': puffer.getvalue()}
+
+    def kopf_zeichnen(self, pdf: 'FPDF') -> None:
+        """
+        Zeichnet Logo und statischen Kopfbereich auf die aktuelle Seite.
+
+        Args:
+            pdf (FPDF): Das Dokument, dessen aktuelle Seite den Kopf erhält.
+        """
+        if self.logo is None:
+            pdf.image(self.logo_pfad, x=100, y=20, w=self.logo_breite)
+        else:
+            if self.LOGO_NAME not in pdf.images:
+                # FPDF entfernt die Bilddaten nach dem Schreiben, daher erhält jedes Dokument eine eigene Kopie des Eintrags
+                pdf.images[self.LOGO_NAME] = dict(self.logo, i=len(pdf.images) + 1)
+            pdf.image(self.LOGO_NAME, x=100, y=20, w=self.logo_breite)
+
+        for methode, args, kwargs in KOPF_LAYOUT:
+            getattr(pdf, methode)(*args, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def vorlage_laden(logo_pfad: str = './tkinter_pics/Logo.png') -> Rechnungsvorlage:
+    """
+    Gibt die Rechnungsvorlage für ein Logo zurück und bereitet sie nur beim ersten Aufruf (je Prozess) vor.
+
+    Args:
+        logo_pfad (str): Pfad des Logos.
+
+    Returns:
+        Rechnungsvorlage: Die zwischengespeicherte Vorlage.
+    """
+    return Rechnungsvorlage(logo_pfad)
+
+
+def rechnung_pdf_erstellen(data: dict, filename: str, spaltenbreiten: tuple[int, ...] = SPALTENBREITEN,
+                           vorlage: Rechnungsvorlage | None = None) -> str:
+    """
+    Erstellt eine PDF-Rechnung basierend auf den übergebenen Daten.
+
+    Die Funktion:
+    - Übernimmt Logo und statischen Kopf aus der (zwischengespeicherten) Rechnungsvorlage.
+    - Schreibt nur die variablen Felder (Datum, Tischnummer, Bestell-IDs, Positionen und Summen) je Rechnung.
+
+    Args:
+        data (dict): Die Rechnungsdaten. Erwartete Struktur:
+                     {
+                         'Tischnummer': int,
+                         'Bestell_IDs': List[int],
+                         'Speisen': Dict[str, List[float]],   # Speise -> [Menge, Brutto]
+                         'Datum': np.datetime64               # optional, Standard: heute
+                     }
+        filename (str): Der Name der zu speichernden PDF-Datei.
+        spaltenbreiten (tuple[int, ...]): Breiten der Spalten Speise, Menge, Netto, MwSt und Brutto.
+        vorlage (Rechnungsvorlage | None): Vorlage für Logo und Kopf (Standard: vorlage_laden()).
+
+    Returns:
+        str: Der absolute Pfad der erstellten PDF-Datei.
+    """
+    from fpdf import FPDF
+
+    speise_breite, menge_breite, netto_breite, mwst_breite, brutto_breite = spaltenbreiten
+    vorlage = vorlage or vorlage_laden()
+
+    # Erstelle ein neues FPDF-Objekt
+    pdf = FPDF()
+    # Füge eine neue Seite hinzu
+    pdf.add_page()
+
+    # Logo, Titel, Adresse und Telefon aus der Vorlage
+    vorlage.kopf_zeichnen(pdf)
+
+    # Datum
+    pdf.cell(100, 10, txt=str(data.get('Datum', np.datetime64('today'))), ln=True)
+
+    # Tischnummer und Bestell-ID
+    pdf.ln(10)
+    pdf.cell(100, 10, txt=f"Tischnummer: {data['Tischnummer']}", ln=True)
+    pdf.cell(100, 10, txt=f"Bestell-ID: {data['Bestell_IDs']}", ln=True)
+
+    # Tabelle hinzufügen
+    pdf.ln(10)
+    pdf.set_font('Arial', 'B', 12)
+    pdf.cell(speise_breite, 10, 'Speise', border=1)
+    pdf.cell(menge_breite, 10, 'Menge', border=1, align='C')
+    pdf.cell(netto_breite, 10, 'Netto (EUR)', border=1, align='C')
+    pdf.cell(mwst_breite, 10, 'MwSt. 19% (EUR)', border=1, align='C')
+    pdf.cell(brutto_breite, 10, 'Brutto (EUR)', border=1, align='C')
+    pdf.ln(10)
+
+    # Daten einfügen
+    pdf.set_font('Arial', '', 12)
+    total_netto = 0  # Gesamtsumme Netto
+    total_mwst = 0  # Gesamtsumme MwSt
+    total_brutto = 0  # Gesamtsumme Brutto
+
+    for speise, details in data['Speisen'].items():
+        menge, brutto = details
+        # Berechnung der MwSt
+        mwst = round(brutto / 119 * 19, 2)
+
+        pdf.cell(speise_breite, 10, speise, border=1)
+        pdf.cell(menge_breite, 10, str(menge), border=1, align='C')
+        pdf.cell(netto_breite, 10, f'{brutto-mwst:.2f}', border=1, align='C')
+        pdf.cell(mwst_breite, 10, f'{mwst:.2f}', border=1, align='C')
+        pdf.cell(brutto_breite, 10, f'{brutto:.2f}', border=1, align='C')
+        pdf.ln(10)
+
+        # Summen aktualisieren
+        total_netto += brutto - mwst
+        total_mwst += mwst
+        total_brutto += brutto
+
+    # Gesamtsummen
+    pdf.ln(5)
+    pdf.set_font('Arial', 'B', 12)
+    pdf.cell(100, 10, 'Zwischensumme Netto:', ln=False)
+    pdf.cell(40, 10, f'{total_netto:.2f} EUR', ln=True, align='R')
+
+    pdf.cell(100, 10, 'Gesamt MwSt. (19%):', ln=False)
+    pdf.cell(40, 10, f'{total_mwst:.2f} EUR', ln=True, align='R')
+
+    pdf.cell(100, 10, 'Gesamtbetrag Brutto:', ln=False)
+    pdf.cell(40, 10, f'{total_brutto:.2f} EUR', ln=True, align='R')
+
+    # Fußzeile
+    pdf.ln(10)
+    pdf.cell(0, 10, 'Vielen Dank für Ihren Besuch im Restaurant Golden Panda!', ln=True, align='C')
+    pdf.cell(0, 10, 'Wir hoffen, Sie bald wieder begrüßen zu dürfen.', ln=True, align='C')
+
+    # Speichere das PDF
+    pdf.output(filename)
+    return os.path.abspath(filename)
+
+
+class Rechnungsdruck(Hintergrundauftrag):
+    """
+    Warteschlange für PDF-Rechnungen, die in einem Worker-Pool erstellt und über 'after' im Tk-Hauptthread ausgeliefert werden.
+    """
+
+    def __init__(self, widget: tk.Misc, executor: Executor | None = None, intervall_ms: int = 100,
+                 oeffnen: Callable[[str], object] = webbrowser.open_new) -> None:
+        """
+        Args:
+            widget (tk.Misc): Beliebiges Tk-Widget, über dessen 'after' die fertigen Rechnungen abgefragt werden.
+            executor (Executor | None): Worker-Pool für die PDF-Erstellung (Standard: ThreadPoolExecutor mit zwei Threads).
+            intervall_ms (int): Abstand der Abfragen in Millisekunden, solange Rechnungen in Arbeit sind.
+            oeffnen (Callable[[str], object]): Wird im Hauptthread mit dem Pfad jeder fertigen Rechnung aufgerufen.
+        """
+        super().__init__(widget, executor or ThreadPoolExecutor(max_workers=2, thread_name_prefix='rechnungsdruck'),
+                         intervall_ms, oeffnen)
+        # Rechnungsvorlage schon beim Start im Worker-Pool vorbereiten, damit die erste Rechnung nicht darauf wartet
+        self.executor.submit(vorlage_laden)
+
+    def drucken(self, data: dict, filename: str, spaltenbreiten: tuple[int, ...] = SPALTENBREITEN) -> Future:
+        """
+        Übergibt eine Rechnung an den Worker-Pool und kehrt sofort zurück.
+
+        Die Funktion:
+        - Kopiert die Rechnungsdaten, damit spätere Änderungen (z.B. durch die nächste Abrechnung) die Rechnung nicht verändern.
+        - Hält das Rechnungsdatum zum Zeitpunkt der Abrechnung fest.
+        - Startet die regelmäßige Abfrage der fertigen Rechnungen, falls sie nicht bereits läuft.
+
+        Args:
+            data (dict): Die Rechnungsdaten (siehe rechnung_pdf_erstellen).
+            filename (str): Der Name der zu speichernden PDF-Datei.
+            spaltenbreiten (tuple[int, ...]): Breiten der Tabellenspalten.
+
+        Returns:
+            Future: Liefert nach Fertigstellung den absoluten Pfad der PDF-Datei.
+        """
+        momentaufnahme = copy.deepcopy(data)
+        momentaufnahme.setdefault('Datum', np.datetime64('today'))
+        return self._einreichen(filename, rechnung_pdf_erstellen, momentaufnahme, filename, spaltenbreiten)
+
+    def _ausliefern(self, filename: str, auftrag: Future) -> None:
+        """Öffnet eine fertige Rechnung im Hauptthread bzw. meldet den Fehler."""
+        try:
+            pfad = auftrag.result()
+        except Exception as fehler:
+            messagebox.showerror('Fehler', f'Die Rechnung {filename} konnte nicht erstellt werden:\n{fehler}')
+        else:
+            self.oeffnen(pfad)
@@ -0,0 +1,158 @@
+###
+# Rechnungsvorbereitung der Restaurant-App
+#
+# Beschreibung:
+# Hält die gelieferten, noch nicht abgerechneten Positionen je Tisch bereits bepreist im Speicher.
+# Die Struktur meldet sich beim Bestellspeicher als Beobachter an und wird bei jeder Lieferung, Mengenänderung,
+# Stornierung und Abrechnung nachgeführt. Die Rechnungsansichten lesen die Positionen eines Tisches direkt von hier,
+# statt bei jedem Aufruf alle Bestellungen zu bepreisen, als './data/Rechnungsdetails.csv' zu schreiben und wieder einzulesen.
+# Die CSV-Datei wird nur noch bei einem ausdrücklichen Export geschrieben.
+###
+
+import pandas as pd
+
+from bestelljournal import csv_atomar_schreiben, leere_bestellungen
+from bestellspeicher import Bestellspeicher
+from speisekatalog import Speisekatalog
+
+
+def leere_posten() -> pd.DataFrame:
+    """
+    Erstellt ein leeres DataFrame für Rechnungspositionen mit 'Bestell_ID' als Index.
+
+    Returns:
+        pd.DataFrame: Leeres DataFrame mit den Bestellspalten und der Spalte 'Preis'.
+    """
+    df = leere_bestellungen()
+    df['Preis'] = pd.Series(dtype=float)
+    return df
+
+
+class Rechnungsvorbereitung():
+    """
+    Bepreiste, gelieferte Positionen je Tischnummer, die von den Ereignissen des Bestellspeichers aktuell gehalten werden.
+    """
+
+    def __init__(self, speicher: Bestellspeicher, katalog: Speisekatalog) -> None:
+        """
+        Übernimmt die bereits gelieferten Bestellungen und meldet sich beim Speicher für alle folgenden Änderungen an.
+
+        Args:
+            speicher (Bestellspeicher): Der Bestellspeicher, dessen Lieferungen vorbereitet werden.
+            katalog (Speisekatalog): Katalog für die Positionspreise.
+        """
+        self.katalog = katalog
+        self.tische: dict[int, pd.DataFrame] = {}
+        # Tischnummer je vorbereiteter Bestell_ID, damit Änderungen ohne Suche über alle Tische zugeordnet werden
+        self._tisch_von: dict[int, int] = {}
+
+        self.geliefert(speicher.bestellungen(status='geliefert'))
+        speicher.beobachten(self)
+
+    # Ereignisse des Bestellspeichers
+    def geliefert(self, bestellungen: pd.DataFrame) -> None:
+        """
+        Nimmt gelieferte Bestellungen bepreist in die Positionen ihres Tisches auf.
+
+        Args:
+            bestellungen (pd.DataFrame): Die gelieferten Bestellungen mit 'Bestell_ID' als Index.
+        """
+        if bestellungen.empty:
+            return
+        posten = bestellungen.copy()
+        posten['Preis'] = self.katalog.positionspreise(posten)
+
+        for tischnummer, tisch_df in posten.groupby('Tischnummer'):
+            tischnummer = int(tischnummer)
+            vorhanden = self.tische.get(tischnummer)
+            if vorhanden is not None:
+                tisch_df = pd.concat([vorhanden.drop(index=tisch_df.index, errors='ignore'), tisch_df])
+            self.tische[tischnummer] = tisch_df
+            self._tisch_von.update(dict.fromkeys((int(i) for i in tisch_df.index), tischnummer))
+
+    def menge_geaendert(self, bestell_id: int, menge: int) -> None:
+        """Übernimmt eine geänderte Menge und berechnet den Positionspreis neu."""
+        tischnummer = self._tisch_von.get(int(bestell_id))
+        if tischnummer is None:
+            return
+        self._menge_setzen(tischnummer, int(bestell_id), int(menge))
+
+    def storniert(self, bestell_id: int) -> None:
+        """Entfernt eine stornierte Bestellung aus der Vorbereitung."""
+        tischnummer = self._tisch_von.get(int(bestell_id))
+        if tischnummer is not None:
+            self._entfernen(tischnummer, [int(bestell_id)])
+
+    def geschlossen(self, positionen: list[tuple[int, int]]) -> None:
+        """
+        Verringert die Mengen abgerechneter Positionen und entfernt vollständig abgerechnete Bestellungen.
+
+        Args:
+            positionen (list[tuple[int, int]]): Liste aus (Bestell_ID, abgerechnete Menge).
+        """
+        for bestell_id, menge in positionen:
+            bestell_id = int(bestell_id)
+            tischnummer = self._tisch_von.get(bestell_id)
+            if tischnummer is None:
+                continue
+            rest = int(self.tische[tischnummer].at[bestell_id, 'Menge']) - int(menge)
+            if rest > 0:
+                self._menge_setzen(tischnummer, bestell_id, rest)
+            else:
+                self._entfernen(tischnummer, [bestell_id])
+
+    # Abfragen für die Rechnungsansichten
+    def posten(self, tischnummer: int) -> pd.DataFrame:
+        """
+        Gibt die bepreisten, noch nicht abgerechneten Positionen eines Tisches zurück.
+
+        Args:
+            tischnummer (int): Die Tischnummer.
+
+        Returns:
+            pd.DataFrame: Kopie der Positionen (Bestell_ID als Index, Spalten wie 'Rechnungsdetails.csv').
+        """
+        tisch_df = self.tische.get(int(tischnummer))
+        return leere_posten() if tisch_df is None else tisch_df.copy()
+
+    def uebersicht(self) -> pd.DataFrame:
+        """
+        Fasst Menge und Preis der offenen Positionen je Tisch zusammen.
+
+        Returns:
+            pd.DataFrame: 'Tischnummer' als Index (aufsteigend) mit den Summen 'Menge' und 'Preis'.
+        """
+        tischnummern = sorted(self.tische)
+        uebersicht = pd.DataFrame({
+            'Menge': [int(self.tische[t]['Menge'].sum()) for t in tischnummern],
+            'Preis': [round(float(self.tische[t]['Preis'].sum()), 2) for t in tischnummern]
+        }, index=pd.Index(tischnummern, name='Tischnummer'))
+        return uebersicht
+
+    def exportieren(self, pfad: str = './data/Rechnungsdetails.csv') -> None:
+        """
+        Schreibt alle vorbereiteten Positionen als CSV-Datei (nur auf ausdrücklichen Wunsch).
+
+        Args:
+            pfad (str): Zielpfad der CSV-Datei.
+        """
+        teile = [self.tische[t] for t in sorted(self.tische)]
+        alle = pd.concat(teile).sort_index() if teile else leere_posten()
+        csv_atomar_schreiben(alle, pfad)
+
+    # Interne Änderungen
+    def _menge_setzen(self, tischnummer: int, bestell_id: int, menge: int) -> None:
+        """Setzt die Menge einer Position und berechnet ihren Preis mit dem Katalog neu."""
+        tisch_df = self.tische[tischnummer]
+        tisch_df.loc[bestell_id, 'Menge'] = menge
+        tisch_df.loc[bestell_id, 'Preis'] = self.katalog.positionspreise(tisch_df.loc[[bestell_id]]).iloc[0]
+
+    def _entfernen(self, tischnummer: int, bestell_ids: list[int]) -> None:
+        """Entfernt Positionen eines Tisches und den Tisch selbst, sobald er keine Positionen mehr hat."""
+        tisch_df = self.tische[tischnummer].drop(index=bestell_ids)
+        for bestell_id in bestell_ids:
+            del self._tisch_von[bestell_id]
+        if tisch_df.empty:
+            del self.tische[tischnummer]
+        else:
+            self.tische[tischnummer] = tisch_df
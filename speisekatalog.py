@@ -0,0 +1,138 @@
+###
+# Speisekatalog der Restaurant-App
+#
+# Beschreibung:
+# Einmalig aus './data/Speisekarte.csv' und './data/Getränkekarte.csv' aufgebauter Katalog aller Speisen und Getränke.
+# Preis, Bezeichnung und Kategorie liegen in NumPy-Arrays, deren Position der Speise_ID entspricht. Damit sind
+# Preis- und Namensabfragen für beliebig viele Speise_IDs ein einziger vektorisierter Arrayzugriff,
+# statt für jede Rechnung die Karten neu zusammenzufügen und pro Position nach dem Namen zu suchen.
+###
+
+import numpy as np
+import pandas as pd
+
+from bestellindex import kategorie_von
+
+
+class Speisekatalog():
+    """
+    Nach Speise_ID indizierter Katalog mit Preis, Bezeichnung und Kategorie ('essen', 'getraenke').
+    """
+
+    def __init__(self, *karten: pd.DataFrame) -> None:
+        """
+        Baut die Arrays aus einer oder mehreren Karten auf.
+
+        Args:
+            *karten (pd.DataFrame): Speise- bzw. Getränkekarten mit 'Speise_ID' als Index und den Spalten 'Speise' und 'Preis'.
+        """
+        karte = pd.concat(karten)
+        groesse = int(karte.index.max()) + 1 if not karte.empty else 0
+        ids = karte.index.to_numpy(dtype=int)
+
+        self.vorhanden: np.ndarray = np.zeros(groesse, dtype=bool)
+        self.preise: np.ndarray = np.full(groesse, np.nan)
+        self.namen: np.ndarray = np.full(groesse, '', dtype=object)
+        self.kategorien: np.ndarray = np.full(groesse, '', dtype=object)
+
+        self.vorhanden[ids] = True
+        self.preise[ids] = karte['Preis'].to_numpy(dtype=float)
+        self.namen[ids] = karte['Speise'].to_numpy()
+        self.kategorien[ids] = [kategorie_von(i) for i in ids]
+
+    @classmethod
+    def laden(cls, speisekarte_pfad: str = './data/Speisekarte.csv', getraenkekarte_pfad: str = './data/Getränkekarte.csv') -> 'Speisekatalog':
+        """
+        Lädt Speise- und Getränkekarte aus den CSV-Dateien.
+
+        Args:
+            speisekarte_pfad (str): Pfad der Speisekarte.
+            getraenkekarte_pfad (str): Pfad der Getränkekarte.
+
+        Returns:
+            Speisekatalog: Der aufgebaute Katalog.
+        """
+        return cls(*(pd.read_csv(pfad, index_col='Speise_ID', dtype={'Speise_ID': int})
+                     for pfad in (speisekarte_pfad, getraenkekarte_pfad)))
+
+    def _positionen(self, speise_ids) -> np.ndarray:
+        """
+        Wandelt Speise_IDs in Array-Positionen um und prüft, ob alle im Katalog enthalten sind.
+
+        Raises:
+            KeyError: Wenn mindestens eine Speise_ID nicht im Katalog enthalten ist.
+        """
+        positionen = np.asarray(speise_ids, dtype=int)
+        gueltig = self.enthalten(positionen)
+        if not gueltig.all():
+            raise KeyError(f'Unbekannte Speise_ID: {np.unique(positionen[~gueltig]).tolist()}')
+        return positionen
+
+    def enthaelt(self, speise_id: int) -> bool:
+        """Gibt zurück, ob die Speise_ID im Katalog enthalten ist."""
+        return 0 <= speise_id < len(self.vorhanden) and bool(self.vorhanden[speise_id])
+
+    def enthalten(self, speise_ids) -> np.ndarray:
+        """
+        Prüft vektorisiert, welche Speise_IDs im Katalog enthalten sind.
+
+        Args:
+            speise_ids: Speise_IDs (Liste, Array oder Series).
+
+        Returns:
+            np.ndarray: Boolesche Maske in der Reihenfolge der Speise_IDs.
+        """
+        positionen = np.asarray(speise_ids, dtype=int)
+        gueltig = (positionen >= 0) & (positionen < len(self.vorhanden))
+        gueltig[gueltig] = self.vorhanden[positionen[gueltig]]
+        return gueltig
+
+    def preise_fuer(self, speise_ids) -> np.ndarray:
+        """
+        Gibt die Einzelpreise für beliebig viele Speise_IDs zurück.
+
+        Args:
+            speise_ids: Speise_IDs (Liste, Array oder Series).
+
+        Raises:
+            KeyError: Wenn eine Speise_ID nicht im Katalog enthalten ist.
+
+        Returns:
+            np.ndarray: Die Preise in der Reihenfolge der Speise_IDs.
+        """
+        return self.preise[self._positionen(speise_ids)]
+
+    def namen_fuer(self, speise_ids) -> np.ndarray:
+        """Gibt die Bezeichnungen für beliebig viele Speise_IDs zurück (KeyError bei unbekannten IDs)."""
+        return self.namen[self._positionen(speise_ids)]
+
+    def karte(self, kategorie: str | None = None) -> pd.DataFrame:
+        """
+        Gibt die Karte (Bezeichnung und Preis je Speise_ID) zurück, optional nur einer Kategorie.
+
+        Args:
+            kategorie (str | None): 'essen' oder 'getraenke', None für alle Speisen und Getränke.
+
+        Returns:
+            pd.DataFrame: 'Speise_ID' als Index mit den Spalten 'Speise' und 'Preis'.
+        """
+        auswahl = self.vorhanden if kategorie is None else self.vorhanden & (self.kategorien == kategorie)
+        ids = np.flatnonzero(auswahl)
+        return pd.DataFrame({'Speise': self.namen[ids], 'Preis': self.preise[ids]}, index=pd.Index(ids, name='Speise_ID'))
+
+    def positionspreise(self, bestellungen: pd.DataFrame) -> pd.Series:
+        """
+        Berechnet den Gesamtpreis je Bestellposition (Menge * Einzelpreis) gerundet auf zwei Stellen.
+        Speise_IDs, die nicht (mehr) im Katalog enthalten sind, erhalten den Preis NaN.
+
+        Args:
+            bestellungen (pd.DataFrame): Bestellungen mit den Spalten 'Speise_ID' und 'Menge'.
+
+        Returns:
+            pd.Series: Die Positionspreise mit dem Index der Bestellungen.
+        """
+        ids = bestellungen['Speise_ID'].to_numpy(dtype=int)
+        bekannt = self.enthalten(ids)
+        preise = np.full(len(ids), np.nan)
+        preise[bekannt] = self.preise[ids[bekannt]]
+        return pd.Series(np.round(bestellungen['Menge'].to_numpy() * preise, 2), index=bestellungen.index)
@@ -0,0 +1,123 @@
+###
+# Startprofil der Restaurant-App
+#
+# Beschreibung:
+# Misst beim Aufruf mit '--profile-startup' die Kaltstartzeit der Anwendung, damit sie auf den Kassenrechnern verfolgt
+# werden kann. Erfasst werden die Ladezeit jedes Imports des Hauptskripts (einschließlich aller davon nachgeladenen
+# Module) sowie die Dauer der Startphasen bis zum ersten gezeichneten Fenster. Der Bericht wird auf der Konsole
+# ausgegeben, danach wird die Anwendung beendet. Ohne den Schalter sind alle Funktionen wirkungslos.
+#
+# Aufruf aus dem Projektverzeichnis:
+#     python "Abschlussprojekt Restaurant-App Daniel Bahr.py" --profile-startup
+###
+
+import builtins
+import time
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    import tkinter as tk
+
+
+# Kommandozeilenschalter für den Profilmodus
+SCHALTER: str = '--profile-startup'
+
+
+class Startprofil():
+    """
+    Zeitmessung des Kaltstarts: Importe einzeln, Startphasen als Abstand zwischen aufeinanderfolgenden Marken.
+    """
+
+    def __init__(self, aktiv: bool = True) -> None:
+        """
+        Args:
+            aktiv (bool): Messung durchführen; bei False bleiben alle Aufrufe ohne Wirkung.
+        """
+        self.aktiv = aktiv
+        self.start = time.perf_counter()
+        self.letzte_marke = self.start
+        self.phasen: list[tuple[str, float]] = []
+        self.importe: dict[str, float] = {}
+        self._import_original: Callable | None = None
+        self._tiefe = 0
+
+    @classmethod
+    def aus_argumenten(cls, argumente: list[str]) -> 'Startprofil':
+        """Legt ein Startprofil an, das nur aktiv ist, wenn der Schalter '--profile-startup' übergeben wurde."""
+        return cls(SCHALTER in argumente)
+
+    # Importe
+    def importe_messen(self) -> None:
+        """Misst ab jetzt die Dauer jedes Imports der obersten Ebene (verschachtelte Importe zählen zum äußeren)."""
+        if not self.aktiv or self._import_original is not None:
+            return
+        self._import_original = builtins.__import__
+        builtins.__import__ = self._importieren
+
+    def importe_beenden(self) -> None:
+        """Beendet die Messung der Importe und setzt die Marke der Phase 'Importe'."""
+        if not self.aktiv or self._import_original is None:
+            return
+        builtins.__import__ = self._import_original
+        self._import_original = None
+        self.markieren('Importe')
+
+    def _importieren(self, name: str, *args, **kwargs):
+        """Ersatz für builtins.__import__, der die Zeit der äußersten Import-Anweisung aufsummiert."""
+        if self._tiefe:
+            return self._import_original(name, *args, **kwargs)
+        self._tiefe += 1
+        beginn = time.perf_counter()
+        try:
+            return self._import_original(name, *args, **kwargs)
+        finally:
+            self._tiefe -= 1
+            self.importe[name] = self.importe.get(name, 0.0) + time.perf_counter() - beginn
+
+    # Phasen
+    def markieren(self, phase: str) -> None:
+        """
+        Schließt eine Startphase ab. Ihre Dauer ist die Zeit seit der vorherigen Marke (bzw. seit dem Start).
+
+        Args:
+            phase (str): Name der abgeschlossenen Phase.
+        """
+        if not self.aktiv:
+            return
+        jetzt = time.perf_counter()
+        self.phasen.append((phase, jetzt - self.letzte_marke))
+        self.letzte_marke = jetzt
+
+    def erstes_frame_abwarten(self, fenster: 'tk.Misc') -> None:
+        """
+        Wartet, bis das Hauptfenster sichtbar und vollständig gezeichnet ist, gibt den Bericht aus und schließt das Fenster.
+
+        Args:
+            fenster (tk.Misc): Das Hauptfenster der Anwendung.
+        """
+        if not self.aktiv:
+            return
+        fenster.wait_visibility()
+        fenster.update_idletasks()
+        self.markieren('Erstes Frame')
+        print(self.bericht())
+        fenster.destroy()
+
+    # Ausgabe
+    def bericht(self) -> str:
+        """
+        Erstellt den Bericht mit den Startphasen (Dauer und kumuliert) und den Importen (absteigend nach Dauer).
+
+        Returns:
+            str: Der Bericht als Text.
+        """
+        zeilen = ['Startprofil', f'{"Phase":<24}{"ms":>10}{"kumuliert ms":>16}']
+        kumuliert = 0.0
+        for phase, dauer in self.phasen:
+            kumuliert += dauer
+            zeilen.append(f'{phase:<24}{dauer * 1000:10.1f}{kumuliert * 1000:16.1f}')
+
+        zeilen += ['', f'{"Import":<24}{"ms":>10}']
+        for name, dauer in sorted(self.importe.items(), key=lambda eintrag: eintrag[1], reverse=True):
+            zeilen.append(f'{name:<24}{dauer * 1000:10.1f}')
+        return '\n'.join(zeilen)
@@ -0,0 +1,177 @@
+###
+# Tests der Bestellabwicklung
+#
+# Aufruf aus dem Projektverzeichnis:
+#     python -m pytest tests
+###
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bestellabwicklung import Bestellabwicklung, Bestellfehler, positionen_lesen, zahl_lesen
+from bestellspeicher import speicher_oeffnen
+from speisekatalog import Speisekatalog
+
+
+# Zwei Speisen (Essen < 100) und ein Getränk (> 99)
+SPEISEKARTE = pd.DataFrame({'Speise': ['Tomatensuppe', 'Salat'], 'Preis': [4.5, 3.2]}, index=pd.Index([1, 2], name='Speise_ID'))
+GETRAENKEKARTE = pd.DataFrame({'Speise': ['Wasser'], 'Preis': [2.0]}, index=pd.Index([101], name='Speise_ID'))
+
+
+@pytest.fixture(params=['csv', 'sqlite'])
+def abwicklung(request, tmp_path) -> Bestellabwicklung:
+    """Bestellabwicklung auf einem leeren Speicher je Engine."""
+    return Bestellabwicklung(speicher_oeffnen(request.param, str(tmp_path)), Speisekatalog(SPEISEKARTE, GETRAENKEKARTE))
+
+
+def aufgeben(abwicklung: Bestellabwicklung, tischnummer: int, mengen: dict[int, str | int]) -> list[int]:
+    """Gibt eine Bestellung auf und liefert die Bestell_IDs in der Reihenfolge der Speise_IDs."""
+    return [int(bestell_id) for bestell_id in abwicklung.bestellung_aufgeben(tischnummer, mengen).index]
+
+
+def geschlossene_mengen(abwicklung: Bestellabwicklung) -> dict[tuple[int, str], int]:
+    """Gibt die Menge je (Bestell_ID, Status) der geschlossenen Bestellungen zurück."""
+    geschlossen = abwicklung.speicher.geschlossene_bestellungen()
+    return {(int(bestell_id), status): int(menge)
+            for bestell_id, status, menge in zip(geschlossen.index, geschlossen['Status'], geschlossen['Menge'])}
+
+
+def test_eingaben_lesen():
+    """Eingabefelder werden in Zahlen bzw. Positionen umgewandelt, fehlerhafte Eingaben als Bestellfehler gemeldet."""
+    assert zahl_lesen(' 7 ', 'Menge') == 7
+    assert positionen_lesen('3, 1, 4,2') == [(3, 1), (4, 2)]
+    with pytest.raises(Bestellfehler, match='Menge'):
+        zahl_lesen('sieben', 'Menge')
+    with pytest.raises(Bestellfehler, match='Eingabe nicht korrekt'):
+        positionen_lesen('3, 1, 4')
+    with pytest.raises(Bestellfehler, match='Bestell_ID'):
+        positionen_lesen('x, 1')
+
+
+def test_bestellung_aufgeben(abwicklung):
+    """Nur Mengen größer 0 werden angelegt; ungültige Eingaben ändern nichts."""
+    bestellung = abwicklung.bestellung_aufgeben(3, {1: '2', 2: '', 101: 0})
+    assert bestellung['Speise_ID'].tolist() == [1]
+    assert bestellung[['Tischnummer', 'Menge', 'Status']].iloc[0].tolist() == [3, 2, 'offen']
+    assert abwicklung.bestellung_aufgeben(3, {1: '', 2: '0'}).empty
+
+    with pytest.raises(Bestellfehler, match='Ungültige Tischnummer'):
+        abwicklung.bestellung_aufgeben(0, {1: 1})
+    with pytest.raises(Bestellfehler, match='Fehlerhafte Menge'):
+        abwicklung.bestellung_aufgeben(3, {1: 'zwei'})
+    with pytest.raises(Bestellfehler, match='Unbekannte Speise_ID'):
+        abwicklung.bestellung_aufgeben(3, {99: 1})
+    # Die Essensmaske lässt keine Getränke zu
+    with pytest.raises(Bestellfehler, match='Unbekannte Speise_ID'):
+        abwicklung.bestellung_aufgeben(3, {101: 1}, kategorie='essen')
+    assert list(abwicklung.speicher.bestellungen().index) == list(bestellung.index)
+
+
+def test_menge_aendern(abwicklung):
+    """Die Menge einer offenen Bestellung wird geändert; 0 und unbekannte Bestell_IDs werden abgewiesen."""
+    (bestell_id,) = aufgeben(abwicklung, 1, {1: 2})
+    abwicklung.menge_aendern(bestell_id, 5)
+    assert int(abwicklung.speicher.bestellung(bestell_id)['Menge']) == 5
+
+    with pytest.raises(Bestellfehler, match='Storno'):
+        abwicklung.menge_aendern(bestell_id, 0)
+    with pytest.raises(Bestellfehler, match='nicht gefunden'):
+        abwicklung.menge_aendern(bestell_id + 1, 1)
+    assert int(abwicklung.speicher.bestellung(bestell_id)['Menge']) == 5
+
+
+def test_liefern_und_alle_liefern(abwicklung):
+    """Einzelne und alle offenen Bestellungen eines Tisches (je Kategorie) werden geliefert."""
+    suppe, salat, wasser = aufgeben(abwicklung, 2, {1: 1, 2: 1, 101: 2})
+    (anderer_tisch,) = aufgeben(abwicklung, 4, {1: 1})
+
+    abwicklung.liefern(suppe)
+    assert abwicklung.speicher.bestellung(suppe)['Status'] == 'geliefert'
+    with pytest.raises(Bestellfehler, match='nicht gefunden'):
+        abwicklung.liefern(anderer_tisch + 1)
+
+    geliefert = abwicklung.alle_liefern(2, kategorie='getraenke')
+    assert list(geliefert.index) == [wasser]
+    assert abwicklung.speicher.bestellung(salat)['Status'] == 'offen'
+    with pytest.raises(Bestellfehler, match='Keine offenen Getränke-Bestellungen für Tischnummer: 2'):
+        abwicklung.alle_liefern(2, kategorie='getraenke')
+
+    assert list(abwicklung.alle_liefern(2).index) == [salat]
+    with pytest.raises(Bestellfehler, match='Keine offenen Bestellungen für Tischnummer: 2'):
+        abwicklung.alle_liefern(2)
+    assert abwicklung.speicher.bestellung(anderer_tisch)['Status'] == 'offen'
+
+
+def test_stornieren(abwicklung):
+    """Eine stornierte Bestellung wird als 'storniert' geschlossen und verschwindet aus der Rechnung."""
+    suppe, salat = aufgeben(abwicklung, 5, {1: 1, 2: 3})
+    abwicklung.alle_liefern(5)
+    abwicklung.stornieren(salat)
+
+    assert not abwicklung.speicher.enthaelt(salat)
+    assert geschlossene_mengen(abwicklung) == {(salat, 'storniert'): 3}
+    assert list(abwicklung.rechnungsvorbereitung.posten(5).index) == [suppe]
+    with pytest.raises(Bestellfehler, match='nicht gefunden'):
+        abwicklung.stornieren(salat)
+
+
+def test_tisch_abrechnen(abwicklung):
+    """Die Tischrechnung fasst alle gelieferten Positionen je Speise zusammen und schließt sie; Offenes bleibt stehen."""
+    erste_suppe, salat = aufgeben(abwicklung, 6, {1: 2, 2: 1})
+    (zweite_suppe,) = aufgeben(abwicklung, 6, {1: 1})
+    (wasser,) = aufgeben(abwicklung, 6, {101: 1})
+    with pytest.raises(Bestellfehler, match='keine offenen Rechnungsposten'):
+        abwicklung.tisch_abrechnen(6)
+
+    for bestell_id in (erste_suppe, salat, zweite_suppe):
+        abwicklung.liefern(bestell_id)
+    rechnung = abwicklung.tisch_abrechnen(6)
+
+    assert sorted(rechnung['Bestell_IDs']) == [erste_suppe, salat, zweite_suppe]
+    assert rechnung['Tischnummer'] == 6
+    assert rechnung['Speisen'] == {'Tomatensuppe': [3, pytest.approx(13.5)], 'Salat': [1, pytest.approx(3.2)]}
+    assert list(abwicklung.speicher.bestellungen().index) == [wasser]
+    assert geschlossene_mengen(abwicklung) == {
+        (erste_suppe, 'geschlossen'): 2, (salat, 'geschlossen'): 1, (zweite_suppe, 'geschlossen'): 1}
+    with pytest.raises(Bestellfehler, match='keine offenen Rechnungsposten'):
+        abwicklung.tisch_abrechnen(6)
+
+
+def test_positionen_abrechnen(abwicklung):
+    """Teilmengen werden abgerechnet, mehrfach genannte Bestell_IDs zusammengezählt und der Rest bleibt offen."""
+    suppe, salat = aufgeben(abwicklung, 7, {1: 3, 2: 2})
+    abwicklung.alle_liefern(7)
+
+    rechnung = abwicklung.positionen_abrechnen(7, [(suppe, 1), (salat, 2), (suppe, 1)])
+    assert rechnung['Bestell_IDs'] == [suppe, salat, suppe]
+    assert rechnung['Speisen'] == {'Tomatensuppe': [2, pytest.approx(9.0)], 'Salat': [2, pytest.approx(6.4)]}
+    assert int(abwicklung.speicher.bestellung(suppe)['Menge']) == 1
+    assert not abwicklung.speicher.enthaelt(salat)
+    assert geschlossene_mengen(abwicklung) == {(suppe, 'geschlossen'): 2, (salat, 'geschlossen'): 2}
+    assert int(abwicklung.rechnungsvorbereitung.posten(7).at[suppe, 'Menge']) == 1
+
+
+def test_positionen_abrechnen_fehler(abwicklung):
+    """Ungültige Positionen werden vor jeder Änderung abgewiesen."""
+    suppe, salat = aufgeben(abwicklung, 8, {1: 2, 2: 1})
+    abwicklung.alle_liefern(8)
+
+    with pytest.raises(Bestellfehler, match='Eingabe nicht korrekt'):
+        abwicklung.positionen_abrechnen(8, [])
+    with pytest.raises(Bestellfehler, match='größer als 0'):
+        abwicklung.positionen_abrechnen(8, [(suppe, 1), (salat, 0)])
+    with pytest.raises(Bestellfehler, match='nicht gefunden'):
+        abwicklung.positionen_abrechnen(8, [(suppe, 1), (salat + 1, 1)])
+    # Zusammen mehr als die offene Menge
+    with pytest.raises(Bestellfehler, match='nicht unterschreiten'):
+        abwicklung.positionen_abrechnen(8, [(suppe, 2), (suppe, 1)])
+    with pytest.raises(Bestellfehler, match='Ungültige Tischnummer'):
+        abwicklung.positionen_abrechnen(-1, [(suppe, 1)])
+
+    assert geschlossene_mengen(abwicklung) == {}
+    assert abwicklung.speicher.bestellungen()['Menge'].tolist() == [2, 1]
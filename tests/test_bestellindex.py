@@ -0,0 +1,94 @@
+###
+# Tests der Sekundärindizes der offenen Bestellungen
+#
+# Aufruf aus dem Projektverzeichnis:
+#     python -m pytest tests
+###
+
+import os
+import random
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bestellindex import Bestellindex, kategorie_von
+from bestellspeicher import speicher_oeffnen
+
+
+# Zwei Speisen (Essen < 100) und ein Getränk (> 99)
+KARTE = pd.DataFrame({'Speise': ['Tomatensuppe', 'Salat', 'Wasser'], 'Preis': [4.5, 3.2, 2.0]},
+                     index=pd.Index([1, 2, 101], name='Speise_ID'))
+
+
+def bestellungen(*zeilen: tuple[int, int, str, int]) -> pd.DataFrame:
+    """Erstellt Bestellungen aus (Bestell_ID, Tischnummer, Status, Speise_ID) mit 'Bestell_ID' als Index."""
+    return pd.DataFrame(zeilen, columns=['Bestell_ID', 'Tischnummer', 'Status', 'Speise_ID']).set_index('Bestell_ID')
+
+
+def mit_masken(bestellungen_df: pd.DataFrame, status: str | None, tischnummer: int | None, kategorie: str | None) -> list[int]:
+    """Ermittelt die Bestell_IDs wie vor den Indizes über Boolean-Masken auf allen offenen Bestellungen."""
+    maske = pd.Series(True, index=bestellungen_df.index)
+    if status is not None:
+        maske &= bestellungen_df['Status'] == status
+    if tischnummer is not None:
+        maske &= bestellungen_df['Tischnummer'] == tischnummer
+    if kategorie is not None:
+        maske &= bestellungen_df['Speise_ID'].map(kategorie_von) == kategorie
+    return sorted(int(bestell_id) for bestell_id in bestellungen_df.index[maske])
+
+
+def test_kategorie_von():
+    """Speise_IDs unter 100 sind Essen, ab 100 Getränke; negative IDs haben keine Kategorie."""
+    assert [kategorie_von(i) for i in (0, 99, 100, 250)] == ['essen', 'essen', 'getraenke', 'getraenke']
+    with pytest.raises(ValueError):
+        kategorie_von(-1)
+
+
+def test_indizes_werden_nachgefuehrt():
+    """Hinzufügen, Statuswechsel und Entfernen halten alle drei Indizes konsistent; leere Tische verschwinden."""
+    index = Bestellindex()
+    index.aufbauen(bestellungen((1, 3, 'offen', 1), (2, 3, 'offen', 101), (3, 4, 'offen', 2)))
+    assert index.bestell_ids(tischnummer=3) == [1, 2]
+    assert index.bestell_ids(kategorie='getraenke') == [2]
+
+    index.status_setzen([1, 3], 'geliefert')
+    assert index.bestell_ids(status='geliefert') == [1, 3]
+    assert index.bestell_ids(status='offen', tischnummer=3) == [2]
+    assert index.bestell_ids(status='geliefert', tischnummer=3, kategorie='essen') == [1]
+
+    index.entfernen(3)
+    assert 4 not in index.tische
+    assert index.bestell_ids() == [1, 2]
+    assert index.bestell_ids(tischnummer=4) == [] and index.bestell_ids(status='storniert') == []
+
+    # Ein erneuter Aufbau verwirft den bisherigen Stand
+    index.aufbauen(bestellungen((7, 1, 'offen', 1)))
+    assert index.bestell_ids() == [7] and index.bestell_ids(status='geliefert') == []
+
+
+def test_abfragen_entsprechen_den_masken(tmp_path):
+    """Nach beliebigen Vorgängen liefert der Speicher über die Indizes dieselben Bestellungen wie die Boolean-Masken."""
+    zufall = random.Random(5)
+    speicher = speicher_oeffnen('csv', str(tmp_path))
+    for _ in range(100):
+        offen = list(speicher.bestellungen_df.index)
+        vorgang = zufall.choice(['aufgeben', 'aufgeben', 'liefern', 'stornieren', 'schliessen']) if offen else 'aufgeben'
+        if vorgang == 'aufgeben':
+            speise_ids = zufall.sample(list(KARTE.index), zufall.randint(1, 3))
+            speicher.bestellung_aufgeben(zufall.randint(1, 5), {i: zufall.randint(1, 3) for i in speise_ids}, KARTE)
+        elif vorgang == 'liefern':
+            speicher.liefern(zufall.sample(offen, zufall.randint(1, min(3, len(offen)))))
+        elif vorgang == 'stornieren':
+            speicher.stornieren(zufall.choice(offen))
+        else:
+            bestell_id = zufall.choice(offen)
+            speicher.schliessen([(bestell_id, zufall.randint(1, int(speicher.bestellung(bestell_id)['Menge'])))])
+
+        for status in (None, 'offen', 'geliefert'):
+            for tischnummer in (None, 1, 3, 5):
+                for kategorie in (None, 'essen', 'getraenke'):
+                    erwartet = mit_masken(speicher.bestellungen_df, status, tischnummer, kategorie)
+                    assert list(speicher.bestellungen(status, tischnummer, kategorie).index) == erwartet
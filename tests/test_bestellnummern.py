@@ -0,0 +1,56 @@
+###
+# Tests der Bestell_ID-Vergabe
+#
+# Aufruf aus dem Projektverzeichnis:
+#     python -m pytest tests
+###
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bestellnummern import BestellIdVergabe
+from bestellspeicher import speicher_oeffnen
+
+
+KARTE = pd.DataFrame({'Speise': ['Tomatensuppe'], 'Preis': [4.5]}, index=pd.Index([1], name='Speise_ID'))
+
+
+def test_erster_start_setzt_hinter_der_hoechsten_id_fort(tmp_path):
+    """Ohne Zählerdatei beginnt die Vergabe hinter der höchsten vorhandenen ID; sie wird erst bei der ersten Vergabe ermittelt."""
+    aufrufe = []
+    vergabe = BestellIdVergabe(str(tmp_path / 'Bestell_ID.txt'), lambda: aufrufe.append(1) or 41, blockgroesse=10)
+    assert not aufrufe
+
+    assert vergabe.vergeben(3) == [42, 43, 44]
+    assert vergabe.vergeben() == [45]
+    assert aufrufe == [1]
+    assert (tmp_path / 'Bestell_ID.txt').read_text(encoding='utf-8') == '54'
+
+
+def test_neustart_vergibt_keine_id_doppelt(tmp_path):
+    """Nach einem Neustart wird hinter dem zuletzt reservierten Block fortgesetzt."""
+    pfad = str(tmp_path / 'Bestell_ID.txt')
+    vergeben = BestellIdVergabe(pfad, lambda: 0, blockgroesse=5).vergeben(7)
+    vergeben += BestellIdVergabe(pfad, lambda: 0, blockgroesse=5).vergeben(7)
+
+    assert len(set(vergeben)) == len(vergeben)
+    assert vergeben == sorted(vergeben)
+
+
+@pytest.mark.parametrize('engine', ['csv', 'sqlite'])
+def test_zaehler_hinter_den_daten(tmp_path, engine):
+    """Liegt der gespeicherte Zähler hinter den vorhandenen Bestellungen, wird keine vorhandene ID erneut vergeben."""
+    speicher = speicher_oeffnen(engine, str(tmp_path))
+    vorhanden = [int(speicher.bestellung_aufgeben(tisch, {1: 1}, KARTE).index[0]) for tisch in (1, 2, 3)]
+    speicher.schliessen([(vorhanden[0], 1)])
+    speicher.sichern()
+    (tmp_path / 'Bestell_ID.txt').write_text('1', encoding='utf-8')
+
+    speicher = speicher_oeffnen(engine, str(tmp_path))
+    neu = int(speicher.bestellung_aufgeben(4, {1: 1}, KARTE).index[0])
+    assert neu > max(vorhanden)
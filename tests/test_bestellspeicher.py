@@ -0,0 +1,150 @@
+###
+# Tests der Speicher-Engines
+#
+# Aufruf aus dem Projektverzeichnis:
+#     python -m pytest tests
+###
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bestelljournal import BESTELL_SPALTEN
+from bestellspeicher import CsvSpeicher, speicher_oeffnen
+
+
+# Karte mit einer Speise für die Testbestellungen
+KARTE = pd.DataFrame({'Speise': ['Tomatensuppe'], 'Preis': [4.5]}, index=pd.Index([1], name='Speise_ID'))
+
+
+def geschlossene_mengen(speicher) -> dict[tuple[int, str], int]:
+    """Gibt die Menge je (Bestell_ID, Status) der geschlossenen Bestellungen zurück."""
+    geschlossen = speicher.geschlossene_bestellungen()
+    return {(int(bestell_id), status): int(menge)
+            for bestell_id, status, menge in zip(geschlossen.index, geschlossen['Status'], geschlossen['Menge'])}
+
+
+@pytest.mark.parametrize('engine', ['csv', 'sqlite'])
+def test_teilweise_abgerechnet_dann_storniert(tmp_path, engine):
+    """Die abgerechnete Teilmenge bleibt erhalten, wenn der Rest der Bestellung storniert wird."""
+    speicher = speicher_oeffnen(engine, str(tmp_path))
+    bestell_id = int(speicher.bestellung_aufgeben(5, {1: 3}, KARTE).index[0])
+
+    speicher.schliessen([(bestell_id, 1)])
+    speicher.stornieren(bestell_id)
+
+    erwartet = {(bestell_id, 'geschlossen'): 1, (bestell_id, 'storniert'): 2}
+    assert geschlossene_mengen(speicher) == erwartet
+    assert not speicher.enthaelt(bestell_id)
+
+    # Auch nach dem Sichern und erneuten Öffnen
+    speicher.sichern()
+    assert geschlossene_mengen(speicher_oeffnen(engine, str(tmp_path))) == erwartet
+
+
+@pytest.mark.parametrize('engine', ['csv', 'sqlite'])
+def test_teilabrechnungen_werden_aufaddiert(tmp_path, engine):
+    """Mehrere Teilabrechnungen einer Bestellung ergeben eine abgerechnete Zeile."""
+    speicher = speicher_oeffnen(engine, str(tmp_path))
+    bestell_id = int(speicher.bestellung_aufgeben(5, {1: 3}, KARTE).index[0])
+
+    speicher.schliessen([(bestell_id, 1)])
+    speicher.schliessen([(bestell_id, 2)])
+
+    assert geschlossene_mengen(speicher) == {(bestell_id, 'geschlossen'): 3}
+    assert not speicher.enthaelt(bestell_id)
+
+
+def test_import_trennt_abgerechnet_und_storniert(tmp_path):
+    """Beim Import der CSV-Daten in die SQLite-Engine werden abgerechnete und stornierte Mengen nicht zusammengefasst."""
+    csv_speicher = speicher_oeffnen('csv', str(tmp_path))
+    bestell_id = int(csv_speicher.bestellung_aufgeben(5, {1: 3}, KARTE).index[0])
+    csv_speicher.schliessen([(bestell_id, 1)])
+    csv_speicher.stornieren(bestell_id)
+    csv_speicher.sichern()
+
+    sqlite_speicher = speicher_oeffnen('sqlite', str(tmp_path))
+    assert geschlossene_mengen(sqlite_speicher) == {(bestell_id, 'geschlossen'): 1, (bestell_id, 'storniert'): 2}
+
+
+def test_import_ins_archiv_blockweise(tmp_path):
+    """Der Import der CSV-Datei in Blöcken, die über Monatsgrenzen reichen, ergibt dasselbe Archiv wie die Datei."""
+    geschlossen = pd.DataFrame({
+        'Bestell_ID': [1, 2, 3, 4, 5, 6, 7],
+        'Datum': ['2024-01-05 12:00:00', '2024-01-31 23:00:00', '2024-02-01 08:00:00', '2024-01-15 18:00:00',
+                  '2024-02-10 12:00:00', '2024-03-01 12:00:00', '2024-03-02 12:00:00'],
+        'Tischnummer': [1, 2, 3, 4, 5, 6, 7],
+        'Speise_ID': [1, 1, 1, 1, 1, 1, 1],
+        'Speise': ['Tomatensuppe'] * 7,
+        'Menge': [1, 2, 3, 4, 5, 6, 7],
+        'Status': ['geschlossen', 'geschlossen', 'storniert', 'geschlossen', 'geschlossen', 'storniert', 'geschlossen']
+    })
+    geschlossen.to_csv(tmp_path / 'Bestelldaten_geschlossen.csv', index=False)
+    speicher = CsvSpeicher(str(tmp_path / 'Bestelldaten_offen.csv'), str(tmp_path / 'Bestelldaten_geschlossen.csv'),
+                           str(tmp_path / 'Bestelljournal.csv'), str(tmp_path / 'Bestell_ID.txt'), im_hintergrund=False, block_zeilen=2)
+
+    archiviert = speicher.geschlossene_bestellungen().sort_index()
+    assert archiviert.index.tolist() == geschlossen['Bestell_ID'].tolist()
+    assert archiviert['Menge'].tolist() == geschlossen['Menge'].tolist()
+    assert archiviert['Datum'].tolist() == pd.to_datetime(geschlossen['Datum']).tolist()
+    assert speicher.archiv.monate() == ['2024-01', '2024-02', '2024-03']
+
+
+def test_abbruch_nach_archiv_verdoppelt_nichts(tmp_path, monkeypatch):
+    """Bricht das Sichern nach dem Schreiben des Archivs ab, werden die Abschlüsse beim Abspielen nicht doppelt archiviert."""
+    speicher = speicher_oeffnen('csv', str(tmp_path))
+    bestell_id = int(speicher.bestellung_aufgeben(5, {1: 3}, KARTE).index[0])
+    speicher.schliessen([(bestell_id, 1)])
+    speicher.stornieren(bestell_id)
+
+    def abbrechen(*args, **kwargs):
+        raise OSError('Abbruch vor dem Snapshot')
+    monkeypatch.setattr(speicher.journal, 'kompaktieren', abbrechen)
+    with pytest.raises(OSError):
+        speicher.sichern()
+
+    erwartet = {(bestell_id, 'geschlossen'): 1, (bestell_id, 'storniert'): 2}
+    wieder_geoeffnet = speicher_oeffnen('csv', str(tmp_path))
+    assert geschlossene_mengen(wieder_geoeffnet) == erwartet
+    assert not wieder_geoeffnet.enthaelt(bestell_id)
+    wieder_geoeffnet.sichern()
+    assert geschlossene_mengen(speicher_oeffnen('csv', str(tmp_path))) == erwartet
+
+
+@pytest.mark.parametrize('abbruch_bei', ['_stand.txt', 'Bestelldaten_offen.csv'])
+def test_abbruch_beim_kompaktieren(tmp_path, monkeypatch, abbruch_bei):
+    """Bricht die Kompaktierung vor dem Stand bzw. vor dem Umbenennen des Snapshots ab, wird nichts doppelt abgespielt."""
+    speicher = speicher_oeffnen('csv', str(tmp_path))
+    bestell_id = int(speicher.bestellung_aufgeben(5, {1: 3}, KARTE).index[0])
+    speicher.schliessen([(bestell_id, 1)])
+
+    umbenennen = os.replace
+    def abbrechen(quelle, ziel):
+        if str(ziel).endswith(abbruch_bei):
+            raise OSError('Abbruch beim Kompaktieren')
+        umbenennen(quelle, ziel)
+    monkeypatch.setattr(os, 'replace', abbrechen)
+    with pytest.raises(OSError):
+        speicher.sichern()
+    monkeypatch.undo()
+
+    wieder_geoeffnet = speicher_oeffnen('csv', str(tmp_path))
+    assert wieder_geoeffnet.bestellung(bestell_id)['Menge'] == 2
+    assert geschlossene_mengen(wieder_geoeffnet) == {(bestell_id, 'geschlossen'): 1}
+    assert not list(tmp_path.glob('Bestelldaten_offen.csv.*.tmp'))
+
+    # Der Snapshot bleibt eine normale CSV-Datei
+    wieder_geoeffnet.sichern()
+    assert list(pd.read_csv(tmp_path / 'Bestelldaten_offen.csv').columns) == BESTELL_SPALTEN
+
+
+def test_zeitraum_nutzt_datumsindex(tmp_path):
+    """Die SQLite-Engine liest für einen Zeitraum nur die passenden Zeilen über den Index auf dem Datum."""
+    speicher = speicher_oeffnen('sqlite', str(tmp_path))
+    plan = ' '.join(zeile[-1] for zeile in speicher.verbindung.execute(
+        'EXPLAIN QUERY PLAN SELECT * FROM bestellungen_geschlossen WHERE Datum >= ? AND Datum < ?', ('2024-01-01', '2024-02-01')))
+    assert 'USING INDEX bestellungen_geschlossen_datum' in plan
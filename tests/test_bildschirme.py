@@ -0,0 +1,169 @@
+###
+# Dauertest der Bildschirmwechsel: Anzahl der Tk-Widgets bleibt konstant
+#
+# Startet die Restaurant-App ohne Ereignisschleife in einem temporären Projektverzeichnis (Skript und Bilder kopiert,
+# Daten aus benchmarks/lastdaten.py mit offenen und gelieferten Bestellungen an Tisch 1), öffnet die Sitzung und löst
+# reihum die Navigations-Buttons aus (Essen, Getränke, Rechnungen, Statistik und deren Unterbuttons einschließlich
+# Suche und Tischauswahl). Nach einer Aufwärmrunde muss die Anzahl der Widgets nach jeder vollen Runde gleich bleiben.
+# Meldungsfenster werden unterdrückt. Ohne Anzeige (z.B. Linux ohne DISPLAY) wird der Test übersprungen; mit
+# 'xvfb-run' lässt er sich auch ohne Bildschirm ausführen.
+#
+# Aufruf aus dem Projektverzeichnis:
+#     python -m pytest tests
+###
+
+import os
+import runpy
+import shutil
+import sys
+import tkinter as tk
+from tkinter import messagebox
+
+import pandas as pd
+import pytest
+
+PROJEKT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJEKT)
+sys.path.insert(0, os.path.join(PROJEKT, 'benchmarks'))
+
+from bestelljournal import BESTELL_SPALTEN
+from bildschirme import widgets_zaehlen
+from finanzbericht import diagramm_pool_beenden
+from lastdaten import lastdaten_schreiben, lastprofil
+
+
+# Hauptskript der App; es wechselt beim Laden in sein eigenes Verzeichnis und wird daher in das temporäre Projekt kopiert
+SKRIPT: str = 'Abschlussprojekt Restaurant-App Daniel Bahr.py'
+
+# Anzahl der Navigationen nach der Aufwärmrunde
+ANZAHL: int = 10_000
+
+# Tisch mit offenen und gelieferten Essen und Getränken (Suche und Tischauswahl)
+TISCH: int = 1
+
+# Eine Runde Navigation: (Bereich, Button-Text); der Bereich None steht für die Haupt-Buttons der Sitzung
+RUNDE: list[tuple[str | None, str]] = [
+    (None, 'Essen'),
+    ('bestellung_frame', 'Neue Bestellung'),
+    ('bestellung_frame', 'Storno / Liefern'),
+    ('bestellung_frame', 'Suche'),
+    ('bestellung_frame', 'Suche'),
+    ('bestellung_frame', 'Aktive Bestellungen'),
+    (None, 'Getränke'),
+    ('bestellung_frame', 'Neue Bestellung'),
+    ('bestellung_frame', 'Storno / Liefern'),
+    ('bestellung_frame', 'Suche'),
+    ('bestellung_frame', 'Aktive Bestellungen'),
+    (None, 'Rechnungen'),
+    ('rechnung_frame', 'Rechnung erstellen'),
+    ('rechnung_frame', 'Pos. Rechnung'),
+    ('rechnung_frame', 'Tischnummer auswahl'),
+    ('rechnung_frame', 'Tischnummer auswahl'),
+    ('rechnung_frame', 'Aktive Rechnungen'),
+    (None, 'Statistik')
+]
+
+
+def anzeige_vorhanden() -> bool:
+    """Prüft, ob sich ein Tk-Hauptfenster öffnen lässt."""
+    if sys.platform.startswith('linux') and not os.environ.get('DISPLAY'):
+        return False
+    try:
+        tk.Tk().destroy()
+    except tk.TclError:
+        return False
+    return True
+
+
+def projekt_anlegen(verzeichnis) -> None:
+    """
+    Legt ein Projektverzeichnis für die App an: Hauptskript und Bilder des Projekts und eine kleine Historie aus den
+    Lastdaten, deren offene Bestellungen durch je ein offenes und ein geliefertes Essen und Getränk an Tisch 1 ersetzt werden.
+    """
+    shutil.copy(os.path.join(PROJEKT, SKRIPT), verzeichnis / SKRIPT)
+    shutil.copytree(os.path.join(PROJEKT, 'tkinter_pics'), verzeichnis / 'tkinter_pics', ignore=shutil.ignore_patterns('skaliert'))
+    daten = verzeichnis / 'data'
+    lastdaten_schreiben(str(daten), lastprofil(jahre=0.1, gedecke=20))
+
+    geschlossen = pd.read_csv(daten / 'Bestelldaten_geschlossen.csv')
+    karte = pd.concat(pd.read_csv(daten / name, index_col='Speise_ID').head(1) for name in ('Speisekarte.csv', 'Getränkekarte.csv'))
+    erste_id = int(geschlossen['Bestell_ID'].max()) + 1
+    offen = pd.DataFrame({
+        'Bestell_ID': range(erste_id, erste_id + 4),
+        'Datum': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'Tischnummer': TISCH,
+        'Speise_ID': list(karte.index) * 2,
+        'Speise': list(karte['Speise']) * 2,
+        'Menge': [1, 2, 3, 1],
+        'Status': ['offen', 'offen', 'geliefert', 'geliefert']
+    })
+    offen[BESTELL_SPALTEN].to_csv(daten / 'Bestelldaten_offen.csv', index=False)
+
+
+def button_finden(wurzel: tk.Misc, text: str) -> tk.Button:
+    """Sucht den zuletzt erzeugten Button mit dem Text unterhalb von 'wurzel'."""
+    treffer: list[tk.Button] = []
+    offen = [wurzel]
+    while offen:
+        widget = offen.pop(0)
+        if isinstance(widget, tk.Button) and widget.cget('text') == text:
+            treffer.append(widget)
+        offen.extend(widget.winfo_children())
+    if not treffer:
+        raise LookupError(f'Button nicht gefunden: {text}')
+    return treffer[-1]
+
+
+def eingaben_fuellen(wurzel: tk.Misc, wert: str) -> None:
+    """Setzt alle leeren Eingabefelder unterhalb von 'wurzel' (Tischnummer, Bestell_ID) auf 'wert'."""
+    offen = [wurzel]
+    while offen:
+        widget = offen.pop()
+        if isinstance(widget, tk.Entry) and not widget.get():
+            widget.insert(0, wert)
+        offen.extend(widget.winfo_children())
+
+
+@pytest.mark.skipif(not anzeige_vorhanden(), reason='Keine Anzeige für Tk vorhanden (z.B. mit xvfb-run ausführen)')
+def test_bildschirmwechsel_ohne_widget_wachstum(tmp_path, monkeypatch):
+    """Über viele Bildschirmwechsel bleibt die Anzahl der Widgets gleich; die Navigation ändert keine Bestellungen."""
+    projekt_anlegen(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    # Ereignisschleife und Meldungsfenster abschalten, dann die App wie beim Start laden
+    monkeypatch.setattr(tk.Misc, 'mainloop', lambda self, n=0: None)
+    for name in ('showinfo', 'showwarning', 'showerror'):
+        monkeypatch.setattr(messagebox, name, lambda *args, **kwargs: 'ok')
+    app = runpy.run_path(str(tmp_path / SKRIPT), run_name='__main__')
+    root: tk.Tk = app['root']
+    restaurant = app['Restaurant']
+    sitzung = restaurant.sitzung_oeffnen(app['hintergrund'])
+    bestellungen_vorher = restaurant.speicher.bestellungen()
+
+    def navigieren(schritt: int) -> None:
+        bereich, text = RUNDE[schritt % len(RUNDE)]
+        wurzel = sitzung.startframe if bereich is None else getattr(sitzung, bereich)
+        eingaben_fuellen(wurzel, str(TISCH))
+        button_finden(wurzel, text).invoke()
+
+    try:
+        # Aufwärmrunde: dauerhafte Bildschirme werden einmal erzeugt
+        for schritt in range(len(RUNDE)):
+            navigieren(schritt)
+        root.update()
+        basis = widgets_zaehlen(root)
+
+        verlauf: list[int] = []
+        for schritt in range(ANZAHL):
+            navigieren(schritt)
+            if (schritt + 1) % len(RUNDE) == 0:
+                root.update()
+                verlauf.append(widgets_zaehlen(root))
+    finally:
+        sitzung.worker_beenden()
+        restaurant.umsatzstatistik.beenden()
+        diagramm_pool_beenden()
+        root.destroy()
+
+    assert len(verlauf) == ANZAHL // len(RUNDE)
+    assert min(verlauf) == max(verlauf) == basis
+    pd.testing.assert_frame_equal(restaurant.speicher.bestellungen(), bestellungen_vorher)
@@ -0,0 +1,64 @@
+###
+# Tests des Diagrammcaches
+#
+# Aufruf aus dem Projektverzeichnis:
+#     python -m pytest tests
+###
+
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from diagrammcache import Diagrammcache, daten_hash
+
+
+def ablegen(cache: Diagrammcache, name: str, zeitpunkt: float) -> str:
+    """Legt ein Bild mit der angegebenen Änderungszeit (Zeitpunkt der letzten Verwendung) ab."""
+    pfad = cache.pfad(name, daten_hash(name))
+    with open(pfad, 'wb') as datei:
+        datei.write(b'png')
+    os.utime(pfad, (zeitpunkt, zeitpunkt))
+    return pfad
+
+
+def test_daten_hash():
+    """Gleiche Daten ergeben denselben Schlüssel; andere Werte, Namen oder Diagrammarten einen anderen."""
+    mengen = pd.Series([3, 1], index=pd.Index(['Salat', 'Suppe'], name='Speise'), name='Menge')
+    schluessel = daten_hash('essen_zaehlung', mengen, 'Titel')
+
+    assert len(schluessel) == 16
+    assert daten_hash('essen_zaehlung', mengen.copy(), 'Titel') == schluessel
+    assert daten_hash('essen_zaehlung', mengen.replace(3, 4), 'Titel') != schluessel
+    assert daten_hash('essen_zaehlung', mengen.rename('Umsatz'), 'Titel') != schluessel
+    assert daten_hash('essen_zaehlung', mengen, 'Anderer Titel') != schluessel
+    assert daten_hash('getraenke_zaehlung', mengen, 'Titel') != schluessel
+
+
+def test_nachschlagen(tmp_path):
+    """Ein Treffer markiert das Bild als zuletzt verwendet, fehlende Bilder sind kein Treffer."""
+    cache = Diagrammcache(str(tmp_path))
+    pfad = ablegen(cache, 'umsatz', 1_000)
+
+    assert not cache.nachschlagen(cache.pfad('umsatz', '0' * 16))
+    assert cache.nachschlagen(pfad)
+    assert os.path.getmtime(pfad) > 1_000
+
+
+def test_aufraeumen_entfernt_die_am_laengsten_nicht_verwendeten(tmp_path):
+    """Über 'max_bilder' werden die ältesten Verwendungen entfernt; ein Treffer schützt ein altes Bild."""
+    cache = Diagrammcache(str(tmp_path), max_bilder=3)
+    pfade = [ablegen(cache, f'bild{i}', 1_000 + i) for i in range(5)]
+    (tmp_path / 'Finanzbericht.pdf').write_bytes(b'pdf')
+    assert cache.nachschlagen(pfade[0])
+
+    assert sorted(cache.aufraeumen()) == [pfade[1], pfade[2]]
+    assert sorted(os.listdir(tmp_path)) == sorted(['Finanzbericht.pdf'] + [os.path.basename(p) for p in (pfade[0], pfade[3], pfade[4])])
+    assert cache.aufraeumen() == []
+
+
+def test_aufraeumen_ohne_verzeichnis(tmp_path):
+    """Ohne Ablageverzeichnis gibt es nichts aufzuräumen."""
+    assert Diagrammcache(str(tmp_path / 'fehlt'), max_bilder=0).aufraeumen() == []
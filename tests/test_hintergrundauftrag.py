@@ -0,0 +1,109 @@
+###
+# Tests der Hintergrundaufträge (Rechnungsdruck und Finanzbericht)
+#
+# Aufruf aus dem Projektverzeichnis:
+#     python -m pytest tests
+###
+
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import berichtsauftrag
+from hintergrundauftrag import Hintergrundauftrag
+
+
+class Widget():
+    """Ersatz für ein Tk-Widget: 'after' merkt sich die Rückrufe, 'abarbeiten' führt sie nacheinander aus."""
+
+    def __init__(self) -> None:
+        self.geplant: list = []
+
+    def after(self, ms: int, funktion) -> None:
+        self.geplant.append(funktion)
+
+    def abarbeiten(self) -> None:
+        while self.geplant:
+            self.geplant.pop(0)()
+
+
+class Sammler(Hintergrundauftrag):
+    """Liefert die Ergebnisse in eine Liste aus."""
+
+    def __init__(self, widget: Widget) -> None:
+        super().__init__(widget, ThreadPoolExecutor(max_workers=2))
+        self.ausgeliefert: list = []
+        self.laufend = 0
+
+    def _ausliefern(self, kontext, auftrag) -> None:
+        self.ausgeliefert.append((kontext, auftrag.result()))
+
+    def _laufend(self) -> None:
+        self.laufend += 1
+
+
+def test_auftraege_werden_im_hauptthread_ausgeliefert():
+    """Fertige Aufträge werden über 'after' ausgeliefert; die Abfrage wird nur einmal geplant und endet mit dem letzten Auftrag."""
+    widget = Widget()
+    sammler = Sammler(widget)
+    freigabe = threading.Event()
+    erster = sammler._einreichen('a', lambda: 1)
+    zweiter = sammler._einreichen('b', lambda: freigabe.wait() and 2)
+    assert len(widget.geplant) == 1 and sammler.laeuft
+
+    erster.result()
+    widget.geplant.pop(0)()
+    assert sammler.ausgeliefert == [('a', 1)]
+    assert sammler.laeuft and sammler.laufend == 1 and len(widget.geplant) == 1
+
+    freigabe.set()
+    zweiter.result()
+    widget.abarbeiten()
+    assert sammler.ausgeliefert == [('a', 1), ('b', 2)]
+    assert not sammler.laeuft and widget.geplant == []
+    sammler.beenden()
+
+
+def test_bericht_abbrechen(monkeypatch):
+    """Ein abgebrochener Bericht wird als abgebrochen gemeldet und nicht geöffnet."""
+    def erstellen(summen_df, von, bis, verzeichnis, fortschritt, abbruch):
+        fortschritt('Diagramme')
+        abbruch.wait()
+        raise berichtsauftrag.BerichtAbgebrochen()
+
+    monkeypatch.setattr(berichtsauftrag, 'finanzbericht_erstellen', erstellen)
+    widget = Widget()
+    meldungen: list[str] = []
+    geoeffnet: list[str] = []
+    auftrag = berichtsauftrag.Berichtsauftrag(widget, anzeigen=meldungen.append, oeffnen=geoeffnet.append)
+    summen = pd.DataFrame({'Menge': [1]})
+    assert auftrag.starten(lambda: summen, None, None)
+    assert not auftrag.starten(lambda: summen, None, None)
+
+    auftrag.abbrechen()
+    widget.abarbeiten()
+    assert meldungen[-1] == 'Bericht abgebrochen' and geoeffnet == []
+    assert not auftrag.laeuft and auftrag.auftrag is None
+    auftrag.beenden()
+
+
+def test_bericht_ohne_daten(monkeypatch):
+    """Liefert die Abfrage im Worker keine Summen, wird kein Bericht erstellt und 'Keine Daten' gemeldet."""
+    erstellt: list = []
+    hinweise: list = []
+    monkeypatch.setattr(berichtsauftrag, 'finanzbericht_erstellen', lambda *args, **kwargs: erstellt.append(args))
+    monkeypatch.setattr(berichtsauftrag.messagebox, 'showinfo', lambda *args: hinweise.append(args))
+    widget = Widget()
+    meldungen: list[str] = []
+    auftrag = berichtsauftrag.Berichtsauftrag(widget, anzeigen=meldungen.append, oeffnen=erstellt.append)
+    auftrag.starten(lambda: pd.DataFrame(), None, None)
+    auftrag.auftrag.exception()
+    widget.abarbeiten()
+    assert meldungen == ['Daten werden geladen...', 'Keine Daten zur Auswertung vorhanden']
+    assert erstellt == [] and len(hinweise) == 1
+    auftrag.beenden()
@@ -0,0 +1,70 @@
+###
+# Tests des Speisekatalogs
+#
+# Aufruf aus dem Projektverzeichnis:
+#     python -m pytest tests
+###
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PROJEKT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJEKT)
+
+from speisekatalog import Speisekatalog
+
+
+# Speisen mit Lücke in den Speise_IDs und ein Getränk (> 99)
+SPEISEKARTE = pd.DataFrame({'Speise': ['Tomatensuppe', 'Salat'], 'Preis': [4.1, 3.35]}, index=pd.Index([1, 3], name='Speise_ID'))
+GETRAENKEKARTE = pd.DataFrame({'Speise': ['Wasser'], 'Preis': [2.0]}, index=pd.Index([101], name='Speise_ID'))
+KATALOG = Speisekatalog(SPEISEKARTE, GETRAENKEKARTE)
+
+
+def test_karten_des_projekts():
+    """Der aus den Karten des Projekts geladene Katalog liefert für jede Speise_ID Bezeichnung und Preis der Karten."""
+    pfade = [os.path.join(PROJEKT, 'data', datei) for datei in ('Speisekarte.csv', 'Getränkekarte.csv')]
+    karte = pd.concat(pd.read_csv(pfad, index_col='Speise_ID') for pfad in pfade)
+    katalog = Speisekatalog.laden(*pfade)
+
+    assert katalog.namen_fuer(karte.index).tolist() == karte['Speise'].tolist()
+    np.testing.assert_array_equal(katalog.preise_fuer(karte.index), karte['Preis'].to_numpy())
+    pd.testing.assert_frame_equal(katalog.karte(), karte[['Speise', 'Preis']].sort_index(), check_index_type=False)
+
+
+def test_abfragen():
+    """Preise und Bezeichnungen werden in der Reihenfolge der Speise_IDs geliefert, auch bei Wiederholungen."""
+    np.testing.assert_array_equal(KATALOG.preise_fuer([101, 1, 1, 3]), [2.0, 4.1, 4.1, 3.35])
+    assert KATALOG.namen_fuer(pd.Series([3, 101])).tolist() == ['Salat', 'Wasser']
+    assert KATALOG.preise_fuer([]).size == 0
+
+
+@pytest.mark.parametrize('speise_id', [0, 2, 50, 102, 10_000, -1])
+def test_unbekannte_speise_ids(speise_id):
+    """Lücken, IDs außerhalb des Katalogs und negative IDs sind nicht enthalten und werden bei Abfragen gemeldet."""
+    assert not KATALOG.enthaelt(speise_id)
+    assert KATALOG.enthalten([1, speise_id]).tolist() == [True, False]
+    with pytest.raises(KeyError, match=str(speise_id)):
+        KATALOG.preise_fuer([1, speise_id])
+    with pytest.raises(KeyError):
+        KATALOG.namen_fuer([speise_id])
+
+
+def test_karte_je_kategorie():
+    """Die Karte einer Kategorie enthält nur deren Speise_IDs."""
+    assert KATALOG.karte('essen').index.tolist() == [1, 3]
+    assert KATALOG.karte('getraenke').to_dict('index') == {101: {'Speise': 'Wasser', 'Preis': 2.0}}
+    assert KATALOG.karte().index.tolist() == [1, 3, 101]
+
+
+def test_positionspreise():
+    """Positionspreise sind Menge mal Einzelpreis auf zwei Stellen gerundet; entfernte Speisen erhalten NaN."""
+    bestellungen = pd.DataFrame({'Speise_ID': [1, 3, 7, 101], 'Menge': [3, 3, 1, 2]}, index=pd.Index([10, 11, 12, 13], name='Bestell_ID'))
+    preise = KATALOG.positionspreise(bestellungen)
+
+    assert preise.index.tolist() == [10, 11, 12, 13]
+    assert preise[[10, 11, 13]].tolist() == [12.3, 10.05, 4.0]
+    assert np.isnan(preise[12])
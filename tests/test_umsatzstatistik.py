@@ -0,0 +1,171 @@
+###
+# Tests der Umsatzstatistik
+#
+# Aufruf aus dem Projektverzeichnis:
+#     python -m pytest tests
+###
+
+import os
+import sqlite3
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bestellspeicher import speicher_oeffnen
+from speisekatalog import Speisekatalog
+from umsatzstatistik import Umsatzstatistik
+
+
+# Speise (1) und Getränk (30) mit Preisen, die sich in Euro nicht exakt als Gleitkommazahl darstellen lassen
+KARTE = pd.DataFrame({'Speise': ['Tomatensuppe', 'Wasser'], 'Preis': [4.1, 0.1]}, index=pd.Index([1, 30], name='Speise_ID'))
+KATALOG = Speisekatalog(KARTE)
+
+
+def test_umsatz_in_cent_exakt(tmp_path):
+    """Viele einzelne Abrechnungen ergeben den exakten Umsatz; gespeichert werden ganze Cent."""
+    speicher = speicher_oeffnen('csv', str(tmp_path))
+    statistik = Umsatzstatistik.oeffnen(speicher, KATALOG, str(tmp_path / 'Umsatzstatistik.db'))
+    statistik.summen()
+    for _ in range(10):
+        bestellung = speicher.bestellung_aufgeben(1, {30: 1}, KARTE)
+        speicher.schliessen([(int(bestellung.index[0]), 1)])
+
+    assert statistik.summen().loc[30, 'Umsatz'] == 1.0
+    typen = {typ for (typ,) in statistik.verbindung.execute('SELECT typeof(Umsatz_Cent) FROM umsatz_tag')}
+    assert typen == {'integer'}
+
+
+def test_alte_datenbank_wird_neu_aufgebaut(tmp_path):
+    """Eine Datenbank mit dem Umsatz in Euro (REAL) wird verworfen und aus der Historie neu aufgebaut."""
+    pfad = str(tmp_path / 'Umsatzstatistik.db')
+    with sqlite3.connect(pfad) as verbindung:
+        verbindung.execute('CREATE TABLE umsatz_tag (Tag TEXT, Speise_ID INTEGER, Speise TEXT, Kategorie TEXT, Menge INTEGER, '
+                           'Umsatz REAL, Anzahl INTEGER, Storno_Menge INTEGER, Storno_Anzahl INTEGER)')
+        verbindung.execute('CREATE TABLE umsatz_gesamt (Speise_ID INTEGER, Speise TEXT, Kategorie TEXT, Menge INTEGER, '
+                           'Umsatz REAL, Anzahl INTEGER, Storno_Menge INTEGER, Storno_Anzahl INTEGER)')
+    verbindung.close()
+    speicher = speicher_oeffnen('csv', str(tmp_path))
+    bestellung = speicher.bestellung_aufgeben(1, {1: 2}, KARTE)
+    speicher.schliessen([(int(bestellung.index[0]), 2)])
+
+    statistik = Umsatzstatistik.oeffnen(speicher, KATALOG, pfad, im_hintergrund=False)
+    assert not statistik.aufgebaut
+    assert statistik.summen().loc[1, ['Menge', 'Umsatz']].tolist() == [2, pytest.approx(8.2)]
+
+
+def historie_schreiben(verzeichnis) -> None:
+    """
+    Schreibt geschlossene Bestellungen über drei Monate (mit abgerechnetem und storniertem Teil einer Bestellung) und offene
+    Bestellungen; Bestellung 12 ist bereits teilweise abgerechnet.
+    """
+    geschlossen = pd.DataFrame({
+        'Bestell_ID': [1, 2, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12],
+        'Datum': ['2024-01-03 12:00:00', '2024-01-03 12:05:00', '2024-01-03 12:05:00', '2024-01-20 19:00:00',
+                  '2024-02-01 11:00:00', '2024-02-01 11:30:00', '2024-02-14 20:00:00', '2024-02-29 21:00:00',
+                  '2024-03-01 10:00:00', '2024-03-01 10:00:00', '2024-03-15 13:00:00', '2024-03-31 23:00:00',
+                  '2024-03-31 22:00:00'],
+        'Tischnummer': [1, 2, 2, 3, 1, 4, 5, 2, 1, 1, 6, 3, 7],
+        'Speise_ID': [1, 30, 30, 1, 1, 30, 1, 30, 1, 30, 1, 30, 1],
+        'Speise': ['Tomatensuppe', 'Wasser', 'Wasser', 'Tomatensuppe', 'Tomatensuppe', 'Wasser', 'Tomatensuppe', 'Wasser',
+                   'Tomatensuppe', 'Wasser', 'Tomatensuppe', 'Wasser', 'Tomatensuppe'],
+        'Menge': [2, 3, 1, 1, 4, 7, 2, 1, 5, 2, 3, 9, 1],
+        'Status': ['geschlossen', 'geschlossen', 'storniert', 'geschlossen', 'geschlossen', 'storniert', 'geschlossen',
+                   'geschlossen', 'geschlossen', 'geschlossen', 'storniert', 'geschlossen', 'geschlossen']
+    })
+    geschlossen.to_csv(verzeichnis / 'Bestelldaten_geschlossen.csv', index=False)
+    offen = pd.DataFrame({
+        'Bestell_ID': [12, 13, 14],
+        'Datum': ['2024-03-31 22:00:00', '2024-04-01 12:00:00', '2024-04-01 12:01:00'],
+        'Tischnummer': [7, 7, 8],
+        'Speise_ID': [1, 30, 1],
+        'Speise': ['Tomatensuppe', 'Wasser', 'Tomatensuppe'],
+        'Menge': [4, 2, 1],
+        'Status': ['geliefert', 'geliefert', 'offen']
+    })
+    offen.to_csv(verzeichnis / 'Bestelldaten_offen.csv', index=False)
+    (verzeichnis / 'Bestell_ID.txt').write_text('14')
+
+
+def tagessummen(statistik: Umsatzstatistik) -> pd.DataFrame:
+    """Liest alle Tagessummen sortiert nach Tag und Speise_ID."""
+    return pd.read_sql_query('SELECT * FROM umsatz_tag ORDER BY Tag, Speise_ID', statistik.verbindung)
+
+
+@pytest.mark.parametrize('engine', ['csv', 'sqlite'])
+def test_blockweiser_aufbau_entspricht_aufbau_im_speicher(tmp_path, engine):
+    """Der blockweise Aufbau aus dem Speicher ergibt für jede Blockgröße dieselben Summen wie der Aufbau aus allen Zeilen."""
+    historie_schreiben(tmp_path)
+    speicher = speicher_oeffnen(engine, str(tmp_path))
+    # Abschlüsse seit dem letzten Sichern: zwei Teilabrechnungen derselben Bestellung und ein Storno
+    speicher.schliessen([(12, 1)])
+    speicher.schliessen([(12, 2), (13, 2)])
+    speicher.stornieren(14)
+
+    def vergleichen() -> None:
+        # Erst blockweise (bei 'csv' vor dem ersten Import aus der CSV-Datei), danach der Aufbau aus allen Zeilen
+        blockweise = {}
+        for zeilen in (1, 2, 5, 1000):
+            statistik = Umsatzstatistik(KATALOG, str(tmp_path / f'Block_{zeilen}.db'))
+            statistik.aus_speicher_aufbauen(speicher, zeilen)
+            blockweise[zeilen] = (tagessummen(statistik), statistik.summen())
+            statistik.schliessen()
+        referenz = Umsatzstatistik(KATALOG, str(tmp_path / 'Referenz.db'))
+        referenz.aufbauen(speicher.geschlossene_bestellungen())
+        for tage, summen in blockweise.values():
+            pd.testing.assert_frame_equal(tage, tagessummen(referenz))
+            pd.testing.assert_frame_equal(summen, referenz.summen())
+        referenz.schliessen()
+
+    vergleichen()
+    # Nach dem Sichern liegen die Abschlüsse in den Monatspartitionen bzw. der Datenbank
+    speicher.sichern()
+    speicher.schliessen([(12, 1)])
+    vergleichen()
+
+
+@pytest.mark.parametrize('engine', ['csv', 'sqlite'])
+def test_aufbau_im_hintergrund_mit_abschluessen_waehrenddessen(tmp_path, engine, monkeypatch):
+    """
+    Abschlüsse, während der Aufbau im Hintergrund läuft, werden nachgetragen, sodass das Ergebnis einem sofortigen Aufbau
+    entspricht; Abfragen warten auf den Aufbau und laufen auch in einem Worker-Thread.
+    """
+    historie_schreiben(tmp_path)
+    speicher = speicher_oeffnen(engine, str(tmp_path))
+    # Referenz: beim Öffnen sofort aufgebaut, danach zählt sie jeden Abschluss direkt
+    referenz = Umsatzstatistik.oeffnen(speicher, KATALOG, str(tmp_path / 'Referenz.db'), im_hintergrund=False)
+    referenz.summen()
+    freigabe = threading.Event()
+    original = speicher.geschlossene_bloecke
+
+    def gebremst(zeilen):
+        # Der Stand wird beim Aufruf festgehalten, die Blöcke werden erst nach der Freigabe gelesen
+        bloecke = original(zeilen)
+
+        def lesen():
+            freigabe.wait()
+            yield from bloecke
+        return lesen()
+
+    monkeypatch.setattr(speicher, 'geschlossene_bloecke', gebremst)
+    statistik = Umsatzstatistik.oeffnen(speicher, KATALOG, str(tmp_path / 'Umsatzstatistik.db'), block_zeilen=2)
+    with ThreadPoolExecutor(max_workers=1) as worker:
+        abfrage = worker.submit(statistik.summen)
+        speicher.schliessen([(12, 1)])
+        speicher.schliessen([(12, 2), (13, 2)])
+        speicher.stornieren(14)
+        assert not statistik.aufgebaut and not abfrage.done()
+        freigabe.set()
+        summen = abfrage.result()
+    assert statistik.aufgebaut
+    speicher.schliessen([(12, 1)])
+
+    pd.testing.assert_frame_equal(tagessummen(statistik), tagessummen(referenz))
+    pd.testing.assert_frame_equal(statistik.summen(), referenz.summen())
+    assert summen.loc[1, 'Menge'] < referenz.summen().loc[1, 'Menge']
+    referenz.schliessen()
+    statistik.schliessen()
@@ -0,0 +1,442 @@
+###
+# Umsatzstatistik der Restaurant-App
+#
+# Beschreibung:
+# Persistente, inkrementell gepflegte Summen je Speise und Tag (Menge, Umsatz, Stornos) in './data/Umsatzstatistik.db'.
+# Die Statistik meldet sich beim Bestellspeicher als Beobachter an und addiert bei jeder Abrechnung und Stornierung
+# nur die übernommenen Zeilen auf. Der Finanzbericht liest die Gesamtsummen je Speise, statt bei jedem Aufruf die
+# komplette Historie der geschlossenen Bestellungen einzulesen, zu bepreisen und mehrfach zu gruppieren.
+# Beim ersten Öffnen (Datei noch nicht vorhanden) werden die Summen einmalig aus der Historie aufgebaut, und zwar in einem
+# Hintergrund-Thread, damit weder der Start noch der Tk-Thread auf die geschlossenen Bestellungen wartet. Der Aufbau liest die Historie
+# blockweise aus dem Bestellspeicher (Monatspartitionen des Archivs, vor dem Import die CSV-Datei in Blöcken mit festen
+# Datentypen bzw. SQLite-Cursor) und faltet jeden Block sofort in Teilsummen je Tag und Speise, sodass nie die komplette
+# Historie im Speicher liegt; die Blockgröße ('block_zeilen') begrenzt den Speicherbedarf. Der Stand der Historie wird
+# beim Start des Aufbaus festgehalten; Abschlüsse danach werden gesammelt und nach dem Aufbau aufaddiert. Der ausstehende
+# Aufbau ist in 'PRAGMA user_version' vermerkt und übersteht so auch einen Neustart bzw. einen Abbruch beim Beenden.
+# Abfragen und der Aufbau verwenden eigene Datenbankverbindungen (WAL), sodass der Finanzbericht die Summen im
+# Hintergrund lesen kann, während der Tk-Thread weiter Abschlüsse aufaddiert.
+# Die Tagessummen liegen nach Tag sortiert (Primärschlüssel Tag, Speise_ID), sodass ein Bericht für einen Zeitraum
+# per Bereichssuche im B-Baum nur die Tage dieses Zeitraums liest.
+# Umsätze werden in ganzen Cent summiert und gespeichert ('Umsatz_Cent') und erst bei der Abfrage in Euro umgerechnet;
+# dadurch ist das Ergebnis unabhängig von der Blockgröße und der Anzahl der Abschlüsse exakt. Ältere Datenbanken mit
+# dem Umsatz in Euro werden verworfen und aus der Historie neu aufgebaut.
+###
+
+import os
+import sqlite3
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from datetime import date, timedelta
+from typing import Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from bestellindex import kategorie_von
+from bestellspeicher import Bestellspeicher
+from speisekatalog import Speisekatalog
+
+
+# Gespeicherte Summenspalten je Speise (Umsatz in ganzen Cent, Abfragen liefern 'Umsatz' in Euro)
+SUMMEN_SPALTEN: list[str] = ['Menge', 'Umsatz_Cent', 'Anzahl', 'Storno_Menge', 'Storno_Anzahl']
+
+SCHEMA: str = '''
+CREATE TABLE IF NOT EXISTS umsatz_tag (
+    Tag TEXT NOT NULL,
+    Speise_ID INTEGER NOT NULL,
+    Speise TEXT NOT NULL,
+    Kategorie TEXT NOT NULL,
+    Menge INTEGER NOT NULL DEFAULT 0,
+    Umsatz_Cent INTEGER NOT NULL DEFAULT 0,
+    Anzahl INTEGER NOT NULL DEFAULT 0,
+    Storno_Menge INTEGER NOT NULL DEFAULT 0,
+    Storno_Anzahl INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (Tag, Speise_ID)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS umsatz_gesamt (
+    Speise_ID INTEGER PRIMARY KEY,
+    Speise TEXT NOT NULL,
+    Kategorie TEXT NOT NULL,
+    Menge INTEGER NOT NULL DEFAULT 0,
+    Umsatz_Cent INTEGER NOT NULL DEFAULT 0,
+    Anzahl INTEGER NOT NULL DEFAULT 0,
+    Storno_Menge INTEGER NOT NULL DEFAULT 0,
+    Storno_Anzahl INTEGER NOT NULL DEFAULT 0
+);
+'''
+
+# Zeilen je Block beim Aufbau aus dem Bestellspeicher (Standard, je Statistik einstellbar)
+BLOCK_ZEILEN: int = 100_000
+
+# Wert von 'PRAGMA user_version', solange die Summen noch aus der Historie aufgebaut werden müssen
+AUFBAU_AUSSTEHEND: int = 1
+
+class AufbauAbgebrochen(Exception):
+    """Der Aufbau aus der Historie wurde beim Beenden abgebrochen."""
+
+
+# Vordefinierte Berichtszeiträume
+ZEITRAEUME: tuple[str, ...] = ('monat', 'woche', 'gesamt')
+
+
+def zeitraum_berechnen(art: str, stichtag: date | None = None) -> tuple[date | None, date | None]:
+    """
+    Berechnet Beginn und Ende eines vordefinierten Berichtszeitraums.
+
+    Args:
+        art (str): 'monat' (Kalendermonat des Stichtags), 'woche' (Montag bis Sonntag) oder 'gesamt'.
+        stichtag (date | None): Tag innerhalb des Zeitraums (Standard: heute).
+
+    Raises:
+        ValueError: Bei einem unbekannten Zeitraum.
+
+    Returns:
+        tuple[date | None, date | None]: Erster und letzter Tag (jeweils einschließlich), bei 'gesamt' (None, None).
+    """
+    stichtag = stichtag or date.today()
+    if art == 'monat':
+        beginn = stichtag.replace(day=1)
+        naechster = (beginn + timedelta(days=32)).replace(day=1)
+        return beginn, naechster - timedelta(days=1)
+    if art == 'woche':
+        beginn = stichtag - timedelta(days=stichtag.weekday())
+        return beginn, beginn + timedelta(days=6)
+    if art == 'gesamt':
+        return None, None
+    raise ValueError(f'Unbekannter Zeitraum: {art}')
+
+
+def teilsummen(bestellungen: pd.DataFrame, katalog: Speisekatalog) -> pd.DataFrame:
+    """
+    Fasst abgerechnete bzw. stornierte Zeilen je Tag und Speise_ID zusammen (Umsatz in ganzen Cent).
+
+    Die Funktion:
+    - Bepreist die abgerechneten Zeilen mit dem Speisekatalog (Speisen außerhalb der Karte ohne Umsatz).
+    - Fasst die Zeilen vektorisiert je Tag und Speise_ID zusammen; die Bezeichnung ist die der letzten Zeile.
+
+    Args:
+        bestellungen (pd.DataFrame): Zeilen mit Datum, Speise_ID, Speise, Menge und Status ('geschlossen' oder 'storniert').
+        katalog (Speisekatalog): Katalog für die Preise.
+
+    Returns:
+        pd.DataFrame: Spalten Tag, Speise_ID, Speise, Menge, Umsatz_Cent, Anzahl, Storno_Menge, Storno_Anzahl
+            (sortiert nach Tag und Speise_ID).
+    """
+    storniert = (bestellungen['Status'] == 'storniert').to_numpy()
+    menge = bestellungen['Menge'].to_numpy(dtype=int)
+    preise = katalog.positionspreise(bestellungen).fillna(0).to_numpy()
+    zeilen = pd.DataFrame({
+        'Tag': pd.to_datetime(bestellungen['Datum'], format='ISO8601').dt.strftime('%Y-%m-%d').to_numpy(),
+        'Speise_ID': bestellungen['Speise_ID'].to_numpy(dtype=int),
+        'Speise': bestellungen['Speise'].to_numpy(dtype=object),
+        'Menge': menge * ~storniert,
+        'Umsatz_Cent': np.round(preise * 100).astype(np.int64) * ~storniert,
+        'Anzahl': (~storniert).astype(int),
+        'Storno_Menge': menge * storniert,
+        'Storno_Anzahl': storniert.astype(int)
+    })
+    return teilsummen_falten([zeilen])
+
+
+def teilsummen_falten(teile: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Faltet Teilsummen (oder einzelne Zeilen) je Tag und Speise_ID nacheinander zu einer Summe zusammen.
+
+    Es liegt immer nur die bisherige Summe und der aktuelle Teil im Speicher. Bei gleicher Reihenfolge der Teile
+    entspricht das Ergebnis dem Zusammenfassen aller Zeilen auf einmal (ganzzahlige Summen, letzte Bezeichnung).
+
+    Args:
+        teile (Iterable[pd.DataFrame]): Teile mit den Spalten aus 'teilsummen'.
+
+    Returns:
+        pd.DataFrame: Die Summen je Tag und Speise_ID (leer, wenn keine Teile vorhanden sind).
+    """
+    summe: pd.DataFrame | None = None
+    for teil in teile:
+        zusammen = teil if summe is None else pd.concat([summe, teil], ignore_index=True)
+        summe = zusammen.groupby(['Tag', 'Speise_ID'], as_index=False).agg(
+            Speise=('Speise', 'last'), **{spalte: (spalte, 'sum') for spalte in SUMMEN_SPALTEN})
+    if summe is None:
+        return pd.DataFrame(columns=['Tag', 'Speise_ID', 'Speise'] + SUMMEN_SPALTEN)
+    return summe
+
+
+class Umsatzstatistik():
+    """
+    Tages- und Gesamtsummen je Speise_ID in einer SQLite-Datenbank.
+
+    Spalten der Summen:
+    - 'Menge', 'Umsatz', 'Anzahl': Abgerechnete Menge, Umsatz in Euro (Katalogpreis zum Zeitpunkt der Abrechnung, gespeichert
+      als 'Umsatz_Cent') und Anzahl der abgerechneten Positionen.
+    - 'Storno_Menge', 'Storno_Anzahl': Stornierte Menge und Anzahl der Stornierungen.
+    Der Tag ist das Bestelldatum der Position.
+    """
+
+    def __init__(self, katalog: Speisekatalog, pfad: str = './data/Umsatzstatistik.db', block_zeilen: int = BLOCK_ZEILEN) -> None:
+        """
+        Args:
+            katalog (Speisekatalog): Katalog für die Preise beim Aufaddieren des Umsatzes.
+            pfad (str): Pfad der Datenbank.
+            block_zeilen (int): Zeilen je Block beim Aufbau aus dem Bestellspeicher (begrenzt den Speicherbedarf des Aufbaus).
+        """
+        self.katalog = katalog
+        self.pfad = pfad
+        self.block_zeilen = block_zeilen
+        neu = not os.path.isfile(pfad)
+        self.verbindung = sqlite3.connect(pfad)
+        self.verbindung.execute('PRAGMA journal_mode=WAL')
+        if 'Umsatz' in {zeile[1] for zeile in self.verbindung.execute('PRAGMA table_info(umsatz_tag)')}:
+            # Ältere Datenbank mit dem Umsatz in Euro: verwerfen und aus der Historie neu aufbauen
+            self.verbindung.executescript('DROP TABLE umsatz_tag; DROP TABLE umsatz_gesamt;')
+            neu = True
+        self.verbindung.executescript(SCHEMA)
+        if neu:
+            self.verbindung.execute(f'PRAGMA user_version = {AUFBAU_AUSSTEHEND}')
+        (version,) = self.verbindung.execute('PRAGMA user_version').fetchone()
+        self.aufgebaut = version != AUFBAU_AUSSTEHEND
+        # Speicher, aus dem ein ausstehender Aufbau nachgeholt wird (siehe 'oeffnen')
+        self.speicher: Bestellspeicher | None = None
+        # Aufbau im Hintergrund, Abschlüsse seit dessen Start (None, solange kein Aufbau läuft) und Abbruch beim Beenden
+        self._aufbau: Future | None = None
+        self._nachtrag: list[pd.DataFrame] | None = None
+        self._sperre = threading.Lock()
+        self._abbruch = threading.Event()
+
+    @classmethod
+    def oeffnen(cls, speicher: Bestellspeicher, katalog: Speisekatalog, pfad: str = './data/Umsatzstatistik.db',
+                block_zeilen: int = BLOCK_ZEILEN, im_hintergrund: bool = True) -> 'Umsatzstatistik':
+        """
+        Öffnet die Statistik und meldet sie beim Speicher an. Steht der Aufbau aus den geschlossenen Bestellungen des
+        Speichers noch aus, wird er sofort im Hintergrund gestartet (bzw. mit 'im_hintergrund=False' bei der ersten Abfrage
+        nachgeholt).
+
+        Args:
+            speicher (Bestellspeicher): Der Bestellspeicher, dessen Abschlüsse gezählt werden.
+            katalog (Speisekatalog): Katalog für die Preise.
+            pfad (str): Pfad der Datenbank.
+            block_zeilen (int): Zeilen je Block beim Aufbau aus dem Bestellspeicher.
+            im_hintergrund (bool): Einen ausstehenden Aufbau sofort in einem Hintergrund-Thread starten.
+
+        Returns:
+            Umsatzstatistik: Die geöffnete Statistik.
+        """
+        statistik = cls(katalog, pfad, block_zeilen)
+        statistik.speicher = speicher
+        speicher.beobachten(statistik)
+        if im_hintergrund and not statistik.aufgebaut:
+            statistik.aufbau_starten()
+        return statistik
+
+    # Pflege der Summen
+    def aufbauen(self, geschlossen: pd.DataFrame) -> None:
+        """
+        Verwirft alle Summen und baut sie aus der kompletten Historie der geschlossenen Bestellungen neu auf.
+
+        Args:
+            geschlossen (pd.DataFrame): Alle geschlossenen Bestellungen.
+        """
+        self._ersetzen(self.verbindung, teilsummen(geschlossen, self.katalog) if not geschlossen.empty else None)
+        self._aufgebaut_vermerken(self.verbindung)
+
+    def _ersetzen(self, verbindung: sqlite3.Connection, tage: pd.DataFrame | None) -> None:
+        """Ersetzt alle Summen durch die Teilsummen der kompletten Historie."""
+        with verbindung:
+            verbindung.execute('DELETE FROM umsatz_tag')
+            verbindung.execute('DELETE FROM umsatz_gesamt')
+        if tage is not None:
+            self._summen_schreiben(tage, verbindung)
+
+    def _aufgebaut_vermerken(self, verbindung: sqlite3.Connection) -> None:
+        """Vermerkt, dass die Summen die komplette Historie enthalten und ab jetzt inkrementell gepflegt werden."""
+        verbindung.execute('PRAGMA user_version = 0')
+        self.aufgebaut = True
+
+    def aus_speicher_aufbauen(self, speicher: Bestellspeicher, zeilen: int | None = None) -> None:
+        """
+        Verwirft alle Summen und baut sie blockweise aus den geschlossenen Bestellungen eines Speichers neu auf.
+
+        Statt die komplette Historie zu laden, werden die Blöcke aus 'Bestellspeicher.geschlossene_bloecke' gelesen
+        und jeder Block sofort in die Teilsummen je Tag und Speise gefaltet. Das Ergebnis ist identisch mit 'aufbauen'
+        auf denselben Zeilen.
+
+        Args:
+            speicher (Bestellspeicher): Der Bestellspeicher mit den geschlossenen Bestellungen.
+            zeilen (int | None): Maximale Anzahl Zeilen je Block (Standard: 'block_zeilen' der Statistik).
+        """
+        bloecke = speicher.geschlossene_bloecke(zeilen or self.block_zeilen)
+        tage = teilsummen_falten(teilsummen(block, self.katalog) for block in bloecke)
+        self._ersetzen(self.verbindung, tage)
+        self._aufgebaut_vermerken(self.verbindung)
+
+    def aufbau_starten(self) -> Future:
+        """
+        Startet den Aufbau aus den geschlossenen Bestellungen des Speichers in einem Hintergrund-Thread.
+
+        Die Funktion:
+        - Hält im aufrufenden Thread den Stand der geschlossenen Bestellungen fest (siehe 'Bestellspeicher.geschlossene_bloecke').
+        - Sammelt ab jetzt alle Abschlüsse, die im festgehaltenen Stand fehlen (siehe 'abgeschlossen').
+        - Faltet im Hintergrund die Blöcke in Teilsummen, schreibt sie über eine eigene Verbindung und addiert danach die
+          gesammelten Abschlüsse auf. Erst dann gilt die Statistik als aufgebaut.
+
+        Returns:
+            Future: Ende des Aufbaus (Ergebnis None, Fehler bzw. 'AufbauAbgebrochen' als Ausnahme).
+        """
+        bloecke = self.speicher.geschlossene_bloecke(self.block_zeilen)
+        with self._sperre:
+            self._nachtrag = []
+        self._abbruch = threading.Event()
+        aufbauer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='Umsatzstatistik')
+        self._aufbau = aufbauer.submit(self._im_hintergrund_aufbauen, bloecke, self._abbruch)
+        aufbauer.shutdown(wait=False)
+        return self._aufbau
+
+    def _im_hintergrund_aufbauen(self, bloecke: Iterator[pd.DataFrame], abbruch: threading.Event) -> None:
+        """Baut die Summen aus den Blöcken auf (läuft im Hintergrund-Thread, siehe 'aufbau_starten')."""
+        def teile() -> Iterator[pd.DataFrame]:
+            for block in bloecke:
+                if abbruch.is_set():
+                    raise AufbauAbgebrochen()
+                yield teilsummen(block, self.katalog)
+
+        try:
+            tage = teilsummen_falten(teile())
+            with closing(sqlite3.connect(self.pfad)) as verbindung:
+                self._ersetzen(verbindung, tage)
+                # Abschlüsse seit dem Start aufaddieren; danach zählt 'abgeschlossen' wieder direkt
+                with self._sperre:
+                    for zeilen in self._nachtrag:
+                        self._summen_schreiben(teilsummen(zeilen, self.katalog), verbindung)
+                    self._aufgebaut_vermerken(verbindung)
+                    self._nachtrag = None
+        finally:
+            bloecke.close()
+            with self._sperre:
+                # Nach einem Abbruch bzw. Fehler bleibt der Aufbau ausstehend und wird beim nächsten Start wiederholt
+                self._nachtrag = None
+
+    def aufbau_abwarten(self) -> None:
+        """
+        Wartet auf einen laufenden Aufbau bzw. holt einen ausstehenden Aufbau nach, wenn keiner gestartet wurde.
+
+        Raises:
+            Exception: Der Fehler eines fehlgeschlagenen Aufbaus im Hintergrund.
+        """
+        if self._aufbau is not None:
+            self._aufbau.result()
+        elif not self.aufgebaut and self.speicher is not None:
+            self.aus_speicher_aufbauen(self.speicher)
+
+    def beenden(self) -> None:
+        """Bricht einen laufenden Aufbau ab und wartet darauf (beim Programmende); er wird beim nächsten Start wiederholt."""
+        if self._aufbau is not None and not self._aufbau.done():
+            self._abbruch.set()
+            try:
+                self._aufbau.result()
+            except AufbauAbgebrochen:
+                pass
+
+    def abgeschlossen(self, bestellungen: pd.DataFrame) -> None:
+        """
+        Addiert abgerechnete bzw. stornierte Zeilen auf die Tages- und Gesamtsummen (Ereignis des Bestellspeichers).
+
+        Die Funktion:
+        - Bepreist die Zeilen und fasst sie je Tag und Speise_ID zusammen (siehe 'teilsummen').
+        - Addiert die Summen per UPSERT in einer Transaktion auf.
+        - Sammelt die Zeilen, solange ein Aufbau im Hintergrund läuft (sie fehlen in dessen Stand der Historie).
+        - Zählt sonst nichts, solange der Aufbau aus der Historie aussteht (die Zeilen sind dort bereits enthalten).
+
+        Args:
+            bestellungen (pd.DataFrame): Zeilen mit Status 'geschlossen' oder 'storniert' und der übernommenen Menge.
+        """
+        if bestellungen.empty:
+            return
+        with self._sperre:
+            if self._nachtrag is not None:
+                self._nachtrag.append(bestellungen.copy())
+                return
+            if not self.aufgebaut:
+                return
+            self._summen_schreiben(teilsummen(bestellungen, self.katalog))
+
+    def _summen_schreiben(self, tage: pd.DataFrame, verbindung: sqlite3.Connection | None = None) -> None:
+        """Addiert Teilsummen je Tag und Speise_ID (Umsatz in Cent) per UPSERT in einer Transaktion auf Tages- und Gesamtsummen."""
+        if tage.empty:
+            return
+        tage = tage.assign(Kategorie=tage['Speise_ID'].map(kategorie_von))
+        gesamt = tage.groupby('Speise_ID', as_index=False).agg(
+            Speise=('Speise', 'last'), Kategorie=('Kategorie', 'last'), **{spalte: (spalte, 'sum') for spalte in SUMMEN_SPALTEN})
+
+        aufaddieren = ', '.join(f'{spalte} = {spalte} + excluded.{spalte}' for spalte in SUMMEN_SPALTEN)
+        verbindung = verbindung or self.verbindung
+        with verbindung:
+            verbindung.executemany(
+                f'INSERT INTO umsatz_tag VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) '
+                f'ON CONFLICT(Tag, Speise_ID) DO UPDATE SET Speise = excluded.Speise, {aufaddieren}',
+                self._parameter(tage, ['Tag', 'Speise_ID', 'Speise', 'Kategorie'] + SUMMEN_SPALTEN))
+            verbindung.executemany(
+                f'INSERT INTO umsatz_gesamt VALUES (?, ?, ?, ?, ?, ?, ?, ?) '
+                f'ON CONFLICT(Speise_ID) DO UPDATE SET Speise = excluded.Speise, {aufaddieren}',
+                self._parameter(gesamt, ['Speise_ID', 'Speise', 'Kategorie'] + SUMMEN_SPALTEN))
+
+    # Abfragen für den Finanzbericht
+    def summen(self, kategorie: str | None = None, von: date | None = None, bis: date | None = None) -> pd.DataFrame:
+        """
+        Gibt die Summen je Speise für den gesamten Zeitraum oder einen Datumsbereich zurück.
+
+        Die Funktion:
+        - Wartet auf einen laufenden Aufbau im Hintergrund bzw. holt einen ausstehenden Aufbau nach (siehe 'aufbau_abwarten').
+        - Liest über eine eigene Verbindung und kann daher auch aus einem Worker-Thread aufgerufen werden.
+        - Liest ohne Datumsbereich die Gesamtsummen (Laufzeit abhängig von der Größe der Karte, nicht der Historie).
+        - Sucht mit Datumsbereich den ersten Tag im nach Tag sortierten Primärschlüssel und liest nur die Tage bis 'bis'.
+
+        Args:
+            kategorie (str | None): Nur 'essen' oder 'getraenke'.
+            von (date | None): Erster Tag des Zeitraums (einschließlich).
+            bis (date | None): Letzter Tag des Zeitraums (einschließlich).
+
+        Returns:
+            pd.DataFrame: 'Speise_ID' als Index mit den Spalten Speise, Kategorie, Menge, Umsatz (in Euro), Anzahl,
+                Storno_Menge und Storno_Anzahl.
+        """
+        self.aufbau_abwarten()
+
+        bedingungen: list[str] = []
+        parameter: list = []
+        if kategorie is not None:
+            bedingungen.append('Kategorie = ?')
+            parameter.append(kategorie)
+
+        # Der Umsatz wird erst hier von ganzen Cent in Euro umgerechnet
+        def ausgabe(wert: str, spalte: str) -> str:
+            return f'{wert} / 100.0 AS Umsatz' if spalte == 'Umsatz_Cent' else f'{wert} AS {spalte}'
+
+        if von is None and bis is None:
+            summen = ', '.join(ausgabe(spalte, spalte) for spalte in SUMMEN_SPALTEN)
+            sql = f'SELECT Speise_ID, Speise, Kategorie, {summen} FROM umsatz_gesamt'
+            gruppierung = ''
+        else:
+            if von is not None:
+                bedingungen.append('Tag >= ?')
+                parameter.append(von.isoformat())
+            if bis is not None:
+                bedingungen.append('Tag <= ?')
+                parameter.append(bis.isoformat())
+            summen = ', '.join(ausgabe(f'SUM({spalte})', spalte) for spalte in SUMMEN_SPALTEN)
+            sql = f'SELECT Speise_ID, MAX(Speise) AS Speise, MAX(Kategorie) AS Kategorie, {summen} FROM umsatz_tag'
+            gruppierung = ' GROUP BY Speise_ID ORDER BY Speise_ID'
+
+        if bedingungen:
+            sql += ' WHERE ' + ' AND '.join(bedingungen)
+        with closing(sqlite3.connect(self.pfad)) as verbindung:
+            return pd.read_sql_query(sql + gruppierung, verbindung, params=tuple(parameter), index_col='Speise_ID')
+
+    def schliessen(self) -> None:
+        """Bricht einen laufenden Aufbau ab und schließt die Datenbankverbindung."""
+        self.beenden()
+        self.verbindung.close()
+
+    @staticmethod
+    def _parameter(df: pd.DataFrame, spalten: list[str]) -> list[tuple]:
+        """Wandelt die Spalten eines DataFrames in Parameter-Tupel mit Python-Typen für executemany um."""
+        return list(zip(*(df[spalte].tolist() for spalte in spalten)))